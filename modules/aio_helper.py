@@ -8,11 +8,21 @@ from adafruit_io.adafruit_io_errors import AdafruitIO_MQTTError
 import os
 import socketpool
 import ssl
-import wifi
+
+from retry_helper import RETRY, RetryPolicy
 
 __all__ = ["AioHelper"]
 
 LOOP_TIMEOUT = 2  # seconds
+CONNECT_DEADLINE = 30  # seconds
+# Refused or timed out connections and bad data from the loop are retried.
+# The radio is not reset, only wifi_helper can join the access point again.
+HANDLERS = (
+    (AdafruitIO_MQTTError, RETRY),
+    (MQTT.MMQTTException, RETRY),
+    (OSError, RETRY),
+    ((ValueError, RuntimeError), RETRY),
+)
 
 
 def connected(client):
@@ -50,6 +60,8 @@ class AioHelper:
     def __init__(
         self,
         pool: socketpool.SocketPool,
+        policy: RetryPolicy | None = None,
+        timer=None,
     ) -> None:
         """Class constructor.
 
@@ -57,7 +69,14 @@ class AioHelper:
         ----------
         pool : socketpool.SocketPool
             The connection for the MQTT client.
+        policy : RetryPolicy | None, optional
+            The retry policy for connecting, pass the one given to the wifi
+            helper to share its budget, by default a new one.
+        timer : WakeTimer | None, optional
+            Records the end of the connect and publish phases, by default
+            None.
         """
+        self.timer = timer
         temp_client = MQTT.MQTT(
             broker="io.adafruit.com",
             port=1883,
@@ -65,6 +84,8 @@ class AioHelper:
             password=os.getenv("ADAFRUIT_AIO_KEY"),
             socket_pool=pool,
             ssl_context=ssl.create_default_context(),
+            # The retry policy does the backing off.
+            connect_retries=1,
         )
 
         self.client = IO_MQTT(temp_client)
@@ -75,19 +96,23 @@ class AioHelper:
         self.client.on_unsubscribe = unsubscribe
         self.client.on_publish = publish
 
+        if policy is None:
+            policy = RetryPolicy()
         print("Connecting to Adafruit IO")
-        try:
-            self.client.connect()
-            try:
-                self.client.loop(LOOP_TIMEOUT)
-            except (ValueError, RuntimeError) as e:
-                print("Failed to get data, retrying\n", e)
-                wifi.reset()
-                self.client.reconnect()
-
-        except AdafruitIO_MQTTError as e:
-            print("Connection failed: \n", e)
+        if not policy.run("Adafruit IO", self._connect, HANDLERS, CONNECT_DEADLINE):
             self.client = None
+        elif self.timer is not None:
+            self.timer.mark("connect")
+
+    def _connect(self) -> None:
+        """Connect to Adafruit IO and wait for the acknowledgement."""
+        self.client.connect()
+        self.client.loop(LOOP_TIMEOUT)
+
+    def _mark_publish(self) -> None:
+        """Record the end of the publish phase if timing."""
+        if self.timer is not None:
+            self.timer.mark("publish")
 
     @property
     def is_connected(self):
@@ -117,6 +142,8 @@ class AioHelper:
             self.client.publish(feed_name, value)
         except Exception as e:
             print(f"Problem publishing: {e}")
+            return
+        self._mark_publish()
 
     def publish_multi(
         self, feeds_and_data: list[tuple[str, int | float | str]]
@@ -126,3 +153,5 @@ class AioHelper:
             self.client.publish_multiple(feeds_and_data=feeds_and_data)
         except Exception as e:
             print(f"Problem publishing: {e}")
+            return
+        self._mark_publish()
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import socketpool
+
+from async_mqtt import QUEUE_SIZE, AsyncMqttClient
+
+__all__ = ["AioSession"]
+
+AIO_BROKER = "io.adafruit.com"
+KEEP_ALIVE = 60  # seconds
+
+
+class AioSession:
+    def __init__(
+        self,
+        pool: socketpool.SocketPool,
+        keep_alive: int = KEEP_ALIVE,
+        queue_size: int = QUEUE_SIZE,
+    ) -> None:
+        """Class constructor.
+
+        The asyncio counterpart of AioHelper. Publishing only queues the
+        value, run the run coroutine as a task to send them.
+
+        Parameters
+        ----------
+        pool : `socketpool.SocketPool`
+            The connection for the MQTT client.
+        keep_alive : `int`, optional
+            The keep alive time (seconds) for the connection, by default 60
+        queue_size : `int`, optional
+            The most values waiting to be sent, by default 20
+        """
+        self.username = os.getenv("ADAFRUIT_AIO_USERNAME")
+        self.client = AsyncMqttClient(
+            pool,
+            AIO_BROKER,
+            username=self.username,
+            password=os.getenv("ADAFRUIT_AIO_KEY"),
+            keep_alive=keep_alive,
+            queue_size=queue_size,
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        """Flag to see if the session is connected.
+
+        Returns
+        -------
+        `bool`
+            True if connected to Adafruit IO, False otherwise.
+        """
+        return self.client.connected.is_set()
+
+    def publish(self, feed_name: str, value: int | float | str) -> None:
+        """Queue a value for the given feed.
+
+        Parameters
+        ----------
+        feed_name : `str`
+            Feed name
+        value : `int` | `float` | `str`
+            Value to publish to feed
+        """
+        if value is None:
+            return
+        print(feed_name, value)
+        self.client.publish(f"{self.username}/feeds/{feed_name}", str(value))
+
+    def publish_multi(
+        self, feeds_and_data: list[tuple[str, int | float | str]]
+    ) -> None:
+        """Queue multiple values for feeds.
+
+        Parameters
+        ----------
+        feeds_and_data : `list[tuple[str, int | float | str]]`
+            The feed names and values to publish.
+        """
+        for feed_name, value in feeds_and_data:
+            self.publish(feed_name, value)
+
+    async def run(self) -> None:
+        """Keep the session connected and send the queued values."""
+        await self.client.run()
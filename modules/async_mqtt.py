@@ -0,0 +1,401 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import errno
+import random
+import socketpool
+import time
+
+from retry_helper import backoff
+
+__all__ = ["AsyncMqttClient"]
+
+# MQTT 3.1.1 packet types
+CONNECT = 0x10
+CONNACK = 0x20
+PUBLISH = 0x30
+PUBACK = 0x40
+PINGREQ = 0xC0
+PINGRESP = 0xD0
+DISCONNECT = 0xE0
+
+CONNECT_TIMEOUT = 5  # seconds
+RESPONSE_TIMEOUT = 10  # seconds
+POLL_INTERVAL = 0.01  # seconds
+MIN_BACKOFF = 1  # seconds
+MAX_BACKOFF = 5 * 60  # seconds
+QUEUE_SIZE = 20
+NS_PER_SECOND = 1000000000
+WOULD_BLOCK = (errno.EAGAIN, errno.ETIMEDOUT)
+
+
+def _string(text: str) -> bytes:
+    """Encode a length prefixed MQTT string.
+
+    Parameters
+    ----------
+    text : `str`
+        The text to encode.
+
+    Returns
+    -------
+    `bytes`
+        The encoded string.
+    """
+    data = text.encode()
+    return bytes((len(data) >> 8, len(data) & 0xFF)) + data
+
+
+def _header(packet_type: int, length: int) -> bytes:
+    """Create the fixed header of a MQTT packet.
+
+    Parameters
+    ----------
+    packet_type : `int`
+        The packet type and flags.
+    length : `int`
+        The length of the rest of the packet.
+
+    Returns
+    -------
+    `bytes`
+        The fixed header.
+    """
+    header = bytearray((packet_type,))
+    while True:
+        byte = length & 0x7F
+        length >>= 7
+        if length:
+            header.append(byte | 0x80)
+        else:
+            header.append(byte)
+            return bytes(header)
+
+
+def _deadline(timeout: float) -> int:
+    """Get the monotonic time (nanoseconds) a timeout ends at.
+
+    Parameters
+    ----------
+    timeout : `float`
+        The timeout (seconds).
+
+    Returns
+    -------
+    `int`
+        The deadline.
+    """
+    return time.monotonic_ns() + int(timeout * NS_PER_SECOND)
+
+
+class AsyncMqttClient:
+    def __init__(
+        self,
+        pool: socketpool.SocketPool,
+        broker: str,
+        port: int = 1883,
+        client_id: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        keep_alive: int = 60,
+        queue_size: int = QUEUE_SIZE,
+        max_backoff: float = MAX_BACKOFF,
+    ) -> None:
+        """Class constructor.
+
+        A publish only client that never blocks the event loop on the
+        broker. Messages go into a bounded queue that the run coroutine
+        sends over a non-blocking socket. Only resolving the broker and the
+        TCP connect block, for at most the connect timeout.
+
+        Parameters
+        ----------
+        pool : `socketpool.SocketPool`
+            The connection for the client.
+        broker : `str`
+            The broker host name.
+        port : `int`, optional
+            The broker port, by default 1883
+        client_id : `str`, optional
+            The client identifier, by default a random one.
+        username : `str`, optional
+            The broker user name, by default None
+        password : `str`, optional
+            The broker password, by default None
+        keep_alive : `int`, optional
+            The keep alive time (seconds) for the connection, by default 60
+        queue_size : `int`, optional
+            The most messages waiting to be sent, the oldest is dropped
+            when full, by default 20
+        max_backoff : `float`, optional
+            The longest delay (seconds) between reconnect tries, by
+            default 300
+        """
+        self.pool = pool
+        self.broker = broker
+        self.port = port
+        if client_id is None:
+            client_id = f"cpy{random.randint(0, 1000000)}"
+        self.client_id = client_id
+        self.username = username
+        self.password = password
+        self.keep_alive = keep_alive
+        self.queue_size = queue_size
+        self.max_backoff = max_backoff
+        self.address = None
+        self.sock = None
+        self.queue = []
+        self.pending = asyncio.Event()
+        self.connected = asyncio.Event()
+        self.packet_id = 0
+        self.last_sent = 0
+
+    def _close(self) -> None:
+        """Close the socket and mark the client disconnected."""
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+        self.sock = None
+        self.connected.clear()
+
+    async def _connect(self) -> None:
+        """Connect to the broker, backing off between failed tries."""
+        attempt = 0
+        while True:
+            print("Connecting to MQTT broker")
+            try:
+                await self._open()
+                print("Connected to MQTT broker")
+                return
+            except (OSError, RuntimeError) as e:
+                self._close()
+                # Resolve the broker again in case it moved.
+                self.address = None
+                delay = backoff(attempt, MIN_BACKOFF, self.max_backoff)
+                print(f"Connection failed, retrying in {delay:.1f} seconds: {e}")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _expect(self, packet_type: int) -> bytearray:
+        """Read packets until one of the given type arrives.
+
+        Parameters
+        ----------
+        packet_type : `int`
+            The packet type to wait for.
+
+        Returns
+        -------
+        `bytearray`
+            The body of the packet.
+        """
+        while True:
+            received_type, body = await self._read_packet()
+            # Nothing is subscribed, so anything else is ignored.
+            if received_type == packet_type:
+                return body
+
+    async def _open(self) -> None:
+        """Open the socket and send the MQTT CONNECT."""
+        if self.address is None:
+            self.address = self.pool.getaddrinfo(self.broker, self.port)[0][-1]
+        self.sock = self.pool.socket(self.pool.AF_INET, self.pool.SOCK_STREAM)
+        self.sock.settimeout(CONNECT_TIMEOUT)
+        self.sock.connect(self.address)
+        self.sock.setblocking(False)
+
+        flags = 0x02  # clean session
+        payload = _string(self.client_id)
+        if self.username is not None:
+            flags |= 0x80
+            payload += _string(self.username)
+        if self.password is not None:
+            flags |= 0x40
+            payload += _string(self.password)
+        body = (
+            _string("MQTT")
+            + bytes((4, flags, self.keep_alive >> 8, self.keep_alive & 0xFF))
+            + payload
+        )
+        await self._send(_header(CONNECT, len(body)) + body)
+        ack = await self._expect(CONNACK)
+        if ack[1]:
+            raise RuntimeError(f"Connection refused with code {ack[1]}")
+        self.connected.set()
+
+    async def _publish(self, topic: str, payload: bytes, qos: int) -> None:
+        """Send a PUBLISH and wait for the PUBACK if needed.
+
+        Parameters
+        ----------
+        topic : `str`
+            The topic to publish to.
+        payload : `bytes`
+            The message.
+        qos : `int`
+            The MQTT quality of service level, 0 or 1.
+        """
+        body = _string(topic)
+        if qos:
+            self.packet_id = self.packet_id % 0xFFFF + 1
+            body += bytes((self.packet_id >> 8, self.packet_id & 0xFF))
+        await self._send(_header(PUBLISH | qos << 1, len(body) + len(payload)) + body)
+        await self._send(payload)
+        if qos:
+            while True:
+                ack = await self._expect(PUBACK)
+                if ack[0] << 8 | ack[1] == self.packet_id:
+                    break
+        print(f"Data published: {topic}")
+
+    async def _read_packet(self) -> tuple[int, bytearray]:
+        """Read a packet from the broker.
+
+        Returns
+        -------
+        packet_type : `int`
+            The type of the packet.
+        body : `bytearray`
+            The rest of the packet after the fixed header.
+        """
+        deadline = _deadline(RESPONSE_TIMEOUT)
+        packet_type = (await self._recv(1, deadline))[0] & 0xF0
+        length = 0
+        shift = 0
+        while True:
+            byte = (await self._recv(1, deadline))[0]
+            length |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                break
+            shift += 7
+        return packet_type, await self._recv(length, deadline)
+
+    async def _recv(self, size: int, deadline: int) -> bytearray:
+        """Receive bytes, yielding to other tasks while waiting.
+
+        Parameters
+        ----------
+        size : `int`
+            The number of bytes to receive.
+        deadline : `int`
+            The monotonic time (nanoseconds) to give up at.
+
+        Returns
+        -------
+        `bytearray`
+            The received bytes.
+        """
+        data = bytearray(size)
+        view = memoryview(data)
+        received = 0
+        while received < size:
+            try:
+                count = self.sock.recv_into(view[received:], size - received)
+            except OSError as e:
+                if e.errno not in WOULD_BLOCK:
+                    raise
+                count = None
+            if count == 0:
+                raise OSError(errno.ECONNRESET)
+            if count:
+                received += count
+                continue
+            if time.monotonic_ns() > deadline:
+                raise OSError(errno.ETIMEDOUT)
+            await asyncio.sleep(POLL_INTERVAL)
+        return data
+
+    async def _send(self, data: bytes) -> None:
+        """Send bytes, yielding to other tasks while the socket is busy.
+
+        Parameters
+        ----------
+        data : `bytes`
+            The bytes to send.
+        """
+        deadline = _deadline(RESPONSE_TIMEOUT)
+        view = memoryview(data)
+        while len(view):
+            try:
+                sent = self.sock.send(view)
+            except OSError as e:
+                if e.errno not in WOULD_BLOCK:
+                    raise
+                sent = 0
+            if sent:
+                view = view[sent:]
+                continue
+            if time.monotonic_ns() > deadline:
+                raise OSError(errno.ETIMEDOUT)
+            await asyncio.sleep(POLL_INTERVAL)
+        self.last_sent = time.monotonic_ns()
+
+    async def disconnect(self) -> None:
+        """Send the MQTT DISCONNECT and close the connection."""
+        if self.connected.is_set():
+            try:
+                await self._send(_header(DISCONNECT, 0))
+            except OSError:
+                pass
+        self._close()
+
+    def publish(self, topic: str, payload: bytes | str, qos: int = 0) -> bool:
+        """Queue a message for the run coroutine to send.
+
+        Parameters
+        ----------
+        topic : `str`
+            The topic to publish to.
+        payload : `bytes` | `str`
+            The message.
+        qos : `int`, optional
+            The MQTT quality of service level, 0 or 1, by default 0
+
+        Returns
+        -------
+        `bool`
+            False if the queue was full and the oldest message was dropped.
+        """
+        if isinstance(payload, str):
+            payload = payload.encode()
+        full = len(self.queue) >= self.queue_size
+        if full:
+            dropped_topic = self.queue.pop(0)[0]
+            print(f"Publish queue full, dropped message for {dropped_topic}")
+        self.queue.append((topic, payload, qos))
+        self.pending.set()
+        return not full
+
+    async def run(self) -> None:
+        """Keep the client connected and send the queued messages."""
+        ping_interval = self.keep_alive // 2
+        while True:
+            if not self.connected.is_set():
+                await self._connect()
+            # Cleared first so a publish during the sends below is not missed.
+            self.pending.clear()
+            message = None
+            try:
+                while self.queue:
+                    message = self.queue.pop(0)
+                    await self._publish(*message)
+                    message = None
+                idle = (time.monotonic_ns() - self.last_sent) // NS_PER_SECOND
+                if idle >= ping_interval:
+                    await self._send(_header(PINGREQ, 0))
+                    await self._expect(PINGRESP)
+            except (OSError, RuntimeError) as e:
+                print(f"MQTT connection lost: {e}")
+                self._close()
+                # Put the unsent message back to go out after reconnecting.
+                if message is not None and len(self.queue) < self.queue_size:
+                    self.queue.insert(0, message)
+                continue
+            try:
+                await asyncio.wait_for(self.pending.wait(), ping_interval)
+            except asyncio.TimeoutError:
+                pass
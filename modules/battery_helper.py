@@ -9,7 +9,7 @@ from adafruit_max1704x import MAX17048
 
 
 class BatteryHelper:
-    def __init__(self, i2c) -> None:
+    def __init__(self, i2c, timer=None) -> None:
         """Class constructor.
 
         Use an environment variable called BATTERY_SIZE to use the LC709203F
@@ -19,7 +19,10 @@ class BatteryHelper:
         ----------
         i2c : _type_
             Instance of the board I2C system
+        timer : `WakeTimer`, optional
+            Records the end of each battery measurement, by default None
         """
+        self.timer = timer
         self.pack_size = os.getenv("BATTERY_SIZE")
         if self.pack_size is not None:
             self.lc_monitor = True
@@ -52,4 +55,6 @@ class BatteryHelper:
         except OSError as e:
             print(f"Battery monitor not available!: {e}")
 
+        if self.timer is not None:
+            self.timer.mark("battery")
         return (percent, voltage, temperature)
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import keypad
+import microcontroller
+
+__all__ = ["ButtonEvents"]
+
+POLL_INTERVAL = 0.05  # seconds
+
+
+class ButtonEvents:
+    def __init__(
+        self,
+        pins: tuple[microcontroller.Pin, ...],
+        value_when_pressed: bool = True,
+        poll_interval: float = POLL_INTERVAL,
+    ) -> None:
+        """Class constructor.
+
+        The buttons are scanned and debounced in the background by keypad,
+        which queues the transitions. Use the object in an async for loop to
+        get the number of each button pressed, in the order of the pins.
+
+        Parameters
+        ----------
+        pins : `tuple[microcontroller.Pin, ...]`
+            The pins the buttons are attached to.
+        value_when_pressed : `bool`, optional
+            The pin value when a button is pressed, by default True
+        poll_interval : `float`, optional
+            The time (seconds) to sleep when no press is queued, by
+            default 0.05
+        """
+        self.keys = keypad.Keys(pins, value_when_pressed=value_when_pressed)
+        self.poll_interval = poll_interval
+        # Reused for every event to keep the loop from allocating.
+        self.event = keypad.Event()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> int:
+        """Wait for the next button press.
+
+        Returns
+        -------
+        `int`
+            The number of the pressed button.
+        """
+        while True:
+            while self.keys.events.get_into(self.event):
+                if self.event.pressed:
+                    return self.event.key_number
+            await asyncio.sleep(self.poll_interval)
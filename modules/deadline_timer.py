@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import time
+
+__all__ = ["DeadlineTimer"]
+
+NS_PER_SECOND = 1000000000
+
+
+class DeadlineTimer:
+    def __init__(self) -> None:
+        """Class constructor.
+
+        A timer that can be started, restarted and cancelled from any task
+        while another task waits on it. The waiting task only wakes up when
+        the deadline passes or the timer is changed.
+        """
+        self.deadline = None
+        self.changed = asyncio.Event()
+
+    @property
+    def active(self) -> bool:
+        """Flag to see if the timer is running.
+
+        Returns
+        -------
+        `bool`
+            True if a deadline is set, False otherwise.
+        """
+        return self.deadline is not None
+
+    def cancel(self) -> None:
+        """Stop the timer, the waiting task keeps waiting for a start."""
+        self.deadline = None
+        self.changed.set()
+
+    def remaining(self) -> float | None:
+        """Get the time left on the timer.
+
+        Returns
+        -------
+        `float` | None
+            The time (seconds) to the deadline, None if not running.
+        """
+        if self.deadline is None:
+            return None
+        return (self.deadline - time.monotonic_ns()) / NS_PER_SECOND
+
+    def start(self, delay: float) -> None:
+        """Start or restart the timer.
+
+        Parameters
+        ----------
+        delay : `float`
+            The time (seconds) from now to the deadline. A negative delay
+            expires right away.
+        """
+        self.deadline = time.monotonic_ns() + int(max(delay, 0) * NS_PER_SECOND)
+        self.changed.set()
+
+    async def wait(self) -> None:
+        """Wait until the timer expires."""
+        while True:
+            self.changed.clear()
+            remaining = self.remaining()
+            if remaining is None:
+                await self.changed.wait()
+                continue
+            if remaining <= 0:
+                self.deadline = None
+                return
+            try:
+                await asyncio.wait_for(self.changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import displayio
+
+__all__ = ["DisplayView"]
+
+
+class DisplayView:
+    def __init__(self, display) -> None:
+        """Class constructor.
+
+        Holds the items of a screen by name. Setting the text of a label
+        only touches the label when the text is different, and the display
+        is redrawn once for all the changes when refresh is called, so
+        automatic refreshing is turned off.
+
+        Parameters
+        ----------
+        display : `busdisplay.BusDisplay`
+            The display to draw on.
+        """
+        self.display = display
+        self.display.auto_refresh = False
+        self.group = displayio.Group()
+        self.items = {}
+        self.texts = {}
+        self.dirty = False
+
+    def __getitem__(self, name: str):
+        return self.items[name]
+
+    @property
+    def is_shown(self) -> bool:
+        """Flag to see if the view is on the display.
+
+        Returns
+        -------
+        `bool`
+            True if the view is the root group, False otherwise.
+        """
+        return self.display.root_group is self.group
+
+    def add(self, name: str, item):
+        """Add an item to the end of the view.
+
+        Parameters
+        ----------
+        name : `str`
+            The name to refer to the item by.
+        item : `displayio.TileGrid` | `bitmap_label.Label`
+            The label or other item to show.
+
+        Returns
+        -------
+        `displayio.TileGrid` | `bitmap_label.Label`
+            The added item.
+        """
+        self.group.append(item)
+        self.items[name] = item
+        if hasattr(item, "text"):
+            self.texts[name] = item.text
+        self.dirty = True
+        return item
+
+    def hide(self) -> None:
+        """Take the view off the display."""
+        if self.is_shown:
+            self.display.root_group = None
+            self.display.refresh()
+
+    def refresh(self) -> bool:
+        """Redraw the display if anything changed while it is shown.
+
+        Returns
+        -------
+        `bool`
+            True if the display was redrawn, False otherwise.
+        """
+        if not self.dirty or not self.is_shown:
+            return False
+        self.display.refresh()
+        self.dirty = False
+        return True
+
+    def set_text(self, name: str, text: str) -> bool:
+        """Change the text of a label.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the label.
+        text : `str`
+            The new text.
+
+        Returns
+        -------
+        `bool`
+            True if the text was different, False otherwise.
+        """
+        if self.texts[name] == text:
+            return False
+        self.items[name].text = text
+        self.texts[name] = text
+        self.dirty = True
+        return True
+
+    def show(self) -> None:
+        """Put the view on the display and draw it."""
+        if not self.is_shown:
+            self.display.root_group = self.group
+            self.dirty = True
+        self.refresh()
+
+    def update(self, **texts: str) -> bool:
+        """Change the text of several labels and redraw once.
+
+        Parameters
+        ----------
+        **texts : `str`
+            The new text for each label by name.
+
+        Returns
+        -------
+        `bool`
+            True if the display was redrawn, False otherwise.
+        """
+        for name, text in texts.items():
+            self.set_text(name, text)
+        return self.refresh()
@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import time
+
+__all__ = ["EventScheduler"]
+
+MAX_SLEEP = 10 * 60  # seconds
+
+
+class EventScheduler:
+    def __init__(self, clock=None, max_sleep: float = MAX_SLEEP) -> None:
+        """Class constructor.
+
+        Events run at absolute UTC times. The scheduler sleeps until the
+        next event, but never longer than the maximum sleep, so changes to
+        the clock from an NTP sync or drift of the sleep timer are picked up
+        in time.
+
+        Events that are overdue all run at once in time order. When several
+        overdue events share a group only the latest of them runs, so
+        booting after the lamp off time does not switch the lamp on first.
+
+        Parameters
+        ----------
+        clock : `Callable[[], float]`, optional
+            The source of the current UTC time (seconds), by default
+            time.time. Pass a fake clock to test the scheduler on a host.
+        max_sleep : `float`, optional
+            The longest time (seconds) between checks of the clock, by
+            default 600
+        """
+        self.clock = time.time if clock is None else clock
+        self.max_sleep = max_sleep
+        # Sorted by deadline then order of scheduling: [deadline, seq, name,
+        # group, action]
+        self.events = []
+        self.sequence = 0
+        self.changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def _insert(self, name: str, deadline: float, action, group: str | None) -> None:
+        """Add an event to the queue, replacing one with the same name.
+
+        Parameters
+        ----------
+        name : `str`
+            The unique name of the event.
+        deadline : `float`
+            The UTC time (seconds) to run the event at.
+        action : `Callable[[], None]`
+            The function to run.
+        group : `str` | None
+            The group the event belongs to.
+        """
+        self.events = [event for event in self.events if event[2] != name]
+        self.sequence += 1
+        event = [deadline, self.sequence, name, group, action]
+        index = len(self.events)
+        while index and self.events[index - 1][:2] > event[:2]:
+            index -= 1
+        self.events.insert(index, event)
+
+    def cancel(self, name: str) -> None:
+        """Remove a pending event.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the event.
+        """
+        self.events = [event for event in self.events if event[2] != name]
+        self.changed.set()
+
+    def next_deadline(self) -> float | None:
+        """Get the time of the next event.
+
+        Returns
+        -------
+        `float` | None
+            The UTC time (seconds) of the next event, None if none pending.
+        """
+        return self.events[0][0] if self.events else None
+
+    def pop_due(self, now: float) -> list[tuple[str, object]]:
+        """Remove the events that are due.
+
+        Parameters
+        ----------
+        now : `float`
+            The current UTC time (seconds).
+
+        Returns
+        -------
+        `list[tuple[str, Callable[[], None]]]`
+            The names and actions of the events to run in order.
+        """
+        count = 0
+        while count < len(self.events) and self.events[count][0] <= now:
+            count += 1
+        due = self.events[:count]
+        self.events = self.events[count:]
+
+        latest = {}
+        for event in due:
+            if event[3] is not None:
+                latest[event[3]] = event[1]
+        return [
+            (event[2], event[4])
+            for event in due
+            if event[3] is None or latest[event[3]] == event[1]
+        ]
+
+    def schedule(
+        self, name: str, deadline: float, action, group: str | None = None
+    ) -> None:
+        """Add an event, replacing a pending one with the same name.
+
+        Parameters
+        ----------
+        name : `str`
+            The unique name of the event.
+        deadline : `float`
+            The UTC time (seconds) to run the event at.
+        action : `Callable[[], None]`
+            The function to run.
+        group : `str`, optional
+            The group the event belongs to, by default None
+        """
+        self._insert(name, deadline, action, group)
+        self.changed.set()
+
+    def update(self, events: list[tuple]) -> None:
+        """Replace several events at once.
+
+        No event runs part way through the update, so the queue never
+        holds a mix of old and new times.
+
+        Parameters
+        ----------
+        events : `list[tuple]`
+            The name, deadline, action and optional group of each event.
+        """
+        for name, deadline, action, *group in events:
+            self._insert(name, deadline, action, group[0] if group else None)
+        self.changed.set()
+
+    async def run(self) -> None:
+        """Run the events as they become due."""
+        while True:
+            self.changed.clear()
+            now = self.clock()
+            for name, action in self.pop_due(now):
+                print(f"Running {name} at {now:.0f}")
+                action()
+
+            delay = self.max_sleep
+            deadline = self.next_deadline()
+            if deadline is not None:
+                delay = min(max(deadline - self.clock(), 0), self.max_sleep)
+            try:
+                await asyncio.wait_for(self.changed.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,270 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import math
+import time
+
+__all__ = ["Fields", "LineBatch", "LineEncoder"]
+
+TIME_IN_NS = 1000000000
+
+MEASUREMENT_SPECIAL = ", "
+TAG_SPECIAL = ",= "
+STRING_SPECIAL = '\\"'
+BUFFER_SIZE = 512  # bytes
+
+
+def _escape(text: str, special: str) -> str:
+    """Escape the line protocol special characters in text.
+
+    Parameters
+    ----------
+    text : `str`
+        The text to escape.
+    special : `str`
+        The characters that need a backslash.
+
+    Returns
+    -------
+    `str`
+        The escaped text, the same object if nothing needed escaping.
+    """
+    for char in special:
+        if char in text:
+            text = text.replace(char, "\\" + char)
+    return text
+
+
+class Fields:
+    def __init__(self, **kwargs):
+        """Class constructor.
+
+        Fields with a None value are left out of the published line.
+        """
+        self.values = kwargs
+
+
+class LineEncoder:
+    def __init__(
+        self,
+        default_tags: list[str] | None = None,
+        integers: bool = False,
+        size: int = BUFFER_SIZE,
+    ) -> None:
+        """Class constructor.
+
+        Lines are written into one reusable buffer. The escaped measurement,
+        tag and field key bytes are cached, so a loop publishing the same
+        measurements only allocates for the values.
+
+        Parameters
+        ----------
+        default_tags : `list[str]`, optional
+            Tags, as key=value, added to every line, by default None
+        integers : `bool`, optional
+            Write int values with the i suffix, by default False which sends
+            them as floats to match existing series.
+        size : `int`, optional
+            The starting size of the buffer, by default 512
+        """
+        self.buffer = bytearray(size)
+        self.length = 0
+        self.integers = integers
+        self.measurements = {}
+        self.tags = {}
+        self.keys = {}
+        self.default_tags = default_tags if default_tags is not None else []
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _measurement(self, text: str) -> bytes:
+        """Get the cached, escaped measurement.
+
+        Parameters
+        ----------
+        text : `str`
+            The measurement.
+
+        Returns
+        -------
+        `bytes`
+            The escaped measurement.
+        """
+        data = self.measurements.get(text)
+        if data is None:
+            data = _escape(text, MEASUREMENT_SPECIAL).encode()
+            self.measurements[text] = data
+        return data
+
+    def _tag(self, text: str) -> bytes:
+        """Get the cached, escaped tag.
+
+        Parameters
+        ----------
+        text : `str`
+            The tag as key=value.
+
+        Returns
+        -------
+        `bytes`
+            The escaped tag with the leading comma.
+        """
+        data = self.tags.get(text)
+        if data is None:
+            key, _, value = text.partition("=")
+            tag = _escape(key, TAG_SPECIAL) + "=" + _escape(value, TAG_SPECIAL)
+            data = b"," + tag.encode()
+            self.tags[text] = data
+        return data
+
+    def _value(self, value) -> bytes | None:
+        """Encode a field value.
+
+        Parameters
+        ----------
+        value : `bool` | `int` | `float` | `str`
+            The field value.
+
+        Returns
+        -------
+        `bytes` | None
+            The encoded value, None if it cannot be written.
+        """
+        if isinstance(value, bool):
+            return b"true" if value else b"false"
+        if isinstance(value, int):
+            if self.integers:
+                return str(value).encode() + b"i"
+            return str(value).encode()
+        if isinstance(value, float):
+            # NaN and infinity are not valid in line protocol.
+            if math.isnan(value) or math.isinf(value):
+                return None
+            return str(value).encode()
+        return b'"' + _escape(str(value), STRING_SPECIAL).encode() + b'"'
+
+    def _write(self, data: bytes) -> None:
+        """Append bytes to the buffer, growing it if needed.
+
+        Parameters
+        ----------
+        data : `bytes`
+            The bytes to append.
+        """
+        end = self.length + len(data)
+        if end > len(self.buffer):
+            self.buffer.extend(bytearray(max(len(data), len(self.buffer))))
+        self.buffer[self.length : end] = data
+        self.length = end
+
+    def payload(self) -> memoryview:
+        """Get the encoded lines without copying them.
+
+        Returns
+        -------
+        `memoryview`
+            The lines written since the last reset. The view is only valid
+            until reset, copy it with bytes() to keep it longer.
+        """
+        return memoryview(self.buffer)[: self.length]
+
+    def reset(self) -> None:
+        """Start a new payload, keeping the buffer."""
+        self.length = 0
+
+    def write_line(
+        self, measurements_and_tags: list[str], fields: Fields, timestamp: bytes
+    ) -> None:
+        """Encode a measurement as a line protocol line.
+
+        The arguments are not modified. A measurement without any values to
+        write is left out.
+
+        Parameters
+        ----------
+        measurements_and_tags : `list[str]`
+            The measurement followed by tags as key=value.
+        fields : `Fields`
+            The values for the measurement.
+        timestamp : `bytes`
+            The time (nanoseconds) of the measurement.
+        """
+        start = self.length
+        if start:
+            self._write(b"\n")
+        self._write(self._measurement(measurements_and_tags[0]))
+        for index in range(1, len(measurements_and_tags)):
+            self._write(self._tag(measurements_and_tags[index]))
+        for text in self.default_tags:
+            self._write(self._tag(text))
+
+        separator = b" "
+        for key, value in fields.values.items():
+            if value is None:
+                continue
+            data = self._value(value)
+            if data is None:
+                continue
+            key_data = self.keys.get(key)
+            if key_data is None:
+                key_data = (_escape(key, TAG_SPECIAL) + "=").encode()
+                self.keys[key] = key_data
+            self._write(separator)
+            self._write(key_data)
+            self._write(data)
+            separator = b","
+
+        if separator == b" ":
+            self.length = start
+            return
+        self._write(b" ")
+        self._write(timestamp)
+
+
+class LineBatch:
+    def __init__(self, sensor_name: str) -> None:
+        """Class constructor.
+
+        Collects measurements for a sensor as line protocol lines sent
+        together by the subclass.
+
+        Parameters
+        ----------
+        sensor_name : `str`
+            The identifier for the sensor, added as the sensor_id tag.
+        """
+        self.sensor_name = sensor_name
+        self.timestamp = None
+        self.timestamp_bytes = None
+        self.encoder = LineEncoder([f"sensor_id={sensor_name}"])
+
+    def add(
+        self,
+        measurements_and_tags: list[str],
+        fields: Fields,
+        timestamp: int | None = None,
+    ) -> None:
+        """Add a measurement to the batch sent by the next flush.
+
+        Parameters
+        ----------
+        measurements_and_tags : `list[str]`
+            The measurement to publish.
+        fields : `Fields`
+            The values to publish for the measurement.
+        timestamp : `int`, optional
+            The time (nanoseconds) of the measurement, by default the time
+            set by mark_time.
+        """
+        if timestamp is None:
+            timestamp_bytes = self.timestamp_bytes
+        else:
+            timestamp_bytes = str(timestamp).encode()
+        self.encoder.write_line(measurements_and_tags, fields, timestamp_bytes)
+
+    def mark_time(self) -> None:
+        """Set the timestamp."""
+        self.timestamp = time.time() * TIME_IN_NS
+        self.timestamp_bytes = str(int(self.timestamp)).encode()
@@ -5,34 +5,20 @@
 import adafruit_minimqtt.adafruit_minimqtt as MQTT
 import os
 import socketpool
-import time
-import wifi
 
+from line_protocol import Fields, LineBatch
+from retry_helper import RETRY, RetryPolicy
 
 MQTT_CLIENT_API = "sensors/data"
-TIME_IN_NS = 1000000000
 LOOP_TIMEOUT = 2  # seconds
-
-
-class Fields:
-    def __init__(self, **kwargs):
-        """Class constructor."""
-        self.values = dict(**kwargs)
-
-    def __str__(self):
-        """Convert content to string removing None parameters.
-
-        Returns
-        -------
-        `str`
-            Stringified representation.
-        """
-        temp = []
-        for k, v in self.values.items():
-            if v is None:
-                continue
-            temp.append(f"{k}={v}")
-        return ",".join(temp)
+CONNECT_DEADLINE = 30  # seconds
+# Refused or timed out connections and bad data from the loop are retried.
+# The radio is not reset, only wifi_helper can join the access point again.
+HANDLERS = (
+    (MQTT.MMQTTException, RETRY),
+    (OSError, RETRY),
+    ((ValueError, RuntimeError), RETRY),
+)
 
 
 def on_connect(client, userdata, flags, rc):
@@ -47,12 +33,14 @@ def on_disconnect(client, userdata, rc):
     print("Disconnected from MQTT Broker!")
 
 
-class MqttHelper:
+class MqttHelper(LineBatch):
     def __init__(
         self,
         sensor_name: str,
         pool: socketpool.SocketPool,
         connection_timeout: int = 10,
+        policy: RetryPolicy | None = None,
+        timer=None,
     ) -> None:
         """Class constructor.
 
@@ -64,8 +52,15 @@ class MqttHelper:
             The connection for the MQTT client.
         connection_timeout : `int`, optional
             The timeout for the client connection, by default 10
+        policy : `RetryPolicy`, optional
+            The retry policy for connecting, pass the one given to the wifi
+            helper to share its budget, by default a new one.
+        timer : `WakeTimer`, optional
+            Records the end of the connect and publish phases, by default
+            None
         """
-        self.sensor_name = sensor_name
+        super().__init__(sensor_name)
+        self.timer = timer
         self.connection_timeout = connection_timeout
         self.client = MQTT.MQTT(
             broker=os.getenv("MQTT_BROKER"),
@@ -74,50 +69,85 @@ class MqttHelper:
             client_id=sensor_name,
             socket_pool=pool,
             is_ssl=False,
+            # The retry policy does the backing off.
+            connect_retries=1,
         )
-        self.timestamp = None
 
         self.client.on_connect = on_connect
         self.client.on_publish = on_publish
         self.client.on_disconnect = on_disconnect
 
+        if policy is None:
+            policy = RetryPolicy()
         print("Connecting to MQTT broker")
-        try:
-            self.client.connect(keep_alive=self.connection_timeout)
+        if not policy.run("MQTT", self._connect, HANDLERS, CONNECT_DEADLINE):
+            self.client = None
+        elif self.timer is not None:
+            self.timer.mark("connect")
 
-            try:
-                self.client.loop(LOOP_TIMEOUT)
-            except (ValueError, RuntimeError) as e:
-                print("Failed to get data, retrying\n", e)
-                wifi.reset()
-                self.client.reconnect()
+    def _connect(self) -> None:
+        """Connect to the broker and wait for the acknowledgement."""
+        self.client.connect(keep_alive=self.connection_timeout)
+        self.client.loop(LOOP_TIMEOUT)
 
-        except MQTT.MMQTTException as e:
-            print("Connection failed: \n", e)
-            self.client = None
+    def _send(self, payload: bytes, qos: int) -> bool:
+        """Publish a payload to the MQTT client.
+
+        Parameters
+        ----------
+        payload : `bytes`
+            The line protocol lines to publish.
+        qos : `int`
+            The MQTT quality of service level.
+
+        Returns
+        -------
+        `bool`
+            True if the payload was sent, False otherwise.
+        """
+        try:
+            self.client.publish(MQTT_CLIENT_API, payload, qos=qos)
+        except Exception as e:
+            print(f"Problem publishing: {e}")
+            return False
+        if self.timer is not None:
+            self.timer.mark("publish")
+        return True
+
+    def flush(self, qos: int = 0) -> bool:
+        """Publish all batched measurements in one message.
 
-    def mark_time(self) -> None:
-        """Set the timestamp."""
-        self.timestamp = time.time() * TIME_IN_NS
+        Parameters
+        ----------
+        qos : `int`, optional
+            The MQTT quality of service level, by default 0 which sends
+            without waiting for the broker to acknowledge.
 
-    def publish(self, measurements_and_tags: str, fields: Fields) -> None:
+        Returns
+        -------
+        `bool`
+            True if the batch was sent, False otherwise.
+        """
+        if not self.encoder:
+            return True
+        # minimqtt only publishes bytes, so this is the one copy of the batch.
+        payload = bytes(self.encoder.payload())
+        self.encoder.reset()
+        return self._send(payload, qos)
+
+    def publish(
+        self, measurements_and_tags: list[str], fields: Fields, qos: int = 0
+    ) -> None:
         """Write the information to MQTT client.
 
         Parameters
         ----------
-        measurements_and_tags : `str`
+        measurements_and_tags : `list[str]`
             The measurement to publish.
         fields : `Fields`
             The values to publish for the measurement.
+        qos : `int`, optional
+            The MQTT quality of service level, by default 0
         """
-        measurements_and_tags.append(f"sensor_id={self.sensor_name}")
-        timestamp_str = f"{int(self.timestamp)}"
-        data = [
-            ",".join(measurements_and_tags),
-            str(fields),
-            timestamp_str,
-        ]
-        try:
-            self.client.publish(MQTT_CLIENT_API, " ".join(data))
-        except Exception as e:
-            print(f"Problem publishing: {e}")
+        self.add(measurements_and_tags, fields)
+        self.flush(qos)
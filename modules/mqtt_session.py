@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import socketpool
+
+from async_mqtt import QUEUE_SIZE, AsyncMqttClient
+from line_protocol import LineBatch
+
+__all__ = ["MqttSession"]
+
+MQTT_CLIENT_API = "sensors/data"
+KEEP_ALIVE = 60  # seconds
+
+
+class MqttSession(LineBatch):
+    def __init__(
+        self,
+        sensor_name: str,
+        pool: socketpool.SocketPool,
+        keep_alive: int = KEEP_ALIVE,
+        queue_size: int = QUEUE_SIZE,
+    ) -> None:
+        """Class constructor.
+
+        The asyncio counterpart of MqttHelper. The session stays connected
+        to the broker for the life of the program. Run the run coroutine as
+        a task next to the others, it connects, keeps the connection alive,
+        reconnects with an exponential backoff and sends the flushed
+        batches without blocking the other tasks.
+
+        Parameters
+        ----------
+        sensor_name : `str`
+            The identifier for the sensor.
+        pool : `socketpool.SocketPool`
+            The connection for the MQTT client.
+        keep_alive : `int`, optional
+            The keep alive time (seconds) for the connection, by default 60
+        queue_size : `int`, optional
+            The most batches waiting to be sent, by default 20
+        """
+        super().__init__(sensor_name)
+        self.client = AsyncMqttClient(
+            pool,
+            os.getenv("MQTT_BROKER"),
+            client_id=sensor_name,
+            username=os.getenv("MQTT_USER"),
+            password=os.getenv("MQTT_PASSWORD"),
+            keep_alive=keep_alive,
+            queue_size=queue_size,
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        """Flag to see if the session is connected.
+
+        Returns
+        -------
+        `bool`
+            True if connected to the broker, False otherwise.
+        """
+        return self.client.connected.is_set()
+
+    def flush(self, qos: int = 0) -> bool:
+        """Queue all batched measurements to go out in one message.
+
+        Parameters
+        ----------
+        qos : `int`, optional
+            The MQTT quality of service level, by default 0
+
+        Returns
+        -------
+        `bool`
+            False if the queue was full and the oldest batch was dropped.
+        """
+        if not self.encoder:
+            return True
+        # The batch waits in the client queue, so it needs its own copy.
+        payload = bytes(self.encoder.payload())
+        self.encoder.reset()
+        return self.client.publish(MQTT_CLIENT_API, payload, qos)
+
+    async def run(self) -> None:
+        """Keep the session connected and send the queued batches."""
+        await self.client.run()
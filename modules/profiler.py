@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import gc
+import time
+
+__all__ = ["Profiler"]
+
+REPORT_FILE = "/profile_report.txt"
+REPORT_PREFIX = "PROFILE:"
+
+
+class Profiler:
+    def __init__(self) -> None:
+        """Class constructor.
+
+        Records the time and heap used between marks. The copy_project
+        --profile option inserts the marks into the project code.
+        """
+        self.records = {}
+        self.order = []
+        gc.collect()
+        self.last_free = gc.mem_free()
+        self.last_time = time.monotonic_ns()
+
+    def mark(self, label: str) -> None:
+        """Record the time and heap used since the last mark.
+
+        Parameters
+        ----------
+        label : `str`
+            The name for the code run since the last mark.
+        """
+        now = time.monotonic_ns()
+        free = gc.mem_free()
+        record = self.records.get(label)
+        if record is None:
+            record = [0, 0, 0]
+            self.records[label] = record
+            self.order.append(label)
+        record[0] += 1
+        record[1] += now - self.last_time
+        record[2] += self.last_free - free
+        # Leave the bookkeeping above out of the next measurement.
+        self.last_free = gc.mem_free()
+        self.last_time = time.monotonic_ns()
+
+    def write(self, report_file: str = REPORT_FILE) -> None:
+        """Write the report to the board or the serial console.
+
+        The board filesystem is only writable from code when boot.py has
+        remounted it, otherwise the report is printed with a prefix so it
+        can be pulled out of a serial log.
+
+        Parameters
+        ----------
+        report_file : `str`, optional
+            The file to write the report to, by default /profile_report.txt
+        """
+        lines = []
+        for label in self.order:
+            count, elapsed, memory = self.records[label]
+            lines.append(f"{label}\t{count}\t{elapsed}\t{memory}")
+        try:
+            with open(report_file, "w") as rfile:
+                for line in lines:
+                    rfile.write(line + "\n")
+        except OSError:
+            for line in lines:
+                print(REPORT_PREFIX, line)
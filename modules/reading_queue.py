@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import alarm
+import struct
+import time
+
+__all__ = ["ReadingQueue"]
+
+MAGIC = 0x5251
+# magic, record size, head, count, wake count
+HEADER_FORMAT = "<HHHHH"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+# timestamp (s), measurement index, then one float per field
+RECORD_PREFIX = "<IB"
+MIN_TIMESTAMP = 1577836800  # 2020-01-01, earlier means the RTC is not set
+TIME_IN_NS = 1000000000
+
+
+class ReadingQueue:
+    def __init__(
+        self,
+        measurements: list[tuple[list[str], tuple[str, ...]]],
+        memory=None,
+        offset: int = 0,
+    ) -> None:
+        """Class constructor.
+
+        Readings are kept in a ring buffer of fixed width records that
+        survives deep sleep. The oldest readings are overwritten when the
+        buffer is full. A missing value is stored as NaN and comes back as
+        None.
+
+        Parameters
+        ----------
+        measurements : `list[tuple[list[str], tuple[str, ...]]]`
+            The measurement and tags and the field names for each kind of
+            reading. Readings refer to these by index.
+        memory : `bytearray`, optional
+            The storage for the buffer, by default alarm.sleep_memory
+        offset : `int`, optional
+            The start of the buffer in the storage, by default 0
+        """
+        self.measurements = measurements
+        self.memory = alarm.sleep_memory if memory is None else memory
+        self.offset = offset
+        self.num_fields = max(len(fields) for _, fields in measurements)
+        self.record_format = RECORD_PREFIX + "f" * self.num_fields
+        self.record_size = struct.calcsize(self.record_format)
+        self.capacity = (len(self.memory) - offset - HEADER_SIZE) // self.record_size
+
+        magic, record_size, self.head, self.count, self.wakes = struct.unpack(
+            HEADER_FORMAT, self.memory[offset : offset + HEADER_SIZE]
+        )
+        # Fresh power up or a different record layout, start over.
+        if magic != MAGIC or record_size != self.record_size:
+            self.head = 0
+            self.count = 0
+            self.wakes = 0
+            self._save_header()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _record_offset(self, index: int) -> int:
+        """Get the storage location of a record.
+
+        Parameters
+        ----------
+        index : `int`
+            The position of the record in the ring.
+
+        Returns
+        -------
+        `int`
+            The offset of the record in the storage.
+        """
+        return self.offset + HEADER_SIZE + index * self.record_size
+
+    def _save_header(self) -> None:
+        """Write the buffer state to the storage."""
+        # Sleep memory only supports slice access, not the buffer protocol.
+        self.memory[self.offset : self.offset + HEADER_SIZE] = struct.pack(
+            HEADER_FORMAT, MAGIC, self.record_size, self.head, self.count, self.wakes
+        )
+
+    def clear(self) -> None:
+        """Remove all readings, after they have been sent."""
+        self.head = 0
+        self.count = 0
+        self._save_header()
+
+    def drop(self, count: int) -> None:
+        """Remove the oldest readings, after they have been sent.
+
+        Parameters
+        ----------
+        count : `int`
+            The number of readings to remove.
+        """
+        count = min(count, self.count)
+        self.head = (self.head + count) % self.capacity
+        self.count -= count
+        self._save_header()
+
+    def push(
+        self, measurement: int, values: tuple, timestamp: int | None = None
+    ) -> None:
+        """Store a reading.
+
+        Parameters
+        ----------
+        measurement : `int`
+            The index of the measurement the values belong to.
+        values : `tuple`
+            The field values in the order of the measurement field names.
+        timestamp : `int`, optional
+            The time (seconds) of the reading, by default the current time.
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+        if timestamp < MIN_TIMESTAMP:
+            print("Clock not set, reading not stored.")
+            return
+        floats = [float("nan")] * self.num_fields
+        for i, value in enumerate(values):
+            if value is not None:
+                floats[i] = float(value)
+
+        start = self._record_offset((self.head + self.count) % self.capacity)
+        self.memory[start : start + self.record_size] = struct.pack(
+            self.record_format, timestamp, measurement, *floats
+        )
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.head = (self.head + 1) % self.capacity
+        self._save_header()
+
+    def readings(self, limit: int | None = None):
+        """Get the stored readings from oldest to newest.
+
+        Parameters
+        ----------
+        limit : `int`, optional
+            The most readings to get, by default all of them.
+
+        Yields
+        ------
+        measurements_and_tags : `list[str]`
+            The measurement to publish.
+        values : `dict`
+            The field names and values of the reading.
+        timestamp : `int`
+            The time (nanoseconds) of the reading.
+        """
+        count = self.count if limit is None else min(limit, self.count)
+        for i in range(count):
+            start = self._record_offset((self.head + i) % self.capacity)
+            timestamp, measurement, *floats = struct.unpack(
+                self.record_format, self.memory[start : start + self.record_size]
+            )
+            measurements_and_tags, fields = self.measurements[measurement]
+            values = {}
+            for name, value in zip(fields, floats):
+                values[name] = None if value != value else value
+            yield measurements_and_tags, values, timestamp * TIME_IN_NS
+
+    def transmit_due(self, transmit_every: int = 1) -> bool:
+        """Count a wake and check if the readings should be sent.
+
+        Parameters
+        ----------
+        transmit_every : `int`, optional
+            The number of wakes between transmissions, by default 1. Less
+            than 1 sends every wake.
+
+        Returns
+        -------
+        `bool`
+            True on every Nth wake, the first wake after power up and when
+            the buffer is full.
+        """
+        transmit_every = max(transmit_every, 1)
+        due = self.wakes % transmit_every == 0 or self.count >= self.capacity
+        self.wakes = (self.wakes + 1) & 0xFFFF
+        self._save_header()
+        return due
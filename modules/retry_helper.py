@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import random
+import time
+import wifi
+
+__all__ = ["backoff", "reset_radio", "RetryPolicy", "GIVE_UP", "RESET", "RETRY"]
+
+# How to handle a failure
+GIVE_UP = 0
+RETRY = 1
+RESET = 2  # reset the network before retrying
+
+BASE_DELAY = 1  # seconds
+MAX_DELAY = 30  # seconds
+BUDGET = 60  # seconds
+MAX_TRIES = 5
+JITTER = 0.5
+
+
+def backoff(attempt: int, base: float, maximum: float, jitter: float = JITTER) -> float:
+    """Get the delay before the next try.
+
+    The delay doubles with each failed try up to the maximum. Jitter takes
+    a random part off so devices failing together do not retry together.
+
+    Parameters
+    ----------
+    attempt : `int`
+        The number of tries that failed before this one, starting at 0.
+    base : `float`
+        The first delay (seconds).
+    maximum : `float`
+        The longest delay (seconds).
+    jitter : `float`, optional
+        The largest fraction of the delay to take off, by default 0.5
+
+    Returns
+    -------
+    `float`
+        The delay (seconds).
+    """
+    # Large attempts stay at the maximum without huge powers.
+    delay = min(base * 2 ** min(attempt, 20), maximum)
+    return delay * (1 - jitter * random.random())
+
+
+def reset_radio() -> None:
+    """Turn the wifi radio off and on to drop a stale connection."""
+    wifi.radio.enabled = False
+    wifi.radio.enabled = True
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        budget: float = BUDGET,
+        max_tries: int = MAX_TRIES,
+        jitter: float = JITTER,
+    ) -> None:
+        """Class constructor.
+
+        Bounds the time spent retrying network setup. The budget starts at
+        the first run and is shared by all the phases run with the policy,
+        so one policy handed to several helpers limits the whole wake.
+
+        Parameters
+        ----------
+        base_delay : `float`, optional
+            The delay (seconds) after the first failure, by default 1
+        max_delay : `float`, optional
+            The longest delay (seconds) between tries, by default 30
+        budget : `float`, optional
+            The total time (seconds) for all phases, by default 60
+        max_tries : `int`, optional
+            The most tries for each phase, by default 5
+        jitter : `float`, optional
+            The largest fraction of each delay taken off at random, by
+            default 0.5
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.max_tries = max_tries
+        self.jitter = jitter
+        self.started = None
+
+    def remaining(self) -> float:
+        """Get the time left in the budget.
+
+        Returns
+        -------
+        `float`
+            The time (seconds) left, the full budget before the first run.
+        """
+        if self.started is None:
+            return self.budget
+        return self.budget - (time.monotonic() - self.started)
+
+    def run(
+        self,
+        phase: str,
+        action,
+        handlers: tuple = (),
+        deadline: float | None = None,
+        reset=None,
+    ) -> bool:
+        """Call an action until it works or the policy gives up.
+
+        A try is only started if the delay before it ends inside both the
+        phase deadline and the budget. A try that is already running is
+        not interrupted, the network timeouts bound it.
+
+        Parameters
+        ----------
+        phase : `str`
+            The name of the phase for messages.
+        action : `callable`
+            The function to call, it raises on failure.
+        handlers : `tuple`, optional
+            Pairs of exception class and handling (RETRY, RESET or GIVE_UP),
+            the first matching class is used. Any other exception gives up.
+        deadline : `float`, optional
+            The most time (seconds) for this phase, by default the budget.
+        reset : `callable`, optional
+            The function to call before retrying a RESET failure, like
+            reset_radio, by default None
+
+        Returns
+        -------
+        `bool`
+            True if the action worked, False otherwise.
+        """
+        now = time.monotonic()
+        if self.started is None:
+            self.started = now
+        end = self.started + self.budget
+        if deadline is not None:
+            end = min(end, now + deadline)
+
+        # No tries at all when max_tries is below 1.
+        error = None
+        for attempt in range(self.max_tries):
+            try:
+                action()
+                return True
+            except Exception as e:
+                handling = GIVE_UP
+                for error_class, error_handling in handlers:
+                    if isinstance(e, error_class):
+                        handling = error_handling
+                        break
+                error = e
+
+            if handling == GIVE_UP or attempt + 1 == self.max_tries:
+                break
+            delay = backoff(attempt, self.base_delay, self.max_delay, self.jitter)
+            if time.monotonic() + delay > end:
+                break
+            print(f"{phase} failed, retrying in {delay:.1f} seconds: {error}")
+            if handling == RESET and reset is not None:
+                reset()
+            time.sleep(delay)
+
+        print(f"{phase} failed: {error}")
+        return False
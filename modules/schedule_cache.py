@@ -0,0 +1,291 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import alarm
+import json
+import struct
+import time
+
+from sun_helper import SunHelper
+
+__all__ = ["ScheduleCache"]
+
+MAGIC = 0x5343
+# magic, length of the JSON document
+HEADER_FORMAT = "<HH"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+CACHE_SIZE = 1024
+SECONDS_PER_DAY = 86400
+# The entries of a Helios schedule the lamp timer uses.
+KEYS = (
+    "on_time_utc",
+    "off_time_utc",
+    "check_time_utc",
+    "date",
+    "sunrise_usno",
+    "sunset_usno",
+    "on_time",
+    "off_time",
+)
+
+
+def _clock(timestamp: int) -> str:
+    """Format a time of day.
+
+    Parameters
+    ----------
+    timestamp : `int`
+        The local time (seconds).
+
+    Returns
+    -------
+    `str`
+        The time as HH:MM.
+    """
+    t = time.localtime(timestamp)
+    return f"{t.tm_hour:02d}:{t.tm_min:02d}"
+
+
+def _date(timestamp: int) -> str:
+    """Format a date.
+
+    Parameters
+    ----------
+    timestamp : `int`
+        The local time (seconds).
+
+    Returns
+    -------
+    `str`
+        The date as YYYY-MM-DD.
+    """
+    t = time.localtime(timestamp)
+    return f"{t.tm_year}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+
+
+class ScheduleCache:
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        off_time: int,
+        height: float = 0,
+        memory=None,
+        offset: int = 0,
+        size: int = CACHE_SIZE,
+    ) -> None:
+        """Class constructor.
+
+        Keeps several days of lamp schedules in memory that survives deep
+        sleep, so the Helios web service only needs to be asked once every
+        few days. The days after the one from the service are worked out
+        by moving the on time with the change in sunset and taking the off
+        time from the local off time. There are no time zone rules on the
+        board, so these days keep the UTC offset of the day from the
+        service. When there is
+        nothing cached a schedule is made from the sunset alone.
+
+        Parameters
+        ----------
+        latitude : `float`
+            The latitude (degrees) of the location, north positive.
+        longitude : `float`
+            The longitude (degrees) of the location, east positive.
+        off_time : `int`
+            The local time of day (seconds) to turn the lamp off.
+        height : `float`, optional
+            The height (metres) of the location above its horizon, by
+            default 0
+        memory : `bytearray`, optional
+            The storage for the cache, by default alarm.sleep_memory
+        offset : `int`, optional
+            The start of the cache in the storage, by default 0
+        size : `int`, optional
+            The most bytes the cache can use, by default 1024
+        """
+        self.sun = SunHelper(latitude, longitude, height)
+        self.off_time = off_time
+        self.memory = alarm.sleep_memory if memory is None else memory
+        self.offset = offset
+        self.size = min(size, len(self.memory) - offset)
+        # Until the service says otherwise, go by the longitude.
+        self.utc_offset = round(longitude / 15) * 3600
+        self.days = []
+        self._load()
+
+    def _load(self) -> None:
+        """Read the cached days from the storage."""
+        magic, length = struct.unpack(
+            HEADER_FORMAT, self.memory[self.offset : self.offset + HEADER_SIZE]
+        )
+        if magic != MAGIC or length > self.size - HEADER_SIZE:
+            return
+        start = self.offset + HEADER_SIZE
+        try:
+            cache = json.loads(bytes(self.memory[start : start + length]))
+            self.utc_offset = cache["utc_offset"]
+            self.days = cache["days"]
+        except (ValueError, KeyError) as e:
+            print(f"Ignoring schedule cache: {e}")
+
+    def _midnight(self, timestamp: int) -> int:
+        """Get the start of the local day.
+
+        Parameters
+        ----------
+        timestamp : `int`
+            A UTC time (seconds).
+
+        Returns
+        -------
+        `int`
+            The UTC time (seconds) of the local midnight before it.
+        """
+        local = timestamp + self.utc_offset
+        return local - local % SECONDS_PER_DAY - self.utc_offset
+
+    def _save(self) -> None:
+        """Write the cached days to the storage, dropping the last days if
+        they do not fit."""
+        while True:
+            document = json.dumps(
+                {"utc_offset": self.utc_offset, "days": self.days}
+            ).encode()
+            if len(document) <= self.size - HEADER_SIZE or not self.days:
+                break
+            self.days.pop()
+        start = self.offset + HEADER_SIZE
+        self.memory[start : start + len(document)] = document
+        self.memory[self.offset : start] = struct.pack(
+            HEADER_FORMAT, MAGIC, len(document)
+        )
+
+    def current(self, timestamp: int) -> dict | None:
+        """Get the cached schedule for a time.
+
+        Parameters
+        ----------
+        timestamp : `int`
+            The current UTC time (seconds).
+
+        Returns
+        -------
+        `dict` | None
+            The schedule running until its next check, None if the cache has
+            run out.
+        """
+        for day in self.days:
+            if day["check_time_utc"] > timestamp:
+                return day
+        return None
+
+    def fallback(self, timestamp: int, retry: int) -> dict:
+        """Make a schedule from the local sunset.
+
+        The lamp goes on at sunset and off at the off time. Without a
+        sunset the lamp events are left out.
+
+        Parameters
+        ----------
+        timestamp : `int`
+            The current UTC time (seconds).
+        retry : `int`
+            The time (seconds) until the service is asked again.
+
+        Returns
+        -------
+        `dict`
+            The schedule in the same form as from the service.
+        """
+        local = timestamp + self.utc_offset
+        sunrise, sunset = self.sun.sun_times(local)
+        on_time, off_time = self.sun.lamp_times(
+            timestamp, self.off_time, self.utc_offset
+        )
+        info = {
+            "on_time_utc": on_time,
+            "off_time_utc": off_time,
+            "check_time_utc": timestamp + retry,
+            "date": _date(local),
+            "sunrise_usno": "--:--",
+            "sunset_usno": "--:--",
+            "on_time": "--:--",
+            "off_time": _clock(self.off_time),
+        }
+        if sunset is not None:
+            info["sunrise_usno"] = _clock(sunrise + self.utc_offset)
+            info["sunset_usno"] = _clock(sunset + self.utc_offset)
+            info["on_time"] = _clock(on_time + self.utc_offset)
+        return info
+
+    def store(self, info: dict, days: int) -> dict | None:
+        """Cache a schedule from the service and the days after it.
+
+        Parameters
+        ----------
+        info : `dict`
+            The schedule from the service.
+        days : `int`
+            The number of days to cache, including the one from the service.
+
+        Returns
+        -------
+        `dict` | None
+            The schedule from the service with only the used entries, None
+            if the service left some out.
+        """
+        if (
+            not isinstance(info, dict)
+            or any(key not in info for key in KEYS)
+            or info["check_time_utc"] is None
+        ):
+            print("Schedule from the service is incomplete.")
+            return None
+        first = {key: info[key] for key in KEYS}
+        self.days = [first]
+        if first["on_time_utc"] is None or first["off_time_utc"] is None:
+            # No sunset, nothing to move the later days from.
+            self._save()
+            return first
+
+        # The off time is a fixed local time, the difference to its UTC time
+        # is the offset from UTC to the nearest quarter hour.
+        difference = (self.off_time - first["off_time_utc"]) % SECONDS_PER_DAY
+        if difference > SECONDS_PER_DAY // 2:
+            difference -= SECONDS_PER_DAY
+        self.utc_offset = round(difference / 900) * 900
+
+        # Aim at the local date of the on time so the sunsets are from the
+        # same evenings.
+        _, first_sunset = self.sun.sun_times(first["on_time_utc"] + self.utc_offset)
+        if first_sunset is None:
+            self._save()
+            return first
+        on_offset = first["on_time_utc"] - first_sunset
+        check_delay = first["check_time_utc"] - self._midnight(first["on_time_utc"])
+        for day in range(1, days):
+            timestamp = first["on_time_utc"] + day * SECONDS_PER_DAY
+            # The lamp times come from the local off time of each day, like
+            # the fallback schedule.
+            on_time, off_time = self.sun.lamp_times(
+                timestamp, self.off_time, self.utc_offset, on_offset
+            )
+            if on_time is None:
+                break
+            local = timestamp + self.utc_offset
+            sunrise, sunset = self.sun.sun_times(local)
+            self.days.append(
+                {
+                    "on_time_utc": on_time,
+                    "off_time_utc": off_time,
+                    "check_time_utc": self._midnight(timestamp) + check_delay,
+                    "date": _date(local),
+                    "sunrise_usno": _clock(sunrise + self.utc_offset),
+                    "sunset_usno": _clock(sunset + self.utc_offset),
+                    "on_time": _clock(on_time + self.utc_offset),
+                    "off_time": first["off_time"],
+                }
+            )
+        self._save()
+        return first
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import array
+import math
+
+__all__ = ["SunHelper"]
+
+SECONDS_PER_DAY = 86400
+SECONDS_PER_DEGREE = 240  # of hour angle
+J2000_UNIX = 946728000  # 2000-01-01 12:00 UTC
+DAYS_PER_CYCLE = 1461  # four years
+# Mean longitude (degrees) of the sun at J2000 and its daily motion. The
+# motion over a whole four year cycle less four turns is kept separately so
+# the day count never meets a float.
+MEAN_LONGITUDE = 280.46
+DAILY_MOTION = 0.9856474
+CYCLE_MOTION = 0.0308514
+PERIHELION = 282.9404  # degrees, longitude of perihelion
+OBLIQUITY = 23.4393  # degrees
+HORIZON = -0.833  # degrees, refraction and solar disk
+DIP = 2.076 / 60  # degrees per square root metre of height
+TABLE_SIZE = 128
+TABLE_STEP = 360 / TABLE_SIZE
+
+
+def _make_tables() -> tuple:
+    """Tabulate the sun over a year of mean longitude.
+
+    Returns
+    -------
+    sin_declination : `array.array`
+        The sine of the declination for each step.
+    equation_of_time : `array.array`
+        The equation of time (seconds) for each step.
+    """
+    sin_declination = array.array("f")
+    equation_of_time = array.array("f")
+    sin_obliquity = math.sin(math.radians(OBLIQUITY))
+    cos_obliquity = math.cos(math.radians(OBLIQUITY))
+    # One more than the size so interpolation does not need to wrap.
+    for step in range(TABLE_SIZE + 1):
+        longitude = step * TABLE_STEP
+        anomaly = math.radians(longitude - PERIHELION)
+        center = (
+            1.9148 * math.sin(anomaly)
+            + 0.02 * math.sin(2 * anomaly)
+            + 0.0003 * math.sin(3 * anomaly)
+        )
+        ecliptic = math.radians(longitude + center)
+        sin_declination.append(sin_obliquity * math.sin(ecliptic))
+        right_ascension = math.degrees(
+            math.atan2(cos_obliquity * math.sin(ecliptic), math.cos(ecliptic))
+        )
+        difference = (longitude - right_ascension + 180) % 360 - 180
+        equation_of_time.append(difference * SECONDS_PER_DEGREE)
+    return sin_declination, equation_of_time
+
+
+SIN_DECLINATION, EQUATION_OF_TIME = _make_tables()
+
+
+class SunHelper:
+    def __init__(self, latitude: float, longitude: float, height: float = 0) -> None:
+        """Class constructor.
+
+        Works out sunrise and sunset on the board, good to about a minute.
+        The declination and equation of time come from tables over the
+        mean longitude of the sun, so a day costs one square root and one
+        arc cosine. Whole days are counted with integers and every float
+        stays below a day of seconds, which keeps the precision with the
+        30 bit floats of CircuitPython.
+
+        Parameters
+        ----------
+        latitude : `float`
+            The latitude (degrees) of the location, north positive.
+        longitude : `float`
+            The longitude (degrees) of the location, east positive.
+        height : `float`, optional
+            The height (metres) of the location above its horizon, by
+            default 0
+        """
+        self.longitude = longitude
+        phi = math.radians(latitude)
+        self.sin_latitude = math.sin(phi)
+        self.cos_latitude = math.cos(phi)
+        horizon = HORIZON - DIP * math.sqrt(max(height, 0))
+        self.sin_horizon = math.sin(math.radians(horizon))
+
+    def _position(self, days: int) -> tuple:
+        """Look up the sun at local noon.
+
+        Parameters
+        ----------
+        days : `int`
+            The number of days since 2000-01-01.
+
+        Returns
+        -------
+        sin_declination : `float`
+            The sine of the declination.
+        equation_of_time : `float`
+            The equation of time (seconds).
+        """
+        cycles, rest = divmod(days, DAYS_PER_CYCLE)
+        longitude = (
+            MEAN_LONGITUDE
+            + cycles * CYCLE_MOTION
+            + DAILY_MOTION * (rest - self.longitude / 360)
+        ) % 360
+        place = longitude / TABLE_STEP
+        index = int(place)
+        fraction = place - index
+        sin_declination = SIN_DECLINATION[index] + fraction * (
+            SIN_DECLINATION[index + 1] - SIN_DECLINATION[index]
+        )
+        equation_of_time = EQUATION_OF_TIME[index] + fraction * (
+            EQUATION_OF_TIME[index + 1] - EQUATION_OF_TIME[index]
+        )
+        return sin_declination, equation_of_time
+
+    def lamp_times(
+        self, timestamp: int, off_time: int, utc_offset: int, on_offset: int = 0
+    ) -> tuple:
+        """Calculate when a lamp goes on and off for a day.
+
+        Parameters
+        ----------
+        timestamp : `int`
+            A UTC time (seconds) on the day.
+        off_time : `int`
+            The local time of day (seconds) to turn the lamp off.
+        utc_offset : `int`
+            The difference (seconds) of local time to UTC.
+        on_offset : `int`, optional
+            The time (seconds) after sunset to turn the lamp on, by default 0
+
+        Returns
+        -------
+        on_time : `int` | None
+            The UTC time (seconds) to turn the lamp on, None without a
+            sunset.
+        off_time : `int` | None
+            The UTC time (seconds) to turn the lamp off, None without a
+            sunset.
+        """
+        local = timestamp + utc_offset
+        _, sunset = self.sun_times(local)
+        if sunset is None:
+            return None, None
+        on_time = sunset + on_offset
+        off_time += local - local % SECONDS_PER_DAY - utc_offset
+        if off_time <= on_time:
+            off_time += SECONDS_PER_DAY
+        return on_time, off_time
+
+    def sun_times(self, timestamp: int) -> tuple:
+        """Calculate the sunrise and sunset for a day.
+
+        Parameters
+        ----------
+        timestamp : `int`
+            A UTC time (seconds) on the day. Add the UTC offset to get the
+            times for the local date.
+
+        Returns
+        -------
+        sunrise : `int` | None
+            The UTC time (seconds) of sunrise, None if the sun does not rise.
+        sunset : `int` | None
+            The UTC time (seconds) of sunset, None if the sun does not set.
+        """
+        days = (int(timestamp) - J2000_UNIX + SECONDS_PER_DAY // 2) // SECONDS_PER_DAY
+        sin_declination, equation_of_time = self._position(days)
+        cos_declination = math.sqrt(1 - sin_declination * sin_declination)
+        cos_hour_angle = (self.sin_horizon - self.sin_latitude * sin_declination) / (
+            self.cos_latitude * cos_declination
+        )
+        if cos_hour_angle > 1 or cos_hour_angle < -1:
+            return None, None
+        half_day = math.degrees(math.acos(cos_hour_angle)) * SECONDS_PER_DEGREE
+        transit = -self.longitude * SECONDS_PER_DEGREE - equation_of_time
+
+        noon = J2000_UNIX + days * SECONDS_PER_DAY
+        return noon + int(transit - half_day), noon + int(transit + half_day)
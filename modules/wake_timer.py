@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+
+import alarm
+import array
+import struct
+import time
+
+from line_protocol import Fields
+
+__all__ = ["WakeTimer", "PHASES", "SLEEP_MEMORY_SIZE"]
+
+PHASES = ("wifi", "ntp", "battery", "sensor", "connect", "publish", "sleep")
+MAGIC = 0x5754
+# magic, then the time (ms) each phase ended
+STATE_FORMAT = "<H" + "H" * len(PHASES)
+STATE_SIZE = struct.calcsize(STATE_FORMAT)
+SLEEP_MEMORY_SIZE = 16
+NOT_REACHED = 0xFFFF
+NS_PER_MS = 1000000
+
+
+class WakeTimer:
+    def __init__(self, memory=None, offset: int = 0) -> None:
+        """Class constructor.
+
+        Records when each phase of a wake ended, in milliseconds since the
+        timer was made, so make it first thing in the program. The times of
+        a wake are kept in sleep memory and reported by the next wake, once
+        the publish and sleep times are known.
+
+        Parameters
+        ----------
+        memory : `bytearray`, optional
+            The storage for the times, by default alarm.sleep_memory
+        offset : `int`, optional
+            The start of the times in the storage, by default 0
+        """
+        self.start = time.monotonic_ns()
+        self.memory = alarm.sleep_memory if memory is None else memory
+        self.offset = offset
+        self.marks = array.array("H", [NOT_REACHED] * len(PHASES))
+
+        magic, *last = struct.unpack(
+            STATE_FORMAT, self.memory[offset : offset + STATE_SIZE]
+        )
+        # Nothing from a previous wake after a power up.
+        self.last = array.array("H", last) if magic == MAGIC else None
+
+    def fields(self) -> Fields:
+        """Get the phase times of the previous wake.
+
+        Returns
+        -------
+        `Fields`
+            The time (ms) each phase ended as <phase>_ms, None for phases
+            the wake did not reach or after a power up.
+        """
+        values = {}
+        for index, phase in enumerate(PHASES):
+            value = None
+            if self.last is not None and self.last[index] != NOT_REACHED:
+                value = self.last[index]
+            values[f"{phase}_ms"] = value
+        return Fields(**values)
+
+    def last_wake(self) -> int | None:
+        """Get how long the previous wake lasted.
+
+        Returns
+        -------
+        `int` | None
+            The time (ms) from the start of the previous wake to its sleep,
+            None after a power up.
+        """
+        if self.last is None:
+            return None
+        return self.last[PHASES.index("sleep")]
+
+    def mark(self, phase: str) -> None:
+        """Record the end of a phase.
+
+        Parameters
+        ----------
+        phase : `str`
+            One of the names in PHASES.
+        """
+        elapsed = (time.monotonic_ns() - self.start) // NS_PER_MS
+        self.marks[PHASES.index(phase)] = min(elapsed, NOT_REACHED - 1)
+
+    def sleep(self) -> None:
+        """Record the sleep phase and keep the times for the next wake."""
+        self.mark("sleep")
+        self.memory[self.offset : self.offset + STATE_SIZE] = struct.pack(
+            STATE_FORMAT, MAGIC, *self.marks
+        )
@@ -1,53 +1,244 @@
-# SPDX-FileCopyrightText: 2023-2025 Michael Reuter
+# SPDX-FileCopyrightText: 2023-2026 Michael Reuter
 #
 # SPDX-License-Identifier: MIT
 
 import adafruit_ntp
+import alarm
+import os
 import rtc
 import socketpool
+import struct
 import time
 import wifi
 
-__all__ = ["setup_wifi_and_rtc"]
+from retry_helper import RESET, RETRY, RetryPolicy, reset_radio
+
+__all__ = ["setup_wifi_and_rtc", "sync_rtc", "SLEEP_MEMORY_SIZE"]
+
+MAGIC = 0x5746
+# magic, AP channel, AP BSSID, last NTP sync (s), NTP interval (s), last
+# connection time (ms)
+STATE_FORMAT = "<HB6sIIH"
+STATE_SIZE = struct.calcsize(STATE_FORMAT)
+# The start of sleep memory is kept for the wifi state, other users of sleep
+# memory start after it.
+SLEEP_MEMORY_SIZE = 32
+MIN_TIMESTAMP = 1577836800  # 2020-01-01, earlier means the RTC is not set
+START_DELAY = 5  # seconds
+POLL_INTERVAL = 0.1  # seconds
+DRIFT_BUDGET = 2  # seconds
+MIN_NTP_INTERVAL = 60 * 60
+MAX_NTP_INTERVAL = 24 * 60 * 60
+NS_PER_MS = 1000000
+CONNECT_DEADLINE = 20  # seconds
+NTP_DEADLINE = 10  # seconds
+BUDGET = 30  # seconds
+# A missing access point or NTP timeout is retried, a wedged radio is reset.
+HANDLERS = ((ConnectionError, RETRY), (OSError, RETRY), (RuntimeError, RESET))
+
+
+def _load_state() -> dict:
+    """Read the wifi state kept in sleep memory.
+
+    Returns
+    -------
+    `dict`
+        The last access point channel and BSSID, NTP sync time, NTP interval
+        and connection time. Zeros after a power up.
+    """
+    values = struct.unpack(STATE_FORMAT, alarm.sleep_memory[:STATE_SIZE])
+    if values[0] != MAGIC:
+        values = (MAGIC, 0, bytes(6), 0, MIN_NTP_INTERVAL, 0)
+    return {
+        "channel": values[1],
+        "bssid": values[2],
+        "last_sync": values[3],
+        "interval": values[4],
+        "connect_ms": values[5],
+    }
+
+
+def _save_state(state: dict) -> None:
+    """Write the wifi state to sleep memory.
+
+    Parameters
+    ----------
+    state : `dict`
+        The state from _load_state.
+    """
+    alarm.sleep_memory[:STATE_SIZE] = struct.pack(
+        STATE_FORMAT,
+        MAGIC,
+        state["channel"],
+        state["bssid"],
+        state["last_sync"],
+        state["interval"],
+        min(state["connect_ms"], 0xFFFF),
+    )
+
+
+def _connect(state: dict, wait: bool) -> None:
+    """Join the access point.
+
+    The last access point is joined directly on its channel, which skips
+    the scan. Otherwise wait for the automatic connection about as long as
+    the last connection took, then connect by name.
+
+    Parameters
+    ----------
+    state : `dict`
+        The state from _load_state.
+    wait : `bool`
+        Wait for the automatic connection before connecting by name.
+    """
+    ssid = os.getenv("CIRCUITPY_WIFI_SSID")
+    password = os.getenv("CIRCUITPY_WIFI_PASSWORD")
+    if ssid and state["channel"]:
+        try:
+            wifi.radio.connect(
+                ssid, password, channel=state["channel"], bssid=state["bssid"]
+            )
+            return
+        except (ConnectionError, OSError):
+            print("Cannot reach last access point.")
+            state["channel"] = 0
+
+    if wait:
+        # Allow twice the last connection time, the full delay when unknown.
+        delay = START_DELAY
+        if state["connect_ms"]:
+            delay = min(max(2 * state["connect_ms"] / 1000, 1), START_DELAY)
+        deadline = time.monotonic() + delay
+        while not wifi.radio.connected and time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+    if not wifi.radio.connected and ssid:
+        wifi.radio.connect(ssid, password)
+
+
+def _sync(pool: socketpool.SocketPool, state: dict, drift_budget: float) -> None:
+    """Set the RTC to UTC from NTP and work out when to sync again.
+
+    The drift of the RTC since the last sync sets how long until the next
+    sync is needed.
+
+    Parameters
+    ----------
+    pool : `socketpool.SocketPool`
+        The connection for the NTP request.
+    state : `dict`
+        The state from _load_state.
+    drift_budget : `float`
+        The RTC drift (seconds) allowed before syncing with NTP.
+    """
+    ntp = adafruit_ntp.NTP(pool, tz_offset=0)
+    ntp_datetime = ntp.datetime
+    ntp_time = int(time.mktime(ntp_datetime))
+    rtc_time = time.time()
+    rtc.RTC().datetime = ntp_datetime
+
+    elapsed = ntp_time - state["last_sync"]
+    if (
+        state["last_sync"] >= MIN_TIMESTAMP
+        and rtc_time >= MIN_TIMESTAMP
+        and elapsed > 0
+    ):
+        # NTP only gives whole seconds, so never count less than a second.
+        drift = max(abs(ntp_time - rtc_time), 1)
+        interval = int(elapsed * drift_budget / drift)
+        state["interval"] = min(max(interval, MIN_NTP_INTERVAL), MAX_NTP_INTERVAL)
+    state["last_sync"] = ntp_time
 
 
 def setup_wifi_and_rtc(
-    start_delay: bool = False, retry_delay: float = 2, num_retries: int = 5
+    start_delay: bool = False,
+    retry_delay: float = 2,
+    num_retries: int = 5,
+    drift_budget: float = DRIFT_BUDGET,
+    policy: RetryPolicy | None = None,
+    timer=None,
 ) -> socketpool.SocketPool | None:
     """Setup wifi and initialize RTC with NTP.
 
+    The access point and the NTP sync time are kept in sleep memory, so a
+    wake from deep sleep joins without a scan and only asks NTP again once
+    the RTC may have drifted by the drift budget.
+
     Parameters
     ----------
     start_delay : `bool`, optional
-        Delay the function start, useful for programs coming up from deep
-        sleep, by default False
-    retry_delay : f`loat`, optional
-        The delay time (seconds) between connection retries, by default 2
+        Wait for the automatic wifi connection, useful for programs coming up
+        from deep sleep, by default False
+    retry_delay : `float`, optional
+        The delay time (seconds) after the first failed connection, doubling
+        for each retry, by default 2
     num_retries : `int`, optional
-        The number of times to retry the wireless connection, default is 5
+        The number of times to try the wireless connection, default is 5
+    drift_budget : `float`, optional
+        The RTC drift (seconds) allowed before syncing with NTP, by default 2
+    policy : `RetryPolicy`, optional
+        The retry policy to use instead of one from retry_delay and
+        num_retries, pass the same one to other helpers to share its budget.
+    timer : `WakeTimer`, optional
+        Records the end of the wifi and NTP phases, by default None
 
     Returns
     -------
     `socketpool.SocketPool` | None
         The socket pool for use in other network connections.
     """
-    if start_delay:
-        time.sleep(5)
+    if policy is None:
+        policy = RetryPolicy(
+            base_delay=retry_delay, budget=BUDGET, max_tries=num_retries
+        )
+    state = _load_state()
 
-    retries = num_retries
-    pool: socketpool.SocketPool | None = None
-    while retries > 0:
-        try:
-            pool = socketpool.SocketPool(wifi.radio)
-            ntp = adafruit_ntp.NTP(pool, tz_offset=0)
-            rtc.RTC().datetime = ntp.datetime
-            break
-        except Exception:
-            print("Cannot connect to wifi.")
+    def connect():
+        if not wifi.radio.connected:
+            start = time.monotonic_ns()
+            _connect(state, start_delay)
+            state["connect_ms"] = max((time.monotonic_ns() - start) // NS_PER_MS, 1)
+
+    if not policy.run("Wifi", connect, HANDLERS, CONNECT_DEADLINE, reset_radio):
+        print("Cannot connect to wifi.")
+        _save_state(state)
+        return None
+
+    if timer is not None:
+        timer.mark("wifi")
+    ap_info = wifi.radio.ap_info
+    if ap_info is not None:
+        state["channel"] = ap_info.channel
+        state["bssid"] = ap_info.bssid
+    pool = socketpool.SocketPool(wifi.radio)
+    now = time.time()
+    if (
+        now < MIN_TIMESTAMP
+        or now < state["last_sync"]
+        or now - state["last_sync"] >= state["interval"]
+    ):
+        synced = policy.run(
+            "NTP", lambda: _sync(pool, state, drift_budget), HANDLERS, NTP_DEADLINE
+        )
+        if synced and timer is not None:
+            timer.mark("ntp")
+        # An RTC that was set before is still good enough to go on with.
+        if not synced and time.time() < MIN_TIMESTAMP:
             pool = None
-            retries -= 1
-            if not retries:
-                break
-            time.sleep(retry_delay)
 
+    _save_state(state)
     return pool
+
+
+def sync_rtc(pool: socketpool.SocketPool, drift_budget: float = DRIFT_BUDGET) -> None:
+    """Set the RTC to UTC from NTP.
+
+    Parameters
+    ----------
+    pool : `socketpool.SocketPool`
+        The connection for the NTP request.
+    drift_budget : `float`, optional
+        The RTC drift (seconds) allowed before syncing with NTP, by default 2
+    """
+    state = _load_state()
+    _sync(pool, state, drift_budget)
+    _save_state(state)
@@ -11,12 +11,17 @@ import asyncio
 import board
 from digitalio import DigitalInOut, Direction
 import displayio
-import json
 import os
 import ssl
 
 from battery_helper import BatteryHelper
-from mqtt_helper import Fields, MqttHelper
+from button_helper import ButtonEvents
+from deadline_timer import DeadlineTimer
+from display_view import DisplayView
+from event_scheduler import EventScheduler
+from line_protocol import Fields
+from mqtt_session import MqttSession
+from schedule_cache import ScheduleCache
 import wifi_helper
 
 # Defaults for values
@@ -29,6 +34,9 @@ integration_time = None
 pool = wifi_helper.setup_wifi_and_rtc(start_delay=True)
 ssl_default_context = ssl.create_default_context()
 requests = adafruit_requests.Session(pool, ssl_default_context)
+session = None
+if pool is not None:
+    session = MqttSession(os.getenv("MQTT_SENSOR_NAME"), pool)
 
 i2c = board.STEMMA_I2C()
 battery_monitor = BatteryHelper(i2c)
@@ -37,7 +45,7 @@ veml7700.light_gain = veml7700.ALS_GAIN_1_8
 veml7700.light_integration_time = veml7700.ALS_100MS
 
 # Setup display area
-DISPLAY_FONT = bitmap_font.load_font("fonts/SpartanMB-Regular-12.bdf")
+DISPLAY_FONT = bitmap_font.load_font("fonts/SpartanMB-Regular-12-subset.pcf")
 TEXT_COLOR = 0xFFFFFF
 LIGHT_COLOR = 0xF0E442
 DARK_COLOR = 0x0072B2
@@ -50,7 +58,7 @@ main_display.brightness = 1.0
 half_label_width = main_display.width // 2
 label_height = 33
 time_label_width = 87
-main_group = displayio.Group()
+view = DisplayView(main_display)
 datetime_label = bitmap_label.Label(DISPLAY_FONT, color=TEXT_COLOR)
 datetime_label.anchor_point = (0.5, 0.25)
 datetime_label.anchored_position = (half_label_width, 10)
@@ -85,28 +93,27 @@ off_time_label = bitmap_label.Label(DISPLAY_FONT, color=DARK_COLOR)
 off_time_label.anchor_point = (0.5, 0.3175)
 off_time_label.anchored_position = (196, 111)
 
-main_group.append(datetime_label)
-main_group.append(white_label)
-main_group.append(lux_label)
-main_group.append(sunrise_img)
-main_group.append(sunrise_time_label)
-main_group.append(sunset_img)
-main_group.append(sunset_time_label)
-main_group.append(on_circle_img)
-main_group.append(on_time_label)
-main_group.append(off_circle_img)
-main_group.append(off_time_label)
-main_display.root_group = main_group
+view.add("date", datetime_label)
+view.add("white", white_label)
+view.add("lux", lux_label)
+view.add("sunrise_img", sunrise_img)
+view.add("sunrise", sunrise_time_label)
+view.add("sunset_img", sunset_img)
+view.add("sunset", sunset_time_label)
+view.add("on_circle_img", on_circle_img)
+view.add("on_time", on_time_label)
+view.add("off_circle_img", off_circle_img)
+view.add("off_time", off_time_label)
+view.show()
 
 # Setup power relay control
 power_relay_pin = DigitalInOut(board.D5)
 power_relay_pin.direction = Direction.OUTPUT
 
 # Setup buttons
-display_on_btn = DigitalInOut(board.D2)
-display_on_btn.direction = Direction.INPUT
-display_off_btn = DigitalInOut(board.D1)
-display_off_btn.direction = Direction.INPUT
+DISPLAY_OFF_BUTTON = 0
+DISPLAY_ON_BUTTON = 1
+buttons = ButtonEvents((board.D1, board.D2), value_when_pressed=True)
 
 TIME_ZONE_NAME = os.getenv("LOCATION_TIMEZONE_NAME")
 CHECK_TIME = os.getenv("CHECK_TIME")
@@ -117,124 +124,141 @@ LOCATION_LONGITUDE = os.getenv("LOCATION_LONGITUDE")
 LOCATION_LATITUDE = os.getenv("LOCATION_LATITUDE")
 LOCATION_HEIGHT = os.getenv("LOCATION_HEIGHT")
 HELIOS_WEBSERVICE = os.getenv("HELIOS_WEBSERVICE")
+# Settings are written as strings, and today is always kept.
+SCHEDULE_DAYS = max(int(os.getenv("SCHEDULE_DAYS", 3)), 1)
 MEASURE_TIME = 5 * 60
 DISPLAY_TIMEOUT = 5 * 60
-
-
-class TimerCondition:
-    def __init__(self):
-        self.initialized = False
-        self.next_check_time = None
-        self.lamp_on_time = None
-        self.lamp_off_time = None
+RESYNC_TIME = 6 * 60 * 60
+RETRY_TIME = 60 * 60
+
+scheduler = EventScheduler()
+schedule_cache = ScheduleCache(
+    float(LOCATION_LATITUDE),
+    float(LOCATION_LONGITUDE),
+    LAMP_OFF_TIME.hour * 3600 + LAMP_OFF_TIME.minute * 60 + LAMP_OFF_TIME.second,
+    height=float(LOCATION_HEIGHT or 0),
+    offset=wifi_helper.SLEEP_MEMORY_SIZE,
+)
 
 
 def get_current_time() -> float:
     return datetime.now()
 
 
-def get_seconds_from_now(dt: float) -> float:
-    now = get_current_time()
-    print(f"Now: {now.timestamp():.0f}")
-    return dt - now.timestamp()
+def lamp_on() -> None:
+    print(f"Turning on lamp at {get_current_time()}")
+    # GPIO on
+    power_relay_pin.value = True
 
 
-async def dim_screen(evt: asyncio.Event) -> None:
-    while True:
-        interrupted = False
-        await evt.wait()
-        print("Starting display timeout")
-        timeout = DISPLAY_TIMEOUT
-        while timeout > 0:
-            if not evt.is_set():
-                interrupted = True
-                print("Interrupt display timeout")
-                break
-            await asyncio.sleep(1)
-            timeout -= 1
-        if not interrupted:
-            print("Turning off display")
-            main_display.brightness = 0.0
-            evt.clear()
+def lamp_off() -> None:
+    print(f"Turning off lamp at {get_current_time()}")
+    # GPIO off
+    power_relay_pin.value = False
 
 
-async def time_setter(tc: TimerCondition) -> None:
-    while True:
-        current_time = get_current_time()
-        print(int(current_time.timestamp()))
-        print("Setting up conditions")
+def resync_clock() -> None:
+    try:
+        wifi_helper.sync_rtc(pool)
+        print(f"Clock synchronized at {get_current_time()}")
+    except Exception as e:
+        print(f"Clock synchronization failed: {e}")
+    scheduler.schedule(
+        "resync", get_current_time().timestamp() + RESYNC_TIME, resync_clock
+    )
+
 
-        url = [
-            HELIOS_WEBSERVICE,
-            "?",
-            f"cdatetime={int(current_time.timestamp())}",
-            "&",
-            f"tz={TIME_ZONE_NAME}",
-            "&",
-            f"lat={LOCATION_LATITUDE}",
-            "&",
-            f"lon={LOCATION_LONGITUDE}",
-            "&",
-            f"checktime={CHECK_TIME}",
-            "&",
-            f"offtime={LAMP_OFF_TIME}",
-            "&",
-            f"onrange={ON_RANGE}",
-            "&",
-            f"offrange={OFF_RANGE}",
-        ]
-
-        print("".join(url))
+async def dim_screen(timer: DeadlineTimer) -> None:
+    while True:
+        await timer.wait()
+        print("Turning off display")
+        main_display.brightness = 0.0
+
+
+def fetch_schedule(timestamp: int) -> dict | None:
+    url = [
+        HELIOS_WEBSERVICE,
+        "?",
+        f"cdatetime={timestamp}",
+        "&",
+        f"tz={TIME_ZONE_NAME}",
+        "&",
+        f"lat={LOCATION_LATITUDE}",
+        "&",
+        f"lon={LOCATION_LONGITUDE}",
+        "&",
+        f"checktime={CHECK_TIME}",
+        "&",
+        f"offtime={LAMP_OFF_TIME}",
+        "&",
+        f"onrange={ON_RANGE}",
+        "&",
+        f"offrange={OFF_RANGE}",
+    ]
+
+    print("".join(url))
+    try:
         response = requests.get("".join(url))
-        info = json.loads(response.content)
+        try:
+            return response.json()
+        finally:
+            response.close()
+    except Exception as e:
+        print(f"Schedule request failed: {e}")
+        return None
 
-        tc.lamp_on_time = info["on_time_utc"]
-        print(f"LOnT: {tc.lamp_on_time}")
-        tc.lamp_off_time = info["off_time_utc"]
-        print(f"LOfT: {tc.lamp_off_time}")
-        tc.next_check_time = info["check_time_utc"]
-        print(f"CHKT: {tc.next_check_time}")
-        tc.initialized = True
 
-        main_group[0].text = info["date"]
-        main_group[4].text = info["sunrise_usno"]
-        main_group[6].text = info["sunset_usno"]
-        main_group[8].text = info["on_time"]
-        main_group[10].text = info["off_time"]
+async def time_setter() -> None:
+    check_event = asyncio.Event()
+    while True:
+        timestamp = int(get_current_time().timestamp())
+        print(timestamp)
+        print("Setting up conditions")
 
-        current_delta = get_seconds_from_now(tc.next_check_time)
-        print(f"Next check time in {current_delta} seconds")
-        await asyncio.sleep(current_delta)
-        tc.initialized = False
+        info = schedule_cache.current(timestamp)
+        if info is None and pool is not None:
+            info = fetch_schedule(timestamp)
+            if info is not None:
+                info = schedule_cache.store(info, SCHEDULE_DAYS)
+        if info is None:
+            print("Using local sunset")
+            info = schedule_cache.fallback(timestamp, RETRY_TIME)
+
+        print(f"LOnT: {info['on_time_utc']}")
+        print(f"LOfT: {info['off_time_utc']}")
+        print(f"CHKT: {info['check_time_utc']}")
+        # Replace all three together so no event runs with stale times.
+        if info["on_time_utc"] is None:
+            scheduler.cancel("lamp_on")
+            scheduler.cancel("lamp_off")
+            scheduler.schedule("check", info["check_time_utc"], check_event.set)
+        else:
+            scheduler.update(
+                [
+                    ("lamp_on", info["on_time_utc"], lamp_on, "lamp"),
+                    ("lamp_off", info["off_time_utc"], lamp_off, "lamp"),
+                    ("check", info["check_time_utc"], check_event.set),
+                ]
+            )
 
+        view.update(
+            date=info["date"],
+            sunrise=info["sunrise_usno"],
+            sunset=info["sunset_usno"],
+            on_time=info["on_time"],
+            off_time=info["off_time"],
+        )
 
-async def lamp_control(tc: TimerCondition) -> None:
-    while True:
-        while not tc.initialized:
-            print("Waiting for conditions")
-            await asyncio.sleep(1)
-        current_delta = get_seconds_from_now(tc.lamp_on_time)
-        print(f"Lamp on time in {current_delta} seconds")
-        await asyncio.sleep(current_delta)
-        print(f"Turning on lamp at {get_current_time()}")
-        current_delta = get_seconds_from_now(tc.lamp_off_time)
-        # GPIO on
-        power_relay_pin.value = True
-        print(f"Lamp off time in {current_delta} seconds")
-        await asyncio.sleep(current_delta)
-        print(f"Turning off lamp at {get_current_time()}")
-        # GPIO off
-        power_relay_pin.value = False
-        current_delta = get_seconds_from_now(tc.next_check_time) + 10
-        print(f"Next lamp control check in {current_delta} seconds")
-        await asyncio.sleep(current_delta)
+        await check_event.wait()
+        check_event.clear()
 
 
 async def measure_light() -> None:
+    light_measurements_and_tags = [os.getenv("MQTT_LIGHT_MEASUREMENT")]
+    battery_measurements_and_tags = [os.getenv("MQTT_BATTERY_MEASUREMENT")]
     while True:
-        if pool is not None:
-            writer = MqttHelper(os.getenv("MQTT_SENSOR_NAME"), pool, 120)
-            writer.mark_time()
+        if session is not None:
+            session.mark_time()
 
             (
                 battery_percent,
@@ -249,10 +273,8 @@ async def measure_light() -> None:
             gain = veml7700.gain_value()
             integration_time = veml7700.integration_time_value()
 
-            main_group[1].text = f"W: {white} adc"
-            main_group[2].text = f"L: {autolux:.2f} lux"
+            view.update(white=f"W: {white} adc", lux=f"L: {autolux:.2f} lux")
 
-            light_measurements_and_tags = [os.getenv("MQTT_LIGHT_MEASUREMENT")]
             light_fields = Fields(
                 light=light,
                 lux=lux,
@@ -262,47 +284,51 @@ async def measure_light() -> None:
                 integration_time=integration_time,
             )
 
-            battery_measurements_and_tags = [os.getenv("MQTT_BATTERY_MEASUREMENT")]
             battery_fields = Fields(
                 percent=battery_percent,
                 voltage=battery_voltage,
                 temperature=battery_temperature,
             )
 
-            writer.publish(light_measurements_and_tags, light_fields)
-            writer.publish(battery_measurements_and_tags, battery_fields)
-
-            writer.client.disconnect()
+            session.add(light_measurements_and_tags, light_fields)
+            session.add(battery_measurements_and_tags, battery_fields)
+            session.flush()
 
         await asyncio.sleep(MEASURE_TIME)
 
 
-async def monitor_buttons(evt: asyncio.Event) -> None:
-    evt.set()
-    while True:
-        if display_off_btn.value:
-            main_display.root_group = None
+async def monitor_buttons(timer: DeadlineTimer) -> None:
+    timer.start(DISPLAY_TIMEOUT)
+    async for button in buttons:
+        if button == DISPLAY_OFF_BUTTON:
+            view.hide()
             main_display.brightness = 0.0
-            evt.clear()
-        if display_on_btn.value:
+            timer.cancel()
+        elif button == DISPLAY_ON_BUTTON:
             if main_display.brightness != 1.0:
                 main_display.brightness = 1.0
-            main_display.root_group = main_group
-            evt.set()
-        await asyncio.sleep(0)
+            view.show()
+            # Every press gives the full timeout again.
+            timer.start(DISPLAY_TIMEOUT)
 
 
 async def main():
     print("Setup")
-    tc = TimerCondition()
-    display_event = asyncio.Event()
-    await asyncio.gather(
-        time_setter(tc),
-        lamp_control(tc),
+    display_timer = DeadlineTimer()
+    tasks = [
+        time_setter(),
+        scheduler.run(),
         measure_light(),
-        monitor_buttons(display_event),
-        dim_screen(display_event),
-    )
+        monitor_buttons(display_timer),
+        dim_screen(display_timer),
+    ]
+    if session is not None:
+        tasks.append(session.run())
+    if pool is not None:
+        scheduler.schedule(
+            "resync", get_current_time().timestamp() + RESYNC_TIME, resync_clock
+        )
+    await asyncio.gather(*tasks)
 
 
 asyncio.run(main())
@@ -11,10 +11,12 @@ import time
 from aio_helper import AioHelper
 from battery_helper import BatteryHelper
 import power_helper
+import wake_timer
 import wifi_helper
 
 ALARM_TIME = 5 * 60
 GROUP_FEED = os.getenv("ADAFRUIT_AIO_GROUP")
+DIAGNOSTIC_FEED = os.getenv("ADAFRUIT_AIO_DIAGNOSTIC_FEED")
 
 # Defaults for values
 light = None
@@ -23,7 +25,10 @@ white = None
 gain = None
 integration_time = None
 
-pool = wifi_helper.setup_wifi_and_rtc(start_delay=True, num_retries=1)
+# Sleep memory holds the wifi state, then the wake times.
+timer = wake_timer.WakeTimer(offset=wifi_helper.SLEEP_MEMORY_SIZE)
+
+pool = wifi_helper.setup_wifi_and_rtc(start_delay=True, num_retries=1, timer=timer)
 
 if pool is not None:
     power_helper.neopixel_power(False)
@@ -31,10 +36,10 @@ if pool is not None:
     time.sleep(5)
 
     i2c = board.STEMMA_I2C()
-    battery_monitor = BatteryHelper(i2c)
+    battery_monitor = BatteryHelper(i2c, timer)
     veml7700 = adafruit_veml7700.VEML7700(i2c)
 
-    writer = AioHelper(pool)
+    writer = AioHelper(pool, timer=timer)
 
     battery_percent, battery_voltage, battery_temperature = battery_monitor.measure()
     writer.publish(f"{GROUP_FEED}.ls-battery-percent", battery_percent)
@@ -45,6 +50,7 @@ if pool is not None:
     white = veml7700.white
     gain = veml7700.gain_value()
     integration_time = veml7700.integration_time_value()
+    timer.mark("sensor")
 
     writer.publish(f"{GROUP_FEED}.light", light)
     writer.publish(f"{GROUP_FEED}.autolux", autolux)
@@ -52,6 +58,10 @@ if pool is not None:
     writer.publish(f"{GROUP_FEED}.gain", gain)
     writer.publish(f"{GROUP_FEED}.integration-time", integration_time)
 
+    # The whole of the previous wake, the current one is still running.
+    if DIAGNOSTIC_FEED is not None:
+        writer.publish(f"{GROUP_FEED}.{DIAGNOSTIC_FEED}", timer.last_wake())
+
     # Delay to ensure last value gets published
     time.sleep(1)
 
@@ -59,4 +69,5 @@ alarm_time = time.monotonic() + ALARM_TIME
 print(f"Alarm time: {alarm_time}")
 
 time_alarm = alarm.time.TimeAlarm(monotonic_time=alarm_time)
+timer.sleep()
 alarm.exit_and_deep_sleep_until_alarms(time_alarm)
@@ -29,6 +29,10 @@ veml7700.light_integration_time = veml7700.ALS_100MS
 
 writer = MqttHelper(os.getenv("MQTT_SENSOR_NAME"), pool, WAIT_TIME + 10)
 
+# The encoder leaves these alone, so they are built once for the loop.
+battery_measurements_and_tags = [os.getenv("MQTT_BATTERY_MEASUREMENT")]
+light_measurements_and_tags = [os.getenv("MQTT_LIGHT_MEASUREMENT")]
+
 while True:
     writer.mark_time()
 
@@ -41,14 +45,12 @@ while True:
     gain = veml7700.gain_value()
     integration_time = veml7700.integration_time_value()
 
-    battery_measurements_and_tags = [os.getenv("MQTT_BATTERY_MEASUREMENT")]
     battery_fields = Fields(
         percent=battery_percent,
         voltage=battery_voltage,
         temperature=battery_temperature,
     )
 
-    light_measurements_and_tags = [os.getenv("MQTT_LIGHT_MEASUREMENT")]
     light_fields = Fields(
         light=light,
         lux=lux,
@@ -58,7 +60,8 @@ while True:
         integration_time=integration_time,
     )
 
-    writer.publish(battery_measurements_and_tags, battery_fields)
-    writer.publish(light_measurements_and_tags, light_fields)
+    writer.add(battery_measurements_and_tags, battery_fields)
+    writer.add(light_measurements_and_tags, light_fields)
+    writer.flush()
 
     veml7700.wait_autolux(WAIT_TIME)
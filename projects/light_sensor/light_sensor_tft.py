@@ -7,13 +7,13 @@ from adafruit_display_text import bitmap_label
 import adafruit_ntp
 import adafruit_veml7700
 import board
-from displayio import Group
 import os
 import rtc
 import socketpool
 import wifi
 
 from battery_helper import BatteryHelper
+from display_view import DisplayView
 from mqtt_helper import Fields, MqttHelper
 
 WAIT_TIME = 5 * 60
@@ -25,13 +25,18 @@ white = None
 gain = None
 integration_time = None
 
-font = bitmap_font.load_font("fonts/SpartanMB-Regular-12.bdf")
-text_area = bitmap_label.Label(font, scale=1, line_spacing=1.0)
-text_area.anchor_point = (0, 0.5)
-text_area.anchored_position = (0, board.DISPLAY.height // 2)
-main_group = Group()
-main_group.append(text_area)
-board.DISPLAY.show(main_group)
+font = bitmap_font.load_font("fonts/SpartanMB-Regular-12-subset.pcf")
+view = DisplayView(board.DISPLAY)
+# One label per line, stacked around the middle of the screen.
+LABEL_NAMES = ("light", "lux", "white", "gain", "integration_time")
+line_height = font.get_bounding_box()[1]
+top = board.DISPLAY.height // 2 - len(LABEL_NAMES) * line_height // 2
+for line, name in enumerate(LABEL_NAMES):
+    label = bitmap_label.Label(font, scale=1)
+    label.anchor_point = (0, 0.5)
+    label.anchored_position = (0, top + line * line_height + line_height // 2)
+    view.add(name, label)
+view.show()
 
 pool = socketpool.SocketPool(wifi.radio)
 ntp = adafruit_ntp.NTP(pool, tz_offset=0)
@@ -45,6 +50,10 @@ veml7700.light_integration_time = veml7700.ALS_100MS
 
 writer = MqttHelper(os.getenv("MQTT_SENSOR_NAME"), pool, WAIT_TIME + 10)
 
+# The encoder leaves these alone, so they are built once for the loop.
+battery_measurements_and_tags = [os.getenv("MQTT_BATTERY_MEASUREMENT")]
+light_measurements_and_tags = [os.getenv("MQTT_LIGHT_MEASUREMENT")]
+
 while True:
     writer.mark_time()
 
@@ -56,24 +65,20 @@ while True:
     gain = veml7700.gain_value()
     integration_time = veml7700.integration_time_value()
 
-    text = [
-        f"ALS:     {light}",
-        f"Lux:     {lux:.2f}",
-        f"White:   {white}",
-        f"Gain:    {gain}",
-        f"IntTime: {integration_time}",
-    ]
-
-    text_area.text = "\n".join(text)
+    view.update(
+        light=f"ALS:     {light}",
+        lux=f"Lux:     {lux:.2f}",
+        white=f"White:   {white}",
+        gain=f"Gain:    {gain}",
+        integration_time=f"IntTime: {integration_time}",
+    )
 
-    battery_measurements_and_tags = [os.getenv("MQTT_BATTERY_MEASUREMENT")]
     battery_fields = Fields(
         percent=battery_percent,
         voltage=battery_voltage,
         temperature=battery_temperature,
     )
 
-    light_measurements_and_tags = [os.getenv("MQTT_LIGHT_MEASUREMENT")]
     light_fields = Fields(
         light=light,
         lux=lux,
@@ -82,7 +87,8 @@ while True:
         integration_time=integration_time,
     )
 
-    writer.publish(battery_measurements_and_tags, battery_fields)
-    writer.publish(light_measurements_and_tags, light_fields)
+    writer.add(battery_measurements_and_tags, battery_fields)
+    writer.add(light_measurements_and_tags, light_fields)
+    writer.flush()
 
     veml7700.wait_autolux(WAIT_TIME)
@@ -80,8 +80,9 @@ if pool is not None:
             water_temperature=water_temperature,
         )
 
-        writer.publish(battery_measurements_and_tags, battery_fields)
-        writer.publish(environment_measurements_and_tags, environment_fields)
+        writer.add(battery_measurements_and_tags, battery_fields)
+        writer.add(environment_measurements_and_tags, environment_fields)
+        writer.flush()
 
         time.sleep(5)
     except Exception as e:
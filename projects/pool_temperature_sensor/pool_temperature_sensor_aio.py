@@ -13,6 +13,7 @@ import time
 from aio_helper import AioHelper
 from battery_helper import BatteryHelper
 import power_helper
+import wake_timer
 import wifi_helper
 
 ALARM_TIME = 5 * 60  # seconds
@@ -21,12 +22,16 @@ THERM_VDIV_RESISTOR = 10000.0  # ohms
 NOMINAL_THERM_TEMP = 25.0  # C
 THERM_BETA = 3950.0
 GROUP_FEED = os.getenv("ADAFRUIT_AIO_GROUP")
+DIAGNOSTIC_FEED = os.getenv("ADAFRUIT_AIO_DIAGNOSTIC_FEED")
 
 # Defaults for values
 water_temperature = None
 battery_temperature = None
 
-pool = wifi_helper.setup_wifi_and_rtc(start_delay=True, num_retries=1)
+# Sleep memory holds the wifi state, then the wake times.
+timer = wake_timer.WakeTimer(offset=wifi_helper.SLEEP_MEMORY_SIZE)
+
+pool = wifi_helper.setup_wifi_and_rtc(start_delay=True, num_retries=1, timer=timer)
 
 if pool is not None:
     # power_helper.i2c_power(True)
@@ -48,9 +53,9 @@ if pool is not None:
         )
 
         i2c = board.STEMMA_I2C()
-        battery_monitor = BatteryHelper(i2c)
+        battery_monitor = BatteryHelper(i2c, timer)
 
-        writer = AioHelper(pool)
+        writer = AioHelper(pool, timer=timer)
         if writer.is_connected:
             battery_temperature = thermistor.temperature
             try:
@@ -58,6 +63,7 @@ if pool is not None:
             except RuntimeError:
                 print("Cannot read water temperature sensor")
                 pass
+            timer.mark("sensor")
 
             writer.publish(f"{GROUP_FEED}.temperature", water_temperature)
 
@@ -71,6 +77,10 @@ if pool is not None:
             writer.publish(f"{GROUP_FEED}.battery-voltage", battery_voltage)
             writer.publish(f"{GROUP_FEED}.battery-temperature", battery_temperature)
 
+            # The whole of the previous wake, the current one is still running.
+            if DIAGNOSTIC_FEED is not None:
+                writer.publish(f"{GROUP_FEED}.{DIAGNOSTIC_FEED}", timer.last_wake())
+
             print(battery_voltage)
             print(battery_percent)
             print(battery_temperature)
@@ -89,4 +99,5 @@ alarm_time = time.monotonic() + ALARM_TIME
 print(f"Alarm time: {alarm_time}")
 
 time_alarm = alarm.time.TimeAlarm(monotonic_time=alarm_time)
+timer.sleep()
 alarm.exit_and_deep_sleep_until_alarms(time_alarm)
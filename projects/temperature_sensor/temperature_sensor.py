@@ -7,56 +7,103 @@ import alarm
 import board
 import os
 import time
+import wifi
 
 from battery_helper import BatteryHelper
 from mqtt_helper import Fields, MqttHelper
 import power_helper
+from reading_queue import ReadingQueue
+from retry_helper import RetryPolicy
+import wake_timer
 import wifi_helper
 
 ALARM_TIME = 5 * 60  # seconds
+NETWORK_BUDGET = 20  # seconds
+PUBLISH_READINGS = 20
+# Settings are written as strings.
+TRANSMIT_EVERY = int(os.getenv("TRANSMIT_EVERY", 1))
+DIAGNOSTIC_MEASUREMENT = os.getenv("MQTT_DIAGNOSTIC_MEASUREMENT")
+BATTERY = 0
+ENVIRONMENT = 1
 
 # Defaults for values
 temperature = None
 relative_humidity = None
 
-pool = wifi_helper.setup_wifi_and_rtc(start_delay=True, num_retries=1)
+# Sleep memory holds the wifi state, then the wake times, then the queue.
+timer = wake_timer.WakeTimer(offset=wifi_helper.SLEEP_MEMORY_SIZE)
 
-if pool is not None:
-    # power_helper.i2c_power(True)
-    power_helper.neopixel_power(False)
+queue = ReadingQueue(
+    [
+        (
+            [os.getenv("MQTT_BATTERY_MEASUREMENT")],
+            ("percent", "voltage", "temperature"),
+        ),
+        (
+            [os.getenv("MQTT_ENVIRONMENT_MEASUREMENT")],
+            ("temperature", "relative_humidity"),
+        ),
+    ],
+    offset=wifi_helper.SLEEP_MEMORY_SIZE + wake_timer.SLEEP_MEMORY_SIZE,
+)
 
-    time.sleep(5)
+# One budget for joining wifi and the broker, so a bad access point or
+# broker costs a bounded amount of battery.
+policy = RetryPolicy(budget=NETWORK_BUDGET)
+pool = None
+if queue.transmit_due(TRANSMIT_EVERY):
+    pool = wifi_helper.setup_wifi_and_rtc(start_delay=True, policy=policy, timer=timer)
+else:
+    # Nothing to send this wake, keep the radio off.
+    wifi.radio.enabled = False
 
-    i2c = board.STEMMA_I2C()
-    battery_monitor = BatteryHelper(i2c)
-    temperature_sensor = adafruit_sht4x.SHT4x(i2c)
+# power_helper.i2c_power(True)
+power_helper.neopixel_power(False)
 
-    writer = MqttHelper(os.getenv("MQTT_SENSOR_NAME"), pool, 120)
+time.sleep(5)
 
-    writer.mark_time()
+i2c = board.STEMMA_I2C()
+battery_monitor = BatteryHelper(i2c, timer)
+temperature_sensor = adafruit_sht4x.SHT4x(i2c)
 
-    battery_percent, battery_voltage, battery_temperature = battery_monitor.measure()
-    temperature, relative_humidity = temperature_sensor.measurements
+queue.push(BATTERY, battery_monitor.measure())
 
-    battery_measurements_and_tags = [os.getenv("MQTT_BATTERY_MEASUREMENT")]
-    battery_fields = Fields(
-        percent=battery_percent,
-        voltage=battery_voltage,
-        temperature=battery_temperature,
-    )
+temperature, relative_humidity = temperature_sensor.measurements
 
-    environment_measurements_and_tags = [os.getenv("MQTT_ENVIRONMENT_MEASUREMENT")]
-    environment_fields = Fields(
-        temperature=temperature, relative_humidity=relative_humidity
-    )
+queue.push(ENVIRONMENT, (temperature, relative_humidity))
+timer.mark("sensor")
 
-    writer.publish(battery_measurements_and_tags, battery_fields)
-    writer.publish(environment_measurements_and_tags, environment_fields)
+# power_helper.i2c_power(False)
+
+if pool is not None:
+    writer = MqttHelper(
+        os.getenv("MQTT_SENSOR_NAME"), pool, 120, policy=policy, timer=timer
+    )
 
-    # power_helper.i2c_power(False)
+    # Send everything stored while offline along with this reading, a few
+    # readings per publish so a long outage does not run out of memory.
+    if writer.client is not None:
+        if DIAGNOSTIC_MEASUREMENT is not None:
+            writer.mark_time()
+            writer.add([DIAGNOSTIC_MEASUREMENT], timer.fields())
+        while True:
+            sent = 0
+            for measurements_and_tags, values, timestamp in queue.readings(
+                PUBLISH_READINGS
+            ):
+                writer.add(measurements_and_tags, Fields(**values), timestamp)
+                sent += 1
+            if not writer.flush(qos=1):
+                break
+            queue.drop(sent)
+            if not len(queue):
+                break
+
+print(f"Readings stored: {len(queue)}")
 
 alarm_time = time.monotonic() + ALARM_TIME
 print(f"Alarm time: {alarm_time}")
 
 time_alarm = alarm.time.TimeAlarm(monotonic_time=alarm_time)
+timer.sleep()
 alarm.exit_and_deep_sleep_until_alarms(time_alarm)
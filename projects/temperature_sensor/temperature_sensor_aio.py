@@ -11,16 +11,21 @@ import time
 from aio_helper import AioHelper
 from battery_helper import BatteryHelper
 import power_helper
+import wake_timer
 import wifi_helper
 
 ALARM_TIME = 5 * 60  # seconds
 GROUP_FEED = os.getenv("ADAFRUIT_AIO_GROUP")
+DIAGNOSTIC_FEED = os.getenv("ADAFRUIT_AIO_DIAGNOSTIC_FEED")
 
 # Defaults for values
 temperature = None
 relative_humidity = None
 
-pool = wifi_helper.setup_wifi_and_rtc(start_delay=True, num_retries=1)
+# Sleep memory holds the wifi state, then the wake times.
+timer = wake_timer.WakeTimer(offset=wifi_helper.SLEEP_MEMORY_SIZE)
+
+pool = wifi_helper.setup_wifi_and_rtc(start_delay=True, num_retries=1, timer=timer)
 
 if pool is not None:
     # power_helper.i2c_power(True)
@@ -29,12 +34,13 @@ if pool is not None:
     time.sleep(5)
 
     i2c = board.STEMMA_I2C()
-    battery_monitor = BatteryHelper(i2c)
+    battery_monitor = BatteryHelper(i2c, timer)
     temperature_sensor = adafruit_sht4x.SHT4x(i2c)
 
-    writer = AioHelper(pool)
+    writer = AioHelper(pool, timer=timer)
     if writer.is_connected:
         temperature, relative_humidity = temperature_sensor.measurements
+        timer.mark("sensor")
 
         writer.publish(f"{GROUP_FEED}.temperature", (temperature * 1.8) + 32)
         writer.publish(f"{GROUP_FEED}.relative-humidity", relative_humidity)
@@ -51,6 +57,10 @@ if pool is not None:
         writer.publish(f"{GROUP_FEED}.battery-voltage", battery_voltage)
         writer.publish(f"{GROUP_FEED}.battery-temperature", battery_temperature)
 
+        # The whole of the previous wake, the current one is still running.
+        if DIAGNOSTIC_FEED is not None:
+            writer.publish(f"{GROUP_FEED}.{DIAGNOSTIC_FEED}", timer.last_wake())
+
         # Delay to ensure last value gets published
         time.sleep(1)
 
@@ -60,4 +70,5 @@ alarm_time = time.monotonic() + ALARM_TIME
 print(f"Alarm time: {alarm_time}")
 
 time_alarm = alarm.time.TimeAlarm(monotonic_time=alarm_time)
+timer.sleep()
 alarm.exit_and_deep_sleep_until_alarms(time_alarm)
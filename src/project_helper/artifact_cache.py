@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import contextlib
+import json
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Mapping
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from .board_manifest import file_hash
+
+__all__ = ["ArtifactCache", "ARTIFACT_CACHE_DIR", "DEFAULT_CACHE_SIZE"]
+
+ARTIFACT_CACHE_DIR = pathlib.Path("~/.cache/project_helper/artifacts")
+DEFAULT_CACHE_SIZE = 2048  # MiB
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+OBJECTS_DIR = "objects"
+MEGABYTE = 1024 * 1024
+
+
+class ArtifactCache:
+    def __init__(
+        self, cache_dir: pathlib.Path | None = None, max_size: int = DEFAULT_CACHE_SIZE
+    ):
+        """Class constructor.
+
+        Artifacts are stored once by SHA-256 and indexed by URL along with
+        the validators needed for conditional requests. The cache directory
+        can be shared between machines.
+
+        Parameters
+        ----------
+        cache_dir : pathlib.Path | None, optional
+            Alternate directory for the cache, by default None.
+        max_size : int, optional
+            The maximum size (MiB) of the stored artifacts, by default 2048.
+        """
+        if cache_dir is None:
+            cache_dir = ARTIFACT_CACHE_DIR
+        self.cache_dir = cache_dir.expanduser()
+        self.objects_dir = self.cache_dir / OBJECTS_DIR
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / INDEX_FILE
+        self.lock_file = self.cache_dir / LOCK_FILE
+        self.max_size = max_size * MEGABYTE
+        self.lock = threading.Lock()
+        self.index: dict[str, dict] = {}
+        with self._locked():
+            self._load_index()
+
+    def _evict(self) -> None:
+        """Remove least recently used artifacts until under the size limit."""
+        last_access: dict[str, float] = {}
+        sizes: dict[str, int] = {}
+        for entry in self.index.values():
+            sha = entry["sha256"]
+            last_access[sha] = max(last_access.get(sha, 0.0), entry["last_access"])
+            sizes[sha] = entry["size"]
+
+        total = sum(sizes.values())
+        for sha in sorted(last_access, key=last_access.get):
+            if total <= self.max_size:
+                break
+            (self.objects_dir / sha).unlink(missing_ok=True)
+            total -= sizes[sha]
+            self.index = {
+                url: entry
+                for url, entry in self.index.items()
+                if entry["sha256"] != sha
+            }
+
+    def _load_index(self) -> None:
+        """Read the cache index written by any process sharing the cache."""
+        try:
+            self.index = json.loads(self.index_file.read_text())
+        except (OSError, ValueError):
+            self.index = {}
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the index lock for this process and across processes.
+
+        Yields
+        ------
+        None
+            Control while the lock is held.
+        """
+        with self.lock, self.lock_file.open("a") as lfile:
+            if fcntl is not None:
+                fcntl.flock(lfile, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lfile, fcntl.LOCK_UN)
+
+    def _save_index(self) -> None:
+        """Atomically write the cache index."""
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as ofile:
+            json.dump(self.index, ofile, indent=1, sort_keys=True)
+        pathlib.Path(ofile.name).replace(self.index_file)
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Create the validator headers for a conditional request.
+
+        Parameters
+        ----------
+        url : str
+            The artifact URL.
+
+        Returns
+        -------
+        dict[str, str]
+            The request headers, empty if the URL is not cached.
+        """
+        with self._locked():
+            self._load_index()
+            entry = self.index.get(url)
+        if entry is None or not (self.objects_dir / entry["sha256"]).exists():
+            return {}
+        headers = {}
+        if entry["etag"] is not None:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"] is not None:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def fetch(self, url: str, destination: pathlib.Path) -> pathlib.Path | None:
+        """Place a cached artifact at the destination.
+
+        Parameters
+        ----------
+        url : str
+            The artifact URL.
+        destination : pathlib.Path
+            The file to create from the cached artifact.
+
+        Returns
+        -------
+        pathlib.Path | None
+            The destination, None if the URL is not cached.
+        """
+        with self._locked():
+            self._load_index()
+            entry = self.index.get(url)
+            if entry is None:
+                return None
+            artifact = self.objects_dir / entry["sha256"]
+            if not artifact.exists():
+                return None
+            destination.unlink(missing_ok=True)
+            try:
+                os.link(artifact, destination)
+            except OSError:
+                shutil.copy(artifact, destination)
+            entry["last_access"] = time.time()
+            self._save_index()
+        return destination
+
+    def store(
+        self, url: str, source_file: pathlib.Path, headers: Mapping[str, str]
+    ) -> None:
+        """Add a downloaded artifact to the cache.
+
+        Parameters
+        ----------
+        url : str
+            The artifact URL.
+        source_file : pathlib.Path
+            The downloaded artifact.
+        headers : Mapping[str, str]
+            The response headers containing the validators.
+        """
+        sha = file_hash(source_file)
+        artifact = self.objects_dir / sha
+        with self._locked():
+            self._load_index()
+            if not artifact.exists():
+                shutil.copy(source_file, artifact)
+            self.index[url] = {
+                "sha256": sha,
+                "size": artifact.stat().st_size,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "last_access": time.time(),
+            }
+            self._evict()
+            self._save_index()
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import dataclasses
+import hashlib
+import json
+import pathlib
+import shutil
+
+__all__ = ["BoardManifest", "SyncReport", "MANIFEST_FILE"]
+
+MANIFEST_FILE = ".project_manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_hash(file_path: pathlib.Path) -> str:
+    """Calculate the SHA-256 hash of a file.
+
+    Parameters
+    ----------
+    file_path : pathlib.Path
+        The file to hash.
+
+    Returns
+    -------
+    str
+        The hex digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with file_path.open("rb") as hfile:
+        for chunk in iter(lambda: hfile.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclasses.dataclass
+class SyncReport:
+    """Summary of a board synchronization."""
+
+    files_written: int = 0
+    bytes_written: int = 0
+    files_skipped: int = 0
+    bytes_skipped: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"Wrote {self.files_written} files ({self.bytes_written} bytes), "
+            f"skipped {self.files_skipped} files ({self.bytes_skipped} bytes)."
+        )
+
+
+class BoardManifest:
+    def __init__(self, board_location: pathlib.Path):
+        """Class constructor.
+
+        The manifest lives on the board so that it describes what is actually
+        there, no matter which machine did the last copy.
+
+        Parameters
+        ----------
+        board_location : pathlib.Path
+            The top-level directory of the board.
+        """
+        self.board_location = board_location
+        self.manifest_file = board_location / MANIFEST_FILE
+        self.entries: dict[str, dict] = {}
+        if self.manifest_file.exists():
+            try:
+                self.entries = json.loads(self.manifest_file.read_text())
+            except json.JSONDecodeError:
+                print(f"Ignoring corrupt manifest {self.manifest_file}")
+
+    def _is_current(self, source_hash: str, destination: str) -> bool:
+        """Check if the board copy of a file matches the source.
+
+        Parameters
+        ----------
+        source_hash : str
+            The hash of the source file.
+        destination : str
+            The board relative path of the file.
+
+        Returns
+        -------
+        bool
+            True if the board file is up to date, False if not.
+        """
+        entry = self.entries.get(destination)
+        if entry is None or entry["sha256"] != source_hash:
+            return False
+        # Cheap checks to catch files changed or removed behind our back.
+        board_file = self.board_location / destination
+        try:
+            stat = board_file.stat()
+        except FileNotFoundError:
+            return False
+        return stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]
+
+    def save(self) -> None:
+        """Write the manifest to the board."""
+        self.manifest_file.write_text(
+            json.dumps(self.entries, indent=1, sort_keys=True)
+        )
+
+    def sync(self, copy_plan: dict[str, pathlib.Path]) -> SyncReport:
+        """Copy only the files that differ from what is on the board.
+
+        Parameters
+        ----------
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+
+        Returns
+        -------
+        SyncReport
+            The summary of files written and skipped.
+        """
+        report = SyncReport()
+        try:
+            for destination, source in copy_plan.items():
+                source_hash = file_hash(source)
+                size = source.stat().st_size
+                if self._is_current(source_hash, destination):
+                    report.files_skipped += 1
+                    report.bytes_skipped += size
+                    continue
+                board_file = self.board_location / destination
+                board_file.parent.mkdir(0o755, parents=True, exist_ok=True)
+                shutil.copy(source, board_file)
+                self.entries[destination] = {
+                    "sha256": source_hash,
+                    "size": size,
+                    "mtime_ns": board_file.stat().st_mtime_ns,
+                }
+                report.files_written += 1
+                report.bytes_written += size
+        finally:
+            self.save()
+        return report
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import argparse
+import pathlib
+
+from .mpy_compiler import MPY_CROSS, MpyCompiler
+
+__all__ = ["runner"]
+
+
+def main(opts: argparse.Namespace) -> None:
+    sources = sorted(opts.module_dir.glob("*.py"))
+    compiler = MpyCompiler(opts.mpy_cross, max_workers=opts.jobs)
+    compiler.build(sources)
+
+
+def runner() -> None:
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "module_dir",
+        type=pathlib.Path,
+        nargs="?",
+        default=pathlib.Path("modules"),
+        help="Directory of modules to compile.",
+    )
+    parser.add_argument(
+        "--mpy-cross", default=MPY_CROSS, help="The mpy-cross executable."
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="The number of compiler processes."
+    )
+
+    args = parser.parse_args()
+
+    main(args)
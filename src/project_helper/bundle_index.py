@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import hashlib
+import json
+import pathlib
+import zipfile
+import zlib
+
+__all__ = ["BundleIndex", "BUNDLE_INDEX_FILE"]
+
+BUNDLE_INDEX_FILE = "library_index.json"
+LIB_DIR = "lib"
+REQUIREMENTS_DIR = "requirements"
+
+
+def _library_entry(
+    bundle: str, package: bool, members: list[tuple[str, int, int]]
+) -> dict:
+    """Create the index entry for a library.
+
+    Parameters
+    ----------
+    bundle : str
+        The name of the bundle containing the library.
+    package : bool
+        Flag for a library that is a directory instead of a single file.
+    members : list[tuple[str, int, int]]
+        The library relative names, CRC-32s and sizes of the library files.
+
+    Returns
+    -------
+    dict
+        The index entry, hashed over the member names, CRC-32s and sizes so
+        a zip bundle can be indexed without decompressing it.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    for name, crc, member_size in sorted(members):
+        digest.update(name.encode())
+        digest.update(crc.to_bytes(4, "little"))
+        digest.update(member_size.to_bytes(8, "little"))
+        size += member_size
+    return {
+        "bundle": bundle,
+        "package": package,
+        "size": size,
+        "sha256": digest.hexdigest(),
+        "members": [],
+    }
+
+
+class BundleIndex:
+    def __init__(self, libraries: dict[str, dict], extras: list[str]):
+        """Class constructor.
+
+        Parameters
+        ----------
+        libraries : dict[str, dict]
+            Mapping of library name to its bundle, package flag, size, hash
+            and bundle relative members.
+        extras : list[str]
+            Bundle relative members that do not belong to a library.
+        """
+        self.libraries = libraries
+        self.extras = extras
+
+    @classmethod
+    def from_directory(cls, bundle_dir: pathlib.Path) -> "BundleIndex":
+        """Create the index from an extracted bundle.
+
+        Parameters
+        ----------
+        bundle_dir : pathlib.Path
+            The top-level directory of the extracted bundle.
+
+        Returns
+        -------
+        BundleIndex
+            The index of the bundle contents.
+        """
+        libraries = {}
+        lib_dir = bundle_dir / LIB_DIR
+        for lib_path in sorted(lib_dir.iterdir()):
+            package = lib_path.is_dir()
+            if package:
+                files = [path for path in lib_path.rglob("*") if path.is_file()]
+            else:
+                files = [lib_path]
+            members = []
+            for path in files:
+                content = path.read_bytes()
+                members.append(
+                    (
+                        path.relative_to(lib_dir).as_posix(),
+                        zlib.crc32(content),
+                        len(content),
+                    )
+                )
+            entry = _library_entry(bundle_dir.name, package, members)
+            entry["members"] = [
+                f"{bundle_dir.name}/{LIB_DIR}/{name}" for name, _, _ in members
+            ]
+            libraries[lib_path.stem] = entry
+        return cls(libraries, [])
+
+    @classmethod
+    def from_zip(cls, zf: zipfile.ZipFile) -> "BundleIndex":
+        """Create the index from a bundle zip file.
+
+        Only the zip directory is read, no member is decompressed.
+
+        Parameters
+        ----------
+        zf : zipfile.ZipFile
+            The opened bundle.
+
+        Returns
+        -------
+        BundleIndex
+            The index of the bundle contents.
+        """
+        lib_members: dict[str, list[zipfile.ZipInfo]] = {}
+        other_members: dict[str, list[str]] = {}
+        extras: list[str] = []
+        bundle = ""
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            parts = pathlib.PurePosixPath(info.filename).parts
+            bundle = parts[0]
+            # Members look like <bundle>/lib/<library>[.mpy|/...]
+            if len(parts) > 2 and parts[1] == LIB_DIR:
+                name = pathlib.PurePosixPath(parts[2]).stem
+                lib_members.setdefault(name, []).append(info)
+            elif len(parts) > 2 and parts[1] == REQUIREMENTS_DIR:
+                other_members.setdefault(parts[2], []).append(info.filename)
+            else:
+                extras.append(info.filename)
+
+        libraries = {}
+        for name, infos in lib_members.items():
+            package = len(pathlib.PurePosixPath(infos[0].filename).parts) > 3
+            members = [
+                ("/".join(info.filename.split("/")[2:]), info.CRC, info.file_size)
+                for info in infos
+            ]
+            entry = _library_entry(bundle, package, members)
+            entry["members"] = [info.filename for info in infos]
+            entry["members"].extend(other_members.get(name, []))
+            libraries[name] = entry
+        return cls(libraries, extras)
+
+    @classmethod
+    def load(cls, index_file: pathlib.Path) -> "BundleIndex":
+        """Read a saved index.
+
+        Parameters
+        ----------
+        index_file : pathlib.Path
+            The saved index.
+
+        Returns
+        -------
+        BundleIndex
+            The index of the bundle contents.
+        """
+        content = json.loads(index_file.read_text())
+        return cls(content["libraries"], content["extras"])
+
+    def lookup(self, name: str) -> dict | None:
+        """Find a library in the bundle.
+
+        Parameters
+        ----------
+        name : str
+            The library to find.
+
+        Returns
+        -------
+        dict | None
+            The index entry for the library, None if not in the bundle.
+        """
+        return self.libraries.get(name)
+
+    def members(self, names: set[str]) -> list[str]:
+        """Get the zip members needed for a set of libraries.
+
+        Parameters
+        ----------
+        names : set[str]
+            The libraries to look up. Names not in the bundle are ignored.
+
+        Returns
+        -------
+        list[str]
+            The bundle members for the libraries plus the non-library files.
+        """
+        members = list(self.extras)
+        for name in sorted(names & self.libraries.keys()):
+            members.extend(self.libraries[name]["members"])
+        return members
+
+    def save(self, index_file: pathlib.Path) -> None:
+        """Write the index.
+
+        Parameters
+        ----------
+        index_file : pathlib.Path
+            The file to save the index to.
+        """
+        content = {"libraries": self.libraries, "extras": self.extras}
+        index_file.write_text(json.dumps(content, indent=1, sort_keys=True))
@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import ast
+
+__all__ = ["instrument", "summarize", "PROFILER_MODULE", "REPORT_FILE"]
+
+PROFILER_MODULE = "profiler"
+PROFILER_NAME = "_profiler"
+REPORT_FILE = "profile_report.txt"
+REPORT_PREFIX = "PROFILE:"
+SLEEP_CALL = "exit_and_deep_sleep_until_alarms"
+PHASES = {
+    "setup_wifi_and_rtc": "wifi",
+    "SocketPool": "wifi",
+    "NTP": "ntp",
+    "MqttHelper": "connect",
+    "AioHelper": "connect",
+    "publish": "publish",
+    "publish_multi": "publish",
+    "measure": "sensor",
+}
+
+
+def _call_names(node: ast.AST) -> list[str]:
+    """Get the names of the functions called in a statement.
+
+    Parameters
+    ----------
+    node : ast.AST
+        The statement to search.
+
+    Returns
+    -------
+    list[str]
+        The called function or method names.
+    """
+    names = []
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call):
+            if isinstance(child.func, ast.Name):
+                names.append(child.func.id)
+            elif isinstance(child.func, ast.Attribute):
+                names.append(child.func.attr)
+    return names
+
+
+def _label(node: ast.stmt) -> str:
+    """Create the profile label for a statement.
+
+    Parameters
+    ----------
+    node : ast.stmt
+        The statement to label.
+
+    Returns
+    -------
+    str
+        Import statements are labeled by module, calls into the helpers by
+        phase and everything else by line number.
+    """
+    if isinstance(node, ast.Import):
+        return "import " + ", ".join(alias.name for alias in node.names)
+    if isinstance(node, ast.ImportFrom):
+        return f"import {node.module}"
+    for name in _call_names(node):
+        if name in PHASES:
+            return PHASES[name]
+    return f"line {node.lineno}"
+
+
+def _profiler_call(method: str, *args: str) -> ast.stmt:
+    """Create a call to the profiler.
+
+    Parameters
+    ----------
+    method : str
+        The profiler method to call.
+    *args : str
+        The string arguments for the call.
+
+    Returns
+    -------
+    ast.stmt
+        The call statement.
+    """
+    arguments = ", ".join(repr(arg) for arg in args)
+    return ast.parse(f"{PROFILER_NAME}.{method}({arguments})").body[0]
+
+
+def _instrument_body(body: list[ast.stmt], in_loop: bool = False) -> list[ast.stmt]:
+    """Add profiler marks after each statement in a block.
+
+    Parameters
+    ----------
+    body : list[ast.stmt]
+        The statements of the block.
+    in_loop : bool, optional
+        Flag for a loop body, which writes the report every iteration, by
+        default False.
+
+    Returns
+    -------
+    list[ast.stmt]
+        The instrumented statements.
+    """
+    new_body = []
+    for node in body:
+        if SLEEP_CALL in _call_names(node):
+            new_body.append(_profiler_call("write"))
+        if isinstance(node, (ast.If, ast.For, ast.While, ast.With, ast.Try)):
+            loop = isinstance(node, (ast.For, ast.While))
+            node.body = _instrument_body(node.body, loop)
+            if getattr(node, "orelse", None):
+                node.orelse = _instrument_body(node.orelse)
+            if getattr(node, "finalbody", None):
+                node.finalbody = _instrument_body(node.finalbody)
+            for handler in getattr(node, "handlers", []):
+                handler.body = _instrument_body(handler.body)
+            new_body.append(node)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            # Definitions are cheap, the calls using them get the marks.
+            new_body.append(node)
+        else:
+            new_body.append(node)
+            new_body.append(_profiler_call("mark", _label(node)))
+    if in_loop:
+        new_body.append(_profiler_call("write"))
+    return new_body
+
+
+def instrument(source: str) -> str:
+    """Add import, phase and statement profiling to project code.
+
+    Top-level statements, and those nested in top-level conditionals,
+    loops and try blocks, are followed by a profiler mark. The report is
+    written at the end of the code, at the end of each top-level loop
+    iteration and before going into deep sleep. Functions and coroutines
+    are profiled as a whole by the statement calling them.
+
+    Parameters
+    ----------
+    source : str
+        The project code.
+
+    Returns
+    -------
+    str
+        The instrumented code.
+    """
+    tree = ast.parse(source)
+    prologue = ast.parse(
+        f"from {PROFILER_MODULE} import Profiler\n{PROFILER_NAME} = Profiler()"
+    ).body
+    tree.body = prologue + _instrument_body(tree.body)
+    tree.body.append(_profiler_call("write"))
+    return ast.unparse(ast.fix_missing_locations(tree)) + "\n"
+
+
+def summarize(lines: list[str]) -> list[str]:
+    """Summarize a profile report from the board or a serial log.
+
+    Parameters
+    ----------
+    lines : list[str]
+        The lines of the report or serial log.
+
+    Returns
+    -------
+    list[str]
+        The summary table ordered by time spent.
+    """
+    records: dict[str, list[int]] = {}
+    for line in lines:
+        line = line.strip()
+        if line.startswith(REPORT_PREFIX):
+            line = line.removeprefix(REPORT_PREFIX).strip()
+        parts = line.split("\t")
+        if len(parts) != 4 or not parts[1].isdigit():
+            continue
+        label, count, elapsed, memory = parts[0], *map(int, parts[1:])
+        # A serial log can hold several reports, keep the latest.
+        records[label] = [count, elapsed, memory]
+
+    total_time = sum(record[1] for record in records.values()) or 1
+    summary = [f"{'Label':<40} {'Count':>6} {'Time (ms)':>10} {'%':>6} {'Heap (B)':>9}"]
+    for label, (count, elapsed, memory) in sorted(
+        records.items(), key=lambda item: item[1][1], reverse=True
+    ):
+        summary.append(
+            f"{label[:40]:<40} {count:>6} {elapsed / 1e6:>10.1f} "
+            f"{100 * elapsed / total_time:>6.1f} {memory:>9}"
+        )
+    summary.append(f"{'Total':<40} {'':>6} {total_time / 1e6:>10.1f}")
+    return summary
@@ -4,16 +4,47 @@
 import argparse
 import pathlib
 
-__all__ = ["make_parser"]
+__all__ = ["make_parser", "positive_int"]
 
 
-def make_parser(use_option: bool = True) -> argparse.ArgumentParser:
+def positive_int(value: str) -> int:
+    """Convert an argument to an integer of at least 1.
+
+    Parameters
+    ----------
+    value : str
+        The argument text.
+
+    Returns
+    -------
+    int
+        The converted argument.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If the argument is not a whole number of at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not a whole number")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is less than 1")
+    return number
+
+
+def make_parser(
+    use_option: bool = True, multiple: bool = False
+) -> argparse.ArgumentParser:
     """Create a common parser for scripts.
 
     Parameters
     ----------
     use_option : bool
         Flag to create option or argument.
+    multiple : bool
+        Flag to allow the option to be given more than once.
 
     Returns
     -------
@@ -30,6 +61,7 @@ def make_parser(use_option: bool = True) -> argparse.ArgumentParser:
     parser.add_argument(
         option_name,
         type=pathlib.Path,
+        action="append" if multiple else "store",
         help="Alternate directory to test project installation.",
     )
 
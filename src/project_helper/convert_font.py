@@ -1,36 +1,127 @@
-# SPDX-FileCopyrightText: 2023-2025 Michael Reuter
+# SPDX-FileCopyrightText: 2023-2026 Michael Reuter
 #
 # SPDX-License-Identifier: MIT
 
 import argparse
+import concurrent.futures
 import pathlib
+import shutil
 import subprocess
+import tomllib
+
+from .font_builder import SUBSET_SUFFIX, FontBuilder, derive_glyphs
 
 __all__ = ["runner"]
 
 
-def main(opts: argparse.Namespace) -> None:
-    output_stem = opts.font_file.stem
-    output_font_file = pathlib.Path(f"{output_stem}-{opts.size}.bdf")
+def _sizes(value: str) -> list[int]:
+    return [int(size) for size in value.split(",")]
+
+
+def _otf2bdf(font_file: pathlib.Path, size: int) -> pathlib.Path:
+    """Render an outline font at one size.
+
+    Parameters
+    ----------
+    font_file : pathlib.Path
+        The outline font to convert.
+    size : int
+        The point size to render.
+
+    Returns
+    -------
+    pathlib.Path
+        The created BDF font.
+    """
+    output_font_file = pathlib.Path(f"{font_file.stem}-{size}.bdf")
 
     cmd = [
         "otf2bdf",
-        opts.font_file.name,
+        str(font_file),
         "-p",
-        str(opts.size),
+        str(size),
         "-o",
         output_font_file.name,
     ]
 
     subprocess.run(cmd)
+    return output_font_file
+
+
+def _project_glyphs(project_file: pathlib.Path) -> str:
+    """Collect the glyphs a project draws.
+
+    Parameters
+    ----------
+    project_file : pathlib.Path
+        The TOML file containing the project configuration.
+
+    Returns
+    -------
+    str
+        The glyphs from the project code and its extra media glyphs.
+    """
+    with project_file.open("rb") as pfile:
+        project_info = tomllib.load(pfile)
+    extra = project_info.get("media", {}).get("glyphs", "")
+    return derive_glyphs([project_file.parent / project_info["code"]], extra)
+
+
+def main(opts: argparse.Namespace) -> None:
+    bdf_files = []
+    outline_jobs = []
+    for font_file in opts.font_files:
+        if font_file.suffix == ".bdf":
+            bdf_files.append(font_file)
+        else:
+            outline_jobs.extend((font_file, size) for size in opts.size)
+
+    with concurrent.futures.ThreadPoolExecutor(opts.jobs) as executor:
+        bdf_files.extend(executor.map(lambda job: _otf2bdf(*job), outline_jobs))
+
+    glyphs = opts.glyphs or ""
+    if opts.project is not None:
+        glyphs += _project_glyphs(opts.project)
+    if not glyphs and not opts.pcf:
+        return
+
+    suffix = ".pcf" if opts.pcf else ".bdf"
+    glyphs = "".join(sorted(set(glyphs)))
+    jobs = [(bdf_file, glyphs, suffix) for bdf_file in bdf_files if bdf_file.exists()]
+    builder = FontBuilder(max_workers=opts.jobs)
+    for (bdf_file, _, _), built in builder.build(jobs).items():
+        stem = bdf_file.stem + (SUBSET_SUFFIX if opts.glyphs or opts.project else "")
+        output = pathlib.Path(stem + suffix)
+        shutil.copy(built, output)
+        print(f"Created {output} ({output.stat().st_size} bytes)")
 
 
 def runner() -> None:
     parser = argparse.ArgumentParser()
 
-    parser.add_argument("size", type=int, help="Font size to create.")
     parser.add_argument(
-        "font_file", type=pathlib.Path, help="The font file to convert."
+        "size", type=_sizes, help="Font size to create, or several as 12,14,16."
+    )
+    parser.add_argument(
+        "font_files",
+        nargs="+",
+        type=pathlib.Path,
+        help="The font files to convert. BDF files are only subset.",
+    )
+    parser.add_argument(
+        "-g", "--glyphs", help="Only keep these glyphs in the created fonts."
+    )
+    parser.add_argument(
+        "-p",
+        "--project",
+        type=pathlib.Path,
+        help="Only keep the glyphs the project configuration's code can draw.",
+    )
+    parser.add_argument(
+        "--pcf", action="store_true", help="Convert the created fonts to PCF."
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="The number of fonts to convert at once."
     )
 
     args = parser.parse_args()
@@ -4,37 +4,71 @@
 import argparse
 import pathlib
 
-from .common_parser import make_parser
-from .project_handler import CopyOptions, MqttInformation, ProjectHandler
+from .common_parser import make_parser, positive_int
+from .project_handler import (
+    CIRCUITPY_DIR,
+    BoardTarget,
+    CopyOptions,
+    MqttInformation,
+    ProjectHandler,
+)
 
 __all__ = ["runner"]
 
 
 def main(opts: argparse.ArgumentParser) -> None:
-    if opts.debug_dir is None:
-        debug_dir = opts.debug_dir
-    else:
-        debug_dir = opts.debug_dir.expanduser()
-
     copy_options = CopyOptions(
         code=opts.code,
         settings=opts.settings,
         dependencies=opts.dependencies,
         media=opts.media,
+        sync=opts.sync,
+        bundle_requirements=opts.bundle_requirements,
+        compile=opts.compile,
+        profile=opts.profile,
+        jobs=opts.jobs,
     )
 
+    sensor_names = opts.mqtt_sensor_name or [None]
+
     mqtt_info = MqttInformation(
         no_test=opts.mqtt_no_test,
-        sensor_name=opts.mqtt_sensor_name,
+        sensor_name=sensor_names[0],
         adafruitio_group=opts.adafruitio_group,
     )
 
+    debug_dirs = [debug_dir.expanduser() for debug_dir in opts.debug_dir or []]
+    debug_dir = debug_dirs[0] if debug_dirs else None
+
     ph = ProjectHandler(opts.project_file, copy_options, mqtt_info, debug_dir=debug_dir)
-    ph.copy_project()
+
+    locations = [debug_dir / CIRCUITPY_DIR for debug_dir in debug_dirs]
+    locations.extend(board.expanduser() for board in opts.board or [])
+    if opts.all_boards:
+        mounted = ph.discover_boards()
+        if not mounted:
+            raise RuntimeError(f"No mounted {CIRCUITPY_DIR} boards found.")
+        locations.extend(mounted)
+
+    boards = None
+    if locations:
+        if len(sensor_names) == 1:
+            sensor_names = sensor_names * len(locations)
+        if len(sensor_names) != len(locations):
+            raise RuntimeError(
+                "Give one mqtt-sensor-name or one for each of the "
+                f"{len(locations)} boards."
+            )
+        boards = [
+            BoardTarget(location, sensor_name)
+            for location, sensor_name in zip(locations, sensor_names)
+        ]
+
+    ph.copy_project(boards)
 
 
 def runner() -> None:
-    parser = make_parser()
+    parser = make_parser(multiple=True)
 
     parser.add_argument("project_file", type=pathlib.Path, help="Project file.")
 
@@ -49,13 +83,60 @@ def runner() -> None:
         "-m", "--media", action="store_true", help="Copy only the media."
     )
 
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Only copy files that differ from what is on the board.",
+    )
+
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile the local modules with mpy-cross before copying.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Add import time and heap profiling to the code.",
+    )
+
+    parser.add_argument(
+        "--bundle-requirements",
+        action="store_true",
+        help="Also follow library requirements listed in the bundles.",
+    )
+
     parser.add_argument(
         "--mqtt-no-test",
         action="store_true",
         help="Remove test prefixes to MQTT measurements",
     )
 
-    parser.add_argument("--mqtt-sensor-name", help="Set a MQTT sensor name.")
+    parser.add_argument(
+        "--board",
+        type=pathlib.Path,
+        action="append",
+        help="Mount point of a board to copy to. Can be given more than once.",
+    )
+    parser.add_argument(
+        "--all-boards",
+        action="store_true",
+        help="Copy to every mounted CIRCUITPY board.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=4,
+        help="The number of boards to copy to at the same time.",
+    )
+
+    parser.add_argument(
+        "--mqtt-sensor-name",
+        action="append",
+        help="Set a MQTT sensor name. Give one per board in board order.",
+    )
 
     parser.add_argument("--adafruitio-group", help="Set the Adafruit IO group feed.")
 
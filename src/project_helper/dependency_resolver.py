@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import hashlib
+import json
+import pathlib
+import tomllib
+
+__all__ = ["DependencyResolver", "LOCAL"]
+
+LOCAL = "local"
+RESOLUTION_CACHE_DIR = pathlib.Path("~/.cache/project_helper/resolution")
+REQUIREMENTS_DIR = "requirements"
+REQUIREMENTS_FILE = "requirements.txt"
+PYPI_PREFIXES = {
+    "adafruit_circuitpython_": "adafruit_",
+    "circuitpython_": "",
+}
+
+
+class DependencyResolver:
+    def __init__(
+        self,
+        modules_file: pathlib.Path,
+        project_file: pathlib.Path,
+        use_bundle_requirements: bool = False,
+        cache_dir: pathlib.Path | None = None,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        modules_file : pathlib.Path
+            The TOML file containing the module dependency information.
+        project_file : pathlib.Path
+            The TOML file containing the project configuration.
+        use_bundle_requirements : bool, optional
+            Flag to also follow the requirements shipped in the library
+            bundles, by default False.
+        cache_dir : pathlib.Path | None, optional
+            Alternate directory for the resolution cache, by default None.
+        """
+        self.modules_file = modules_file
+        self.project_file = project_file.expanduser()
+        self.use_bundle_requirements = use_bundle_requirements
+        if cache_dir is None:
+            cache_dir = RESOLUTION_CACHE_DIR
+        self.cache_dir = cache_dir.expanduser()
+
+        with self.modules_file.open("rb") as mfile:
+            self.module_info = tomllib.load(mfile)
+        with self.project_file.open("rb") as ifile:
+            self.project_info = tomllib.load(ifile)
+
+        self.bundles = [
+            name for name, info in self.module_info.items() if "bundle" in info
+        ]
+
+    def _bundle_location(self, bundle: str) -> pathlib.Path:
+        """Construct the top-level path for a library bundle.
+
+        Parameters
+        ----------
+        bundle : str
+            The bundle key from the modules information.
+
+        Returns
+        -------
+        pathlib.Path
+            The fully qualified, symlink resolved, bundle path.
+        """
+        info = self.module_info[bundle]
+        top_loc = pathlib.Path(info["module_location"]).expanduser()
+        return (top_loc / info["bundle"]).resolve()
+
+    def _bundle_requirements(self, bundle: str, name: str) -> list[tuple[str, str]]:
+        """Read the dependencies a bundle lists for one of its libraries.
+
+        Parameters
+        ----------
+        bundle : str
+            The bundle key from the modules information.
+        name : str
+            The library to get the requirements for.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The (bundle, library) dependencies found in the bundles.
+        """
+        requirements = (
+            self._bundle_location(bundle) / REQUIREMENTS_DIR / name / REQUIREMENTS_FILE
+        )
+        if not requirements.exists():
+            return []
+        dependencies = []
+        for line in requirements.read_text().splitlines():
+            package = line.split("#")[0].split(";")[0].strip()
+            for separator in "<>=!~[ ":
+                package = package.split(separator)[0]
+            library = package.lower().replace("-", "_").replace(".", "_")
+            for prefix, replacement in PYPI_PREFIXES.items():
+                if library.startswith(prefix):
+                    library = replacement + library.removeprefix(prefix)
+                    break
+            else:
+                # Host only packages like Adafruit-Blinka.
+                continue
+            for candidate in self.bundles:
+                lib_path = self._bundle_location(candidate) / "lib" / library
+                if lib_path.is_dir() or lib_path.with_suffix(".mpy").exists():
+                    dependencies.append((candidate, library))
+                    break
+        return dependencies
+
+    def _cache_key(self) -> str:
+        """Create the key identifying the inputs of a resolution.
+
+        Returns
+        -------
+        str
+            The hex digest of the resolution inputs.
+        """
+        digest = hashlib.sha256()
+        digest.update(self.modules_file.read_bytes())
+        digest.update(self.project_file.read_bytes())
+        if self.use_bundle_requirements:
+            for bundle in self.bundles:
+                digest.update(str(self._bundle_location(bundle)).encode())
+        return digest.hexdigest()
+
+    def _cache_file(self) -> pathlib.Path:
+        """Get the resolution cache file for the project file.
+
+        Returns
+        -------
+        pathlib.Path
+            The cache file.
+        """
+        project_id = hashlib.sha256(str(self.project_file.resolve()).encode())
+        return self.cache_dir / f"{project_id.hexdigest()[:16]}.json"
+
+    def _dependencies(self, node: tuple[str, str]) -> list[tuple[str, str]]:
+        """Get the direct dependencies of a module.
+
+        Parameters
+        ----------
+        node : tuple[str, str]
+            The (bundle, module) to get dependencies for.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The direct (bundle, module) dependencies.
+        """
+        _, name = node
+        dependencies = self._section_dependencies(self.module_info.get(name, {}))
+        if self.use_bundle_requirements and node[0] != LOCAL:
+            dependencies.extend(self._bundle_requirements(*node))
+        return dependencies
+
+    def _roots(self) -> list[tuple[str, str]]:
+        """Get the dependencies requested directly by the project.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The (bundle, module) dependencies.
+        """
+        roots = self._section_dependencies(self.module_info.get("defaults", {}))
+        roots.extend(self._section_dependencies(self.project_info.get("imports", {})))
+        return roots
+
+    def _section_dependencies(self, section: dict) -> list[tuple[str, str]]:
+        """Collect dependencies from a configuration section.
+
+        Parameters
+        ----------
+        section : dict
+            A section keyed by bundle name (or local) with lists of modules.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The (bundle, module) dependencies.
+        """
+        dependencies = []
+        for key in [LOCAL] + self.bundles:
+            dependencies.extend((key, name) for name in section.get(key, []))
+        return dependencies
+
+    def resolve(self) -> list[tuple[str, str]]:
+        """Resolve the full set of modules needed by the project.
+
+        The result is cached per project file and reused as long as the
+        module and project configurations do not change.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The (bundle, module) pairs, each dependency ordered before the
+            modules that need it.
+
+        Raises
+        ------
+        RuntimeError
+            If the dependencies contain a cycle.
+        """
+        cache_key = self._cache_key()
+        cache_file = self._cache_file()
+        if cache_file.exists():
+            cached = json.loads(cache_file.read_text())
+            if cached["key"] == cache_key:
+                return [tuple(node) for node in cached["closure"]]
+
+        closure: list[tuple[str, str]] = []
+        done: set[tuple[str, str]] = set()
+        visiting: list[tuple[str, str]] = []
+
+        def visit(node: tuple[str, str]) -> None:
+            if node in done:
+                return
+            if node in visiting:
+                cycle = " -> ".join(name for _, name in visiting + [node])
+                raise RuntimeError(f"Dependency cycle found: {cycle}")
+            visiting.append(node)
+            for dependency in self._dependencies(node):
+                visit(dependency)
+            visiting.pop()
+            done.add(node)
+            closure.append(node)
+
+        for root in self._roots():
+            visit(root)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"key": cache_key, "closure": closure}))
+
+        return closure
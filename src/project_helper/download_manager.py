@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import concurrent.futures
+import dataclasses
+import pathlib
+import threading
+import time
+
+import requests
+
+from .artifact_cache import ArtifactCache
+
+__all__ = ["DownloadJob", "DownloadManager"]
+
+CHUNK_SIZE = 64 * 1024
+PART_SUFFIX = ".part"
+REQUEST_TIMEOUT = 30  # seconds
+MEGABYTE = 1024 * 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class DownloadJob:
+    """Information for a single file download."""
+
+    url: str
+    save_dir: pathlib.Path
+    save_file: str
+
+
+class DownloadManager:
+    def __init__(self, max_workers: int = 4, cache: ArtifactCache | None = None):
+        """Class constructor.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The number of downloads to run at the same time, by default 4.
+        cache : ArtifactCache | None, optional
+            Cache to revalidate against before downloading, by default None.
+        """
+        self.max_workers = max_workers
+        self.cache = cache
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=max_workers, pool_maxsize=max_workers
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.bytes_downloaded = 0
+        self.start_time = 0.0
+        self.lock = threading.Lock()
+
+    def _check_download(self, resp: requests.Response) -> bool:
+        """Ensure the download completed successfully.
+
+        Parameters
+        ----------
+        resp : requests.Response
+            The response from the requests.get
+
+        Returns
+        -------
+        bool
+            True if download was successful, False if not.
+        """
+        return resp.ok and resp.status_code in (200, 206)
+
+    def _save_downloaded_file(
+        self, resp: requests.Response, part_file: pathlib.Path
+    ) -> None:
+        """Stream the response content to the partial download file.
+
+        Parameters
+        ----------
+        resp : requests.Response
+            The streaming response from the requests.get
+        part_file : pathlib.Path
+            The partial download file to write to. Content is appended if
+            the server honored the range request.
+        """
+        mode = "ab" if resp.status_code == 206 else "wb"
+        with part_file.open(mode) as sfile:
+            for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                sfile.write(chunk)
+                with self.lock:
+                    self.bytes_downloaded += len(chunk)
+
+    def download(
+        self, job: DownloadJob, revalidate: bool = True
+    ) -> pathlib.Path | None:
+        """Download a file, resuming a previous partial download.
+
+        Parameters
+        ----------
+        job : DownloadJob
+            The download information.
+        revalidate : bool, optional
+            Ask the server if the cached copy is current, by default True.
+
+        Returns
+        -------
+        pathlib.Path | None
+            Fully qualified save path, None if the download failed.
+        """
+        fq_save = job.save_dir / job.save_file
+        part_file = fq_save.with_name(fq_save.name + PART_SUFFIX)
+
+        headers = {}
+        if part_file.exists() and part_file.stat().st_size:
+            headers["Range"] = f"bytes={part_file.stat().st_size}-"
+        elif revalidate and self.cache is not None:
+            headers.update(self.cache.conditional_headers(job.url))
+
+        try:
+            with self.session.get(
+                job.url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT
+            ) as response:
+                if response.status_code == 304:
+                    cached = self.cache.fetch(job.url, fq_save)
+                    if cached is not None:
+                        return cached
+                    # Evicted since the request was made, get it again.
+                    return self.download(job, revalidate=False)
+                if response.status_code == 416:
+                    # Stale partial file, start over.
+                    part_file.unlink()
+                    return self.download(job)
+                if not self._check_download(response):
+                    return None
+                self._save_downloaded_file(response, part_file)
+                validators = response.headers
+        except requests.RequestException as e:
+            print(f"Problem downloading {job.url}: {e}")
+            if self.cache is not None:
+                return self.cache.fetch(job.url, fq_save)
+            return None
+
+        part_file.replace(fq_save)
+        if self.cache is not None:
+            self.cache.store(job.url, fq_save, validators)
+        return fq_save
+
+    def download_all(
+        self, jobs: list[DownloadJob]
+    ) -> dict[DownloadJob, pathlib.Path | None]:
+        """Download a set of files concurrently.
+
+        Parameters
+        ----------
+        jobs : list[DownloadJob]
+            The downloads to perform.
+
+        Returns
+        -------
+        dict[DownloadJob, pathlib.Path | None]
+            Mapping of download to save path, None for failed downloads.
+        """
+        results = {}
+        self.start_time = time.monotonic()
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+            futures = {executor.submit(self.download, job): job for job in jobs}
+            for future in concurrent.futures.as_completed(futures):
+                job = futures[future]
+                results[job] = future.result()
+                if results[job] is not None:
+                    print(f"{job.save_file} downloaded, {self.throughput()}")
+        return results
+
+    def throughput(self) -> str:
+        """Report the aggregate download throughput.
+
+        Returns
+        -------
+        str
+            The total downloaded and the rate across all downloads.
+        """
+        elapsed = max(time.monotonic() - self.start_time, 1e-6)
+        total = self.bytes_downloaded / MEGABYTE
+        return f"{total:.1f} MiB at {total / elapsed:.1f} MiB/s"
@@ -0,0 +1,291 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import ast
+import concurrent.futures
+import hashlib
+import pathlib
+import shutil
+import string
+import subprocess
+
+__all__ = ["FontBuilder", "derive_glyphs", "subset_bdf", "SUBSET_SUFFIX"]
+
+FONT_CACHE_DIR = pathlib.Path("~/.cache/project_helper/fonts")
+BDFTOPCF = "bdftopcf"
+SUBSET_SUFFIX = "-subset"
+# What a formatted value can turn into: numbers, times, dates and None.
+FIELD_GLYPHS = string.digits + " +-.:eE" + "None" + "nan" + "inf"
+# Calls taking strings that are not drawn.
+HIDDEN_CALLS = {
+    "print",
+    "getenv",
+    "load_font",
+    "OnDiskBitmap",
+    "open",
+    "add",
+    "schedule",
+    "cancel",
+}
+
+
+def _call_name(node: ast.Call) -> str | None:
+    """Get the name of the called function or method.
+
+    Parameters
+    ----------
+    node : ast.Call
+        The call.
+
+    Returns
+    -------
+    str | None
+        The name, None for other callables.
+    """
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def _strings(tree: ast.AST) -> list[str]:
+    """Get the text a program can put on screen.
+
+    Parameters
+    ----------
+    tree : ast.AST
+        The parsed program.
+
+    Returns
+    -------
+    list[str]
+        The string constants and the literal parts of f-strings, with the
+        field glyphs for each formatted value. Docstrings, subscript keys and
+        the arguments of calls that never reach the screen are left out.
+    """
+    hidden = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            hidden.add(id(node.value))
+        elif isinstance(node, ast.Subscript):
+            hidden.update(id(child) for child in ast.walk(node.slice))
+        elif isinstance(node, ast.Call) and _call_name(node) in HIDDEN_CALLS:
+            for arg in node.args + [keyword.value for keyword in node.keywords]:
+                hidden.update(id(child) for child in ast.walk(arg))
+
+    texts = []
+    for node in ast.walk(tree):
+        if id(node) in hidden:
+            continue
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            texts.append(node.value)
+        elif isinstance(node, ast.FormattedValue):
+            texts.append(FIELD_GLYPHS)
+    return texts
+
+
+def derive_glyphs(code_files: list[pathlib.Path], extra: str = "") -> str:
+    """Collect the glyphs a project can draw.
+
+    Parameters
+    ----------
+    code_files : list[pathlib.Path]
+        The program files to scan.
+    extra : str, optional
+        Glyphs to add for text that does not appear in the code, by default
+        none.
+
+    Returns
+    -------
+    str
+        The sorted printable glyphs.
+    """
+    glyphs = set(extra) | {" "}
+    for code_file in code_files:
+        for text in _strings(ast.parse(code_file.read_text())):
+            glyphs.update(text)
+    return "".join(sorted(glyph for glyph in glyphs if glyph.isprintable()))
+
+
+def subset_bdf(source: pathlib.Path, glyphs: str, output: pathlib.Path) -> int:
+    """Write a BDF font with only the given glyphs.
+
+    Parameters
+    ----------
+    source : pathlib.Path
+        The full BDF font.
+    glyphs : str
+        The glyphs to keep.
+    output : pathlib.Path
+        The subset BDF font to create.
+
+    Returns
+    -------
+    int
+        The number of glyphs kept.
+    """
+    wanted = {ord(glyph) for glyph in glyphs}
+    header = []
+    chars = []
+    block = None
+    for line in source.read_text(encoding="latin-1").splitlines():
+        if block is not None:
+            block.append(line)
+            if line.startswith("ENCODING"):
+                keep = int(line.split()[1]) in wanted
+            elif line.startswith("ENDCHAR"):
+                if keep:
+                    chars.extend(block)
+                block = None
+        elif line.startswith("STARTCHAR"):
+            block = [line]
+            keep = False
+        elif line.startswith("ENDFONT"):
+            break
+        elif not line.startswith("CHARS "):
+            header.append(line)
+
+    count = sum(1 for line in chars if line.startswith("STARTCHAR"))
+    lines = header + [f"CHARS {count}"] + chars + ["ENDFONT", ""]
+    output.write_text("\n".join(lines), encoding="latin-1")
+    return count
+
+
+def _build(
+    bdftopcf: str, source: pathlib.Path, glyphs: str, output: pathlib.Path
+) -> str:
+    """Create a subset font, converting it to PCF if the output asks for it.
+
+    Parameters
+    ----------
+    bdftopcf : str
+        The bdftopcf executable.
+    source : pathlib.Path
+        The full BDF font.
+    glyphs : str
+        The glyphs to keep, empty to keep the whole font.
+    output : pathlib.Path
+        The BDF or PCF font to create.
+
+    Returns
+    -------
+    str
+        The error output, empty on success.
+    """
+    subset = output.with_suffix(".subset.bdf")
+    try:
+        if glyphs:
+            subset_bdf(source, glyphs, subset)
+        else:
+            shutil.copy(source, subset)
+        if output.suffix != ".pcf":
+            subset.replace(output)
+            return ""
+        temp_output = output.with_suffix(".tmp")
+        result = subprocess.run(
+            [bdftopcf, "-o", str(temp_output), str(subset)],
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, ValueError) as e:
+        return str(e)
+    finally:
+        subset.unlink(missing_ok=True)
+    if result.returncode:
+        temp_output.unlink(missing_ok=True)
+        return result.stderr or result.stdout
+    temp_output.replace(output)
+    return ""
+
+
+class FontBuilder:
+    def __init__(
+        self,
+        bdftopcf: str = BDFTOPCF,
+        cache_dir: pathlib.Path | None = None,
+        max_workers: int | None = None,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        bdftopcf : str, optional
+            The bdftopcf executable, by default bdftopcf.
+        cache_dir : pathlib.Path | None, optional
+            Alternate directory for the built font cache, by default None.
+        max_workers : int | None, optional
+            The number of fonts to build at once, by default the CPU count.
+        """
+        self.bdftopcf = bdftopcf
+        if cache_dir is None:
+            cache_dir = FONT_CACHE_DIR
+        self.cache_dir = cache_dir.expanduser()
+        self.max_workers = max_workers
+
+    def _cache_file(
+        self, source: pathlib.Path, glyphs: str, suffix: str
+    ) -> pathlib.Path:
+        """Get the cache location for a built font.
+
+        Parameters
+        ----------
+        source : pathlib.Path
+            The full BDF font.
+        glyphs : str
+            The glyphs to keep.
+        suffix : str
+            The font format, .bdf or .pcf.
+
+        Returns
+        -------
+        pathlib.Path
+            The built font keyed by source content and glyphs.
+        """
+        digest = hashlib.sha256(glyphs.encode())
+        digest.update(source.read_bytes())
+        return self.cache_dir / f"{digest.hexdigest()}{suffix}"
+
+    def build(
+        self, jobs: list[tuple[pathlib.Path, str, str]]
+    ) -> dict[tuple[pathlib.Path, str, str], pathlib.Path]:
+        """Build subset fonts, reusing cached results.
+
+        Parameters
+        ----------
+        jobs : list[tuple[pathlib.Path, str, str]]
+            The full BDF font, glyphs (empty for all) and output format
+            (.bdf or .pcf) of each font.
+
+        Returns
+        -------
+        dict[tuple[pathlib.Path, str, str], pathlib.Path]
+            Mapping of job to built font in the cache.
+
+        Raises
+        ------
+        RuntimeError
+            If any of the fonts fail to build.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        built = {job: self._cache_file(*job) for job in jobs}
+        needed = [job for job, output in built.items() if not output.exists()]
+
+        errors = []
+        if needed:
+            with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _build, self.bdftopcf, job[0], job[1], built[job]
+                    ): job
+                    for job in needed
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    error = future.result()
+                    if error:
+                        errors.append(f"{futures[future][0].name}: {error.strip()}")
+
+        print(f"Built {len(needed)} fonts, {len(jobs) - len(needed)} cached.")
+        if errors:
+            raise RuntimeError("Font build failed:\n" + "\n".join(errors))
+        return built
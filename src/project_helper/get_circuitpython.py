@@ -2,15 +2,31 @@
 #
 # SPDX-License-Identifier: MIT
 import argparse
+import pathlib
 
-from .common_parser import make_parser
+from .artifact_cache import DEFAULT_CACHE_SIZE
+from .common_parser import make_parser, positive_int
 from .project_handler import DownloadOptions, ProjectHandler
 
 __all__ = ["runner"]
 
 
 def main(opts: argparse.Namespace) -> None:
-    dl = DownloadOptions(opts.boards, opts.cross_compiler, opts.bundles)
+    if opts.cache_dir is None:
+        cache_dir = opts.cache_dir
+    else:
+        cache_dir = opts.cache_dir.expanduser()
+
+    dl = DownloadOptions(
+        opts.boards,
+        opts.cross_compiler,
+        opts.bundles,
+        jobs=opts.jobs,
+        use_cache=not opts.no_cache,
+        cache_dir=cache_dir,
+        cache_size=opts.cache_size,
+        selective=opts.selective,
+    )
     ph = ProjectHandler(download_options=dl)
     ph.get_circuitpython(opts.circuitpython_version, opts.bundle_date)
 
@@ -41,5 +57,34 @@ def runner() -> None:
         help="Download new CircuitPython bundles.",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=4,
+        help="The number of downloads to run at the same time.",
+    )
+
+    parser.add_argument(
+        "-s",
+        "--selective",
+        action="store_true",
+        help="Only extract the bundle libraries the projects reference.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=pathlib.Path,
+        help="Alternate directory for the shared download cache.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help="Maximum size (MiB) of the download cache.",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Do not use the download cache."
+    )
+
     args = parser.parse_args()
     main(args)
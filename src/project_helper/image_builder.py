@@ -0,0 +1,258 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import concurrent.futures
+import hashlib
+import pathlib
+import struct
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+__all__ = ["ImageBuilder", "write_bmp"]
+
+IMAGE_CACHE_DIR = pathlib.Path("~/.cache/project_helper/images")
+MAX_COLORS = 256
+# Change when the output for the same input changes.
+BUILD_VERSION = b"1"
+PIXELS_PER_METRE = 2835
+
+
+def _bit_depth(colors: int) -> int:
+    """Get the smallest BMP palette depth for a number of colors.
+
+    Parameters
+    ----------
+    colors : int
+        The number of palette colors.
+
+    Returns
+    -------
+    int
+        The bits per pixel.
+    """
+    if colors <= 2:
+        return 1
+    if colors <= 16:
+        return 4
+    return 8
+
+
+def write_bmp(
+    output: pathlib.Path,
+    size: tuple[int, int],
+    palette: list[tuple[int, int, int]],
+    pixels: bytes,
+) -> None:
+    """Write a palette indexed BMP with the fewest bits per pixel.
+
+    Parameters
+    ----------
+    output : pathlib.Path
+        The BMP file to create.
+    size : tuple[int, int]
+        The width and height of the image.
+    palette : list[tuple[int, int, int]]
+        The RGB colors of the palette.
+    pixels : bytes
+        The palette index of each pixel, row by row from the top.
+    """
+    width, height = size
+    depth = _bit_depth(len(palette))
+    per_byte = 8 // depth
+    row_size = (width * depth + 31) // 32 * 4
+    rows = []
+    # BMP rows run from the bottom up.
+    for y in range(height - 1, -1, -1):
+        row = bytearray(row_size)
+        for x in range(width):
+            shift = 8 - depth * (x % per_byte + 1)
+            row[x // per_byte] |= pixels[y * width + x] << shift
+        rows.append(bytes(row))
+    image_data = b"".join(rows)
+    color_table = b"".join(bytes((b, g, r, 0)) for r, g, b in palette)
+
+    offset = 14 + 40 + len(color_table)
+    file_header = struct.pack("<2sIHHI", b"BM", offset + len(image_data), 0, 0, offset)
+    info_header = struct.pack(
+        "<IiiHHIIiiII",
+        40,
+        width,
+        height,
+        1,
+        depth,
+        0,
+        len(image_data),
+        PIXELS_PER_METRE,
+        PIXELS_PER_METRE,
+        len(palette),
+        len(palette),
+    )
+    output.write_bytes(file_header + info_header + color_table + image_data)
+
+
+def _index(image) -> tuple[list[tuple[int, int, int]], bytes]:
+    """Turn an image into a palette and pixel indexes.
+
+    Images with up to 256 colors keep them exactly, the most used color
+    first. Others are quantized to 256 colors.
+
+    Parameters
+    ----------
+    image : PIL.Image.Image
+        The image to index.
+
+    Returns
+    -------
+    tuple[list[tuple[int, int, int]], bytes]
+        The palette and the index of each pixel.
+    """
+    rgb = image.convert("RGB")
+    colors = rgb.getcolors(MAX_COLORS)
+    if colors is None:
+        quantized = rgb.quantize(MAX_COLORS)
+        flat = quantized.getpalette()[: 3 * MAX_COLORS]
+        palette = [tuple(flat[i : i + 3]) for i in range(0, len(flat), 3)]
+        return palette, quantized.tobytes()
+    palette = [color for _, color in sorted(colors, key=lambda item: -item[0])]
+    lookup = {bytes(color): index for index, color in enumerate(palette)}
+    data = rgb.tobytes()
+    return palette, bytes(lookup[data[i : i + 3]] for i in range(0, len(data), 3))
+
+
+def _build(
+    sources: tuple[pathlib.Path, ...],
+    size: tuple[int, int] | None,
+    output: pathlib.Path,
+) -> str:
+    """Create an indexed BMP from one image or a sprite sheet from several.
+
+    Parameters
+    ----------
+    sources : tuple[pathlib.Path, ...]
+        The images to convert, side by side in order for a sprite sheet.
+    size : tuple[int, int] | None
+        The width and height of each image, None to keep the size of the
+        first image.
+    output : pathlib.Path
+        The BMP file to create.
+
+    Returns
+    -------
+    str
+        The error output, empty on success.
+    """
+    try:
+        sheet = None
+        for position, source in enumerate(sources):
+            with Image.open(source) as image:
+                if size is None:
+                    size = image.size
+                if sheet is None:
+                    sheet = Image.new("RGB", (size[0] * len(sources), size[1]))
+                if image.size != size:
+                    image = image.resize(size, Image.Resampling.NEAREST)
+                sheet.paste(image.convert("RGB"), (position * size[0], 0))
+        palette, pixels = _index(sheet)
+        temp_output = output.with_suffix(".tmp")
+        write_bmp(temp_output, sheet.size, palette, pixels)
+        temp_output.replace(output)
+    except (OSError, ValueError) as e:
+        return str(e)
+    return ""
+
+
+class ImageBuilder:
+    def __init__(
+        self, cache_dir: pathlib.Path | None = None, max_workers: int | None = None
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        cache_dir : pathlib.Path | None, optional
+            Alternate directory for the built image cache, by default None.
+        max_workers : int | None, optional
+            The number of images to build at once, by default the CPU count.
+
+        Raises
+        ------
+        RuntimeError
+            If Pillow is not installed.
+        """
+        if Image is None:
+            raise RuntimeError(
+                "Optimizing images needs Pillow, install project_helper[images]."
+            )
+        if cache_dir is None:
+            cache_dir = IMAGE_CACHE_DIR
+        self.cache_dir = cache_dir.expanduser()
+        self.max_workers = max_workers
+
+    def _cache_file(
+        self, sources: tuple[pathlib.Path, ...], size: tuple[int, int] | None
+    ) -> pathlib.Path:
+        """Get the cache location for a built image.
+
+        Parameters
+        ----------
+        sources : tuple[pathlib.Path, ...]
+            The images to convert.
+        size : tuple[int, int] | None
+            The width and height of each image.
+
+        Returns
+        -------
+        pathlib.Path
+            The built image keyed by source content and size.
+        """
+        digest = hashlib.sha256(BUILD_VERSION)
+        digest.update(repr(size).encode())
+        for source in sources:
+            digest.update(hashlib.sha256(source.read_bytes()).digest())
+        return self.cache_dir / f"{digest.hexdigest()}.bmp"
+
+    def build(
+        self, jobs: list[tuple[tuple[pathlib.Path, ...], tuple[int, int] | None]]
+    ) -> dict[tuple[tuple[pathlib.Path, ...], tuple[int, int] | None], pathlib.Path]:
+        """Build indexed BMPs, reusing cached results.
+
+        Parameters
+        ----------
+        jobs : list[tuple[tuple[pathlib.Path, ...], tuple[int, int] | None]]
+            The source images and size of each image to build. More than one
+            source makes a sprite sheet.
+
+        Returns
+        -------
+        dict[tuple[tuple[pathlib.Path, ...], tuple[int, int] | None], pathlib.Path]
+            Mapping of job to built image in the cache.
+
+        Raises
+        ------
+        RuntimeError
+            If any of the images fail to build.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        built = {job: self._cache_file(*job) for job in jobs}
+        needed = [job for job, output in built.items() if not output.exists()]
+
+        errors = []
+        if needed:
+            with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+                futures = {
+                    executor.submit(_build, job[0], job[1], built[job]): job
+                    for job in needed
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    error = future.result()
+                    if error:
+                        names = ", ".join(source.name for source in futures[future][0])
+                        errors.append(f"{names}: {error.strip()}")
+
+        print(f"Built {len(needed)} images, {len(jobs) - len(needed)} cached.")
+        if errors:
+            raise RuntimeError("Image build failed:\n" + "\n".join(errors))
+        return built
@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import concurrent.futures
+import hashlib
+import pathlib
+import shutil
+import subprocess
+
+__all__ = ["MpyCompiler", "MPY_CROSS"]
+
+MPY_CACHE_DIR = pathlib.Path("~/.cache/project_helper/mpy")
+MPY_CROSS = "mpy"
+
+
+def _compile(mpy_cross: str, source: pathlib.Path, output: pathlib.Path) -> str:
+    """Compile a source file with mpy-cross.
+
+    Parameters
+    ----------
+    mpy_cross : str
+        The mpy-cross executable.
+    source : pathlib.Path
+        The Python file to compile.
+    output : pathlib.Path
+        The compiled file to create.
+
+    Returns
+    -------
+    str
+        The compiler error output, empty on success.
+    """
+    # Run next to the source so only the file name is embedded in the .mpy.
+    temp_output = output.with_suffix(".tmp")
+    result = subprocess.run(
+        [mpy_cross, source.name, "-o", str(temp_output)],
+        cwd=source.parent,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        temp_output.unlink(missing_ok=True)
+        return result.stderr or result.stdout
+    temp_output.replace(output)
+    return ""
+
+
+class MpyCompiler:
+    def __init__(
+        self,
+        mpy_cross: str = MPY_CROSS,
+        cache_dir: pathlib.Path | None = None,
+        max_workers: int | None = None,
+    ):
+        """Class constructor.
+
+        Parameters
+        ----------
+        mpy_cross : str, optional
+            The mpy-cross executable, by default the mpy link made by
+            get_circuitpython.
+        cache_dir : pathlib.Path | None, optional
+            Alternate directory for the compiled file cache, by default None.
+        max_workers : int | None, optional
+            The number of compiler processes, by default the CPU count.
+        """
+        self.mpy_cross = mpy_cross
+        if cache_dir is None:
+            cache_dir = MPY_CACHE_DIR
+        self.cache_dir = cache_dir.expanduser()
+        self.max_workers = max_workers
+        self._version: str | None = None
+
+    @property
+    def version(self) -> str:
+        """The version string reported by mpy-cross."""
+        if self._version is None:
+            result = subprocess.run(
+                [self.mpy_cross, "--version"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            self._version = result.stdout.strip()
+        return self._version
+
+    def _cache_file(self, source: pathlib.Path) -> pathlib.Path:
+        """Get the cache location for a compiled source file.
+
+        Parameters
+        ----------
+        source : pathlib.Path
+            The Python file to compile.
+
+        Returns
+        -------
+        pathlib.Path
+            The compiled file keyed by source content and compiler version.
+        """
+        digest = hashlib.sha256(self.version.encode())
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+        return self.cache_dir / f"{digest.hexdigest()}.mpy"
+
+    def compile(self, sources: list[pathlib.Path]) -> dict[pathlib.Path, pathlib.Path]:
+        """Compile source files, reusing cached results.
+
+        Parameters
+        ----------
+        sources : list[pathlib.Path]
+            The Python files to compile.
+
+        Returns
+        -------
+        dict[pathlib.Path, pathlib.Path]
+            Mapping of source file to compiled file in the cache.
+
+        Raises
+        ------
+        RuntimeError
+            If any of the files fail to compile.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        compiled = {source: self._cache_file(source) for source in sources}
+        needed = [source for source, output in compiled.items() if not output.exists()]
+
+        errors = []
+        if needed:
+            with concurrent.futures.ProcessPoolExecutor(self.max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _compile, self.mpy_cross, source, compiled[source]
+                    ): source
+                    for source in needed
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    error = future.result()
+                    if error:
+                        errors.append(f"{futures[future].name}: {error.strip()}")
+
+        print(f"Compiled {len(needed)} files, {len(sources) - len(needed)} cached.")
+        if errors:
+            raise RuntimeError("Compile failed:\n" + "\n".join(errors))
+        return compiled
+
+    def build(self, sources: list[pathlib.Path]) -> None:
+        """Compile source files next to the sources, like the module Makefile.
+
+        Parameters
+        ----------
+        sources : list[pathlib.Path]
+            The Python files to compile.
+        """
+        for source, output in self.compile(sources).items():
+            target = source.with_suffix(".mpy")
+            if not target.exists() or target.read_bytes() != output.read_bytes():
+                shutil.copy(output, target)
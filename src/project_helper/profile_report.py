@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import argparse
+import pathlib
+
+from .common_parser import make_parser
+from .project_handler import ProjectHandler
+
+__all__ = ["runner"]
+
+
+def main(opts: argparse.ArgumentParser) -> None:
+    ph = ProjectHandler(debug_dir=opts.debug_dir)
+    ph.get_profile_report(opts.report_file)
+
+
+def runner() -> None:
+    parser = make_parser()
+
+    parser.add_argument(
+        "report_file",
+        nargs="?",
+        type=pathlib.Path,
+        help="Profile report or serial log to use instead of the board report.",
+    )
+
+    args = parser.parse_args()
+
+    main(args)
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023-2025 Michael Reuter
 #
 # SPDX-License-Identifier: MIT
+import concurrent.futures
 import dataclasses
 import os
 import pathlib
@@ -9,9 +10,23 @@ import sys
 import tomllib
 import zipfile
 
-import requests
-
-__all__ = ["CopyOptions", "DownloadOptions", "MqttInformation", "ProjectHandler"]
+from .artifact_cache import DEFAULT_CACHE_SIZE, ArtifactCache
+from .board_manifest import MANIFEST_FILE, BoardManifest, SyncReport
+from .bundle_index import BUNDLE_INDEX_FILE, BundleIndex
+from .code_profiler import PROFILER_MODULE, REPORT_FILE, instrument, summarize
+from .dependency_resolver import LOCAL, DependencyResolver
+from .download_manager import DownloadJob, DownloadManager
+from .font_builder import SUBSET_SUFFIX, FontBuilder, derive_glyphs
+from .image_builder import ImageBuilder
+from .mpy_compiler import MpyCompiler
+
+__all__ = [
+    "BoardTarget",
+    "CopyOptions",
+    "DownloadOptions",
+    "MqttInformation",
+    "ProjectHandler",
+]
 
 CIRCUITPY_DIR = "CIRCUITPY"
 MPY_EXT = ".mpy"
@@ -21,6 +36,15 @@ BOOT_PY = "boot.py"
 TEMP_SETTINGS = "settings_temp.toml"
 WEB_DEV_SETTINGS = "settings_circuitpy_web.toml"
 BOOT_OUT_FILE = "boot_out.txt"
+PROFILED_CODE = "code_profiled_tmp.py"
+
+
+@dataclasses.dataclass
+class BoardTarget:
+    """A board to copy a project to."""
+
+    location: pathlib.Path
+    sensor_name: str | None = None
 
 
 @dataclasses.dataclass
@@ -40,6 +64,11 @@ class CopyOptions:
     settings: bool
     dependencies: bool
     media: bool
+    sync: bool = False
+    bundle_requirements: bool = False
+    compile: bool = False
+    profile: bool = False
+    jobs: int = 4
 
     @property
     def all(self):
@@ -53,6 +82,11 @@ class DownloadOptions:
     boards: bool
     cross_compiler: bool
     bundles: bool
+    jobs: int = 4
+    use_cache: bool = True
+    cache_dir: pathlib.Path | None = None
+    cache_size: int = DEFAULT_CACHE_SIZE
+    selective: bool = False
 
     @property
     def all(self):
@@ -95,21 +129,8 @@ class ProjectHandler:
         self.copy_options = copy_options
         self.mqtt_info = mqtt_info
         self.download_options = download_options
-
-    def _check_download(self, resp: requests.Response) -> bool:
-        """Ensure the download completed successfully.
-
-        Parameters
-        ----------
-        resp : requests.Response
-            The response from the requests.get
-
-        Returns
-        -------
-        bool
-            True if download was successful, False if not.
-        """
-        return resp.ok and resp.status_code == 200
+        self.bundle_indexes: dict[str, BundleIndex] = {}
+        self.compiled_modules: dict[str, pathlib.Path] = {}
 
     def _check_project_file(self) -> None:
         """Check to see if the project file is set.
@@ -122,65 +143,33 @@ class ProjectHandler:
         if self.project_file is None:
             raise RuntimeError("Please set the project file first.")
 
-    def _copy_file_or_directory(
-        self, module_type: str, module_name: str, use_project_info: bool = False
-    ) -> None:
-        """Copy a file or directory from a module.
+    def _compile_local_modules(self, names: list[str]) -> None:
+        """Compile local modules with mpy-cross for the copy plan.
 
         Parameters
         ----------
-        module_type : str
-            The key in the configuration describing the type of modules.
-        module_name : str
-            The module to get dependencies from.
-        use_project_info : bool, optional
-            Flag to use project info instead of module info, by default False.
+        names : list[str]
+            The local modules to compile.
         """
-        try:
-            if use_project_info:
-                dependencies = self.project_info[module_type][module_name]
-            else:
-                dependencies = self.module_info[module_type][module_name]
-            is_directory = self.module_info[module_name]["is_directory"]
-            module_path = self._get_module_location(module_name)
-            for dependency in dependencies:
-                if dependency not in is_directory:
-                    shutil.copy(
-                        module_path / (dependency + MPY_EXT), self.circuitboard_lib
-                    )
-                else:
-                    shutil.copytree(
-                        module_path / dependency,
-                        self.circuitboard_lib / dependency,
-                        dirs_exist_ok=True,
-                    )
-        except KeyError:
-            pass
-
-    def _copy_media(self) -> None:
-        """Copy media items to project location."""
-        media_types = ["fonts", "images"]
-        try:
-            for media_type in media_types:
-                media_dir = self.circuitboard_location / media_type
-                media_dir.mkdir(0o755, exist_ok=True)
-                input_media_dir = self.top_dir / media_type
-                for media in self.project_info["media"][media_type]:
-                    shutil.copy(input_media_dir / media, media_dir)
-        except KeyError:
-            pass
-
-    def _create_settings_file(self) -> pathlib.Path | None:
-        """Create settings file.
+        sources = [
+            self.local_modules / f"{name}.py"
+            for name in names
+            if (self.local_modules / f"{name}.py").exists()
+        ]
+        compiler = MpyCompiler()
+        for source, output in compiler.compile(sources).items():
+            self.compiled_modules[source.stem] = output
+
+    def _create_settings(self) -> dict[str, str] | None:
+        """Create settings for the project.
 
         Returns
         -------
-        pathlib.Path or None
-            The temporary settings file.
+        dict[str, str] or None
+            The combined settings.
         """
         if "settings" not in self.project_info:
             return None
-        temp_file = self.top_dir / "settings_tmp.toml"
         settings_dict = {}
         use_aio = False
         for setting in self.project_info["settings"]["general"]:
@@ -213,12 +202,154 @@ class ProjectHandler:
                 if "MEASUREMENT" in key:
                     settings_dict[key] = value.split("test")[-1]
 
-        with temp_file.open("w") as sofile:
-            for key, value in settings_dict.items():
-                line = f'{key}="{value}"' + os.linesep
-                sofile.write(line)
+        return settings_dict
+
+    def _deploy(
+        self,
+        board: BoardTarget,
+        copy_plan: dict[str, pathlib.Path],
+        settings: dict[str, str] | None,
+        index: int = 0,
+    ) -> SyncReport:
+        """Copy the planned files and board specific settings to a board.
+
+        Parameters
+        ----------
+        board : BoardTarget
+            The board to copy to.
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+        settings : dict[str, str] | None
+            The project settings, None to leave the board settings alone.
+        index : int, optional
+            Number making the temporary settings file unique, by default 0.
+
+        Returns
+        -------
+        SyncReport
+            The summary of files written and skipped.
+        """
+        temp_file = None
+        if settings is not None:
+            board_settings = dict(settings)
+            if board.sensor_name is not None:
+                board_settings["MQTT_SENSOR_NAME"] = board.sensor_name
+            temp_file = self.top_dir / f"settings_tmp_{index}.toml"
+            self._write_settings_file(board_settings, temp_file)
+            copy_plan = {SETTINGS_FILE: temp_file, **copy_plan}
+
+        try:
+            if self.copy_options.sync:
+                manifest = BoardManifest(board.location)
+                return manifest.sync(copy_plan)
+            return self._write_copy_plan(board.location, copy_plan)
+        finally:
+            if temp_file is not None:
+                temp_file.unlink()
+
+    def _deploy_all(
+        self,
+        boards: list[BoardTarget],
+        copy_plan: dict[str, pathlib.Path],
+        settings: dict[str, str] | None,
+    ) -> None:
+        """Copy the planned files to the boards, jobs of them at a time.
+
+        Parameters
+        ----------
+        boards : list[BoardTarget]
+            The boards to copy to.
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+        settings : dict[str, str] | None
+            The project settings, None to leave the board settings alone.
+        """
+        workers = min(len(boards), self.copy_options.jobs)
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            futures = {
+                executor.submit(self._deploy, board, copy_plan, settings, i): board
+                for i, board in enumerate(boards)
+            }
+            for done, future in enumerate(concurrent.futures.as_completed(futures)):
+                board = futures[future]
+                try:
+                    report = future.result()
+                except OSError as e:
+                    print(f"{board.location}: copy failed: {e}")
+                    continue
+                if len(boards) > 1:
+                    print(f"[{done + 1}/{len(boards)}] {board.location}: {report}")
+                else:
+                    print(report)
+
+    def _extract_bundle(
+        self, bdl: pathlib.Path, main_dir: pathlib.Path
+    ) -> pathlib.Path:
+        """Extract a library bundle and save an index of its contents.
+
+        Parameters
+        ----------
+        bdl : pathlib.Path
+            The bundle zip file.
+        main_dir : pathlib.Path
+            The directory to extract the bundle into.
+
+        Returns
+        -------
+        pathlib.Path
+            The extracted bundle directory.
+        """
+        uz_bld_dir = main_dir / bdl.stem
+        with zipfile.ZipFile(bdl) as zf:
+            bundle_index = BundleIndex.from_zip(zf)
+            if self.download_options.selective:
+                members = bundle_index.members(self._referenced_libraries())
+            else:
+                members = [info.filename for info in zf.infolist()]
 
-        return temp_file
+        # Create directories up front so the workers do not race on them.
+        for member in members:
+            (main_dir / member).parent.mkdir(parents=True, exist_ok=True)
+
+        def extract(chunk: list[str]) -> None:
+            with zipfile.ZipFile(bdl) as zf:
+                for member in chunk:
+                    zf.extract(member, main_dir)
+
+        workers = self.download_options.jobs
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            list(executor.map(extract, [members[i::workers] for i in range(workers)]))
+
+        bundle_index.save(uz_bld_dir / BUNDLE_INDEX_FILE)
+        print(f"Extracted {len(members)} files from {bdl.name}")
+        return uz_bld_dir
+
+    def _get_bundle_index(self, name: str) -> BundleIndex:
+        """Get the library index for adafruit or circuitpython library bundles.
+
+        The index is built from the extracted bundle and saved the first
+        time it is needed if get_circuitpython did not create it.
+
+        Parameters
+        ----------
+        name : str
+            Library bundle to get the index for.
+
+        Returns
+        -------
+        BundleIndex
+            The index of the bundle libraries.
+        """
+        if name not in self.bundle_indexes:
+            bundle_dir = self._get_module_location(name).parent
+            index_file = bundle_dir / BUNDLE_INDEX_FILE
+            if index_file.exists():
+                bundle_index = BundleIndex.load(index_file)
+            else:
+                bundle_index = BundleIndex.from_directory(bundle_dir.resolve())
+                bundle_index.save(index_file)
+            self.bundle_indexes[name] = bundle_index
+        return self.bundle_indexes[name]
 
     def _get_module_location(self, name: str) -> pathlib.Path:
         """Construct the path for adafruit or circuitpython library bundles.
@@ -237,29 +368,332 @@ class ProjectHandler:
         top_loc = pathlib.Path(dep_type["module_location"]).expanduser()
         return top_loc / dep_type["bundle"] / "lib"
 
-    def _save_downloaded_file(
-        self, content: bytes, save_dir: pathlib.Path, save_file: str
+    def _plan_copy(self) -> dict[str, pathlib.Path]:
+        """Resolve the project configuration into the files to copy.
+
+        Returns
+        -------
+        dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+
+        Raises
+        ------
+        RuntimeError
+            If any of the project's modules cannot be found.
+        """
+        copy_plan: dict[str, pathlib.Path] = {}
+
+        dependency_plan: dict[str, pathlib.Path] = {}
+        if self.copy_options.dependencies or self.copy_options.all:
+            resolver = DependencyResolver(
+                self.modules_info,
+                self.project_file,
+                use_bundle_requirements=self.copy_options.bundle_requirements,
+            )
+            closure = resolver.resolve()
+            if self.copy_options.compile:
+                self._compile_local_modules(
+                    [name for module_type, name in closure if module_type == LOCAL]
+                )
+            missing = []
+            for module_type, module_name in closure:
+                problem = self._plan_module(dependency_plan, module_type, module_name)
+                if problem is not None:
+                    missing.append(problem)
+            if missing:
+                raise RuntimeError(
+                    "Cannot copy project, missing modules:"
+                    + os.linesep
+                    + os.linesep.join(missing)
+                )
+
+        if self.copy_options.code or self.copy_options.all:
+            project_dir = self.project_file.parent
+            code_file = project_dir / self.project_info["code"]
+            if self.copy_options.profile:
+                code_file = self._profile_code(code_file, copy_plan)
+            copy_plan[CODE_FILE] = code_file
+
+        copy_plan.update(dependency_plan)
+
+        if self.copy_options.media or self.copy_options.all:
+            self._plan_media(copy_plan)
+
+        return copy_plan
+
+    def _plan_media(self, copy_plan: dict[str, pathlib.Path]) -> None:
+        """Add media items to the copy plan.
+
+        Parameters
+        ----------
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+        """
+        media_types = ["fonts", "images"]
+        try:
+            for media_type in media_types:
+                input_media_dir = self.top_dir / media_type
+                for media in self.project_info["media"][media_type]:
+                    self._plan_path(copy_plan, input_media_dir / media, media_type)
+        except KeyError:
+            pass
+        self._plan_subset_fonts(copy_plan)
+        if self.project_info.get("media", {}).get("optimize_images", False):
+            self._plan_optimized_images(copy_plan)
+
+    def _plan_module(
+        self, copy_plan: dict[str, pathlib.Path], module_type: str, module_name: str
+    ) -> str | None:
+        """Add a local module or bundle library to the copy plan.
+
+        Parameters
+        ----------
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+        module_type : str
+            The bundle containing the module or local for project modules.
+        module_name : str
+            The module to add.
+
+        Returns
+        -------
+        str | None
+            Description of why the module is missing, None if it was added.
+        """
+        if module_type == LOCAL:
+            module_path = self.compiled_modules.get(
+                module_name, self.local_modules / (module_name + MPY_EXT)
+            )
+            board_name = module_name + MPY_EXT
+            if not module_path.exists():
+                return f"{module_name}: local module not compiled"
+        else:
+            entry = self._get_bundle_index(module_type).lookup(module_name)
+            if entry is None:
+                return f"{module_name}: not in the {module_type} bundle"
+            module_path = self._get_module_location(module_type) / module_name
+            if not entry["package"]:
+                module_path = module_path.with_name(module_name + MPY_EXT)
+            if not module_path.exists():
+                return f"{module_name}: not extracted from the {module_type} bundle"
+            board_name = module_path.name
+        self._plan_path(copy_plan, module_path, "lib", board_name)
+        return None
+
+    def _plan_optimized_images(self, copy_plan: dict[str, pathlib.Path]) -> None:
+        """Replace the images in the copy plan with indexed BMPs.
+
+        Each image becomes a palette BMP with the fewest bits per pixel,
+        resized to its entry in the media image_sizes table. When the media
+        sprite_sheet is set, the images are instead put side by side in that
+        one file, in the order of the images list and all at sprite_size or
+        the size of the first image.
+
+        Parameters
+        ----------
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+        """
+        media_info = self.project_info["media"]
+        try:
+            builder = ImageBuilder()
+        except RuntimeError as e:
+            print(f"Copying images as they are. {e}")
+            return
+
+        images = {
+            board_path: source
+            for board_path, source in copy_plan.items()
+            if board_path.startswith("images/") and source.is_file()
+        }
+        if "sprite_sheet" in media_info:
+            size = media_info.get("sprite_size")
+            job = (tuple(images.values()), tuple(size) if size else None)
+            for board_path in images:
+                del copy_plan[board_path]
+            built = builder.build([job])
+            copy_plan[f"images/{media_info['sprite_sheet']}"] = built[job]
+            return
+
+        sizes = media_info.get("image_sizes", {})
+        jobs = {}
+        for board_path, source in images.items():
+            size = sizes.get(source.name)
+            jobs[board_path] = (
+                (source,),
+                tuple(size) if size else None,
+            )
+        built = builder.build(list(jobs.values()))
+        for board_path, job in jobs.items():
+            copy_plan[board_path] = built[job]
+
+    def _plan_path(
+        self,
+        copy_plan: dict[str, pathlib.Path],
+        source: pathlib.Path,
+        board_dir: str,
+        board_name: str | None = None,
+    ) -> None:
+        """Add a file or a directory tree to the copy plan.
+
+        Parameters
+        ----------
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+        source : pathlib.Path
+            The file or directory to copy.
+        board_dir : str
+            The board relative directory to copy into.
+        board_name : str | None, optional
+            Name to use on the board instead of the source name, by default None.
+        """
+        if board_name is None:
+            board_name = source.name
+        board_path = pathlib.PurePosixPath(board_dir) / board_name
+        if source.is_dir():
+            for child in sorted(source.rglob("*")):
+                if child.is_file():
+                    relative = child.relative_to(source).as_posix()
+                    copy_plan[str(board_path / relative)] = child
+        else:
+            copy_plan[str(board_path)] = source
+
+    def _plan_subset_fonts(self, copy_plan: dict[str, pathlib.Path]) -> None:
+        """Build the subset fonts in the copy plan that are not in the fonts
+        directory.
+
+        A font listed as <name>-subset.bdf or <name>-subset.pcf is built from
+        <name>.bdf with the glyphs the project code can draw plus the media
+        glyphs entry of the project configuration.
+
+        Parameters
+        ----------
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+        """
+        wanted = {
+            board_path: source
+            for board_path, source in copy_plan.items()
+            if board_path.startswith("fonts/")
+            and not source.exists()
+            and source.stem.endswith(SUBSET_SUFFIX)
+        }
+        if not wanted:
+            return
+
+        code_file = self.project_file.parent / self.project_info["code"]
+        glyphs = derive_glyphs(
+            [code_file], self.project_info["media"].get("glyphs", "")
+        )
+        jobs = {
+            board_path: (
+                source.with_name(source.stem.removesuffix(SUBSET_SUFFIX) + ".bdf"),
+                glyphs,
+                source.suffix,
+            )
+            for board_path, source in wanted.items()
+        }
+        built = FontBuilder().build(list(jobs.values()))
+        for board_path, job in jobs.items():
+            copy_plan[board_path] = built[job]
+
+    def _profile_code(
+        self, code_file: pathlib.Path, copy_plan: dict[str, pathlib.Path]
     ) -> pathlib.Path:
-        """Save the file to the specified directory.
+        """Create a profiling version of the project code.
 
         Parameters
         ----------
-        content
-            The file content.
-        save_dir : pathlib.Path
-            The directory to save the file to.
-        save_file : str
-            The file to save.
+        code_file : pathlib.Path
+            The project code.
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files. The profiler
+            module is added to it.
 
         Returns
         -------
         pathlib.Path
-            Fully qualified save path.
+            The temporary instrumented code file.
+
+        Raises
+        ------
+        RuntimeError
+            If the profiler module cannot be found.
+        """
+        if self.copy_options.compile:
+            self._compile_local_modules([PROFILER_MODULE])
+        problem = self._plan_module(copy_plan, LOCAL, PROFILER_MODULE)
+        if problem is not None:
+            raise RuntimeError(f"Cannot profile project, {problem}")
+        profiled_code = self.top_dir / PROFILED_CODE
+        profiled_code.write_text(instrument(code_file.read_text()))
+        return profiled_code
+
+    def _referenced_libraries(self) -> set[str]:
+        """Collect the bundle libraries used by any project.
+
+        Returns
+        -------
+        set[str]
+            The library names from the project and module configurations.
         """
-        fq_save = save_dir / save_file
-        with fq_save.open("wb") as sfile:
-            sfile.write(content)
-        return fq_save
+        with self.modules_info.open("rb") as mfile:
+            module_info = tomllib.load(mfile)
+
+        bundles = [name for name, info in module_info.items() if "bundle" in info]
+        libraries = set()
+        for section in module_info.values():
+            for bundle in bundles:
+                libraries.update(section.get(bundle, []))
+        for project_file in sorted(self.top_dir.glob("projects/*/config*.toml")):
+            resolver = DependencyResolver(self.modules_info, project_file)
+            libraries.update(
+                name for module_type, name in resolver.resolve() if module_type != LOCAL
+            )
+        return libraries
+
+    def _write_copy_plan(
+        self, board_location: pathlib.Path, copy_plan: dict[str, pathlib.Path]
+    ) -> SyncReport:
+        """Copy every file in the copy plan to the board.
+
+        Parameters
+        ----------
+        board_location : pathlib.Path
+            The top-level directory of the board.
+        copy_plan : dict[str, pathlib.Path]
+            Mapping of board relative paths to source files.
+
+        Returns
+        -------
+        SyncReport
+            The summary of files written.
+        """
+        report = SyncReport()
+        for destination, source in copy_plan.items():
+            board_file = board_location / destination
+            board_file.parent.mkdir(0o755, parents=True, exist_ok=True)
+            shutil.copy(source, board_file)
+            report.files_written += 1
+            report.bytes_written += source.stat().st_size
+        return report
+
+    def _write_settings_file(
+        self, settings: dict[str, str], settings_file: pathlib.Path
+    ) -> None:
+        """Write settings to a file.
+
+        Parameters
+        ----------
+        settings : dict[str, str]
+            The settings to write.
+        settings_file : pathlib.Path
+            The file to write the settings to.
+        """
+        with settings_file.open("w") as sofile:
+            for key, value in settings.items():
+                line = f'{key}="{value}"' + os.linesep
+                sofile.write(line)
 
     def clean_circuitpython_board(self) -> None:
         """Clean the currently mounted CircuitPython board."""
@@ -276,6 +710,9 @@ class ProjectHandler:
         code_file = self.circuitboard_location / CODE_FILE
         code_file.unlink()
 
+        manifest_file = self.circuitboard_location / MANIFEST_FILE
+        manifest_file.unlink(missing_ok=True)
+
         with code_file.open("w") as cofile:
             cofile.write('print("Hello World!")' + os.linesep)
 
@@ -284,8 +721,15 @@ class ProjectHandler:
         shutil.rmtree(self.circuitboard_location, ignore_errors=True)
         self.circuitboard_lib.mkdir(0o755, parents=True)
 
-    def copy_project(self) -> None:
-        """Copy project based on TOML configuration."""
+    def copy_project(self, boards: list[BoardTarget] | None = None) -> None:
+        """Copy project based on TOML configuration.
+
+        Parameters
+        ----------
+        boards : list[BoardTarget] | None, optional
+            The boards to copy to at the same time, by default None which
+            uses the board given to the constructor.
+        """
         self._check_project_file()
 
         with self.modules_info.open("rb") as mfile:
@@ -294,38 +738,31 @@ class ProjectHandler:
         with self.project_file.expanduser().open("rb") as ifile:
             self.project_info = tomllib.load(ifile)
 
-        if self.copy_options.settings or self.copy_options.all:
-            temp_settings_file = self._create_settings_file()
-            if temp_settings_file is not None:
-                shutil.copy(
-                    temp_settings_file,
-                    self.circuitboard_location / SETTINGS_FILE,
-                )
-                temp_settings_file.unlink()
-
-        if self.copy_options.code or self.copy_options.all:
-            project_dir = self.project_file.parent
-            shutil.copy(
-                project_dir / self.project_info["code"],
-                self.circuitboard_location / CODE_FILE,
-            )
+        if boards is None:
+            boards = [
+                BoardTarget(self.circuitboard_location, self.mqtt_info.sensor_name)
+            ]
 
-        if self.copy_options.dependencies or self.copy_options.all:
-            self._copy_file_or_directory("defaults", "adafruit")
+        copy_plan = self._plan_copy()
+        settings = None
+        if self.copy_options.settings or self.copy_options.all:
+            settings = self._create_settings()
 
-            if "local" in self.project_info["imports"]:
-                local_imports = self.project_info["imports"]["local"]
-                for local_import in local_imports:
-                    shutil.copy(
-                        self.local_modules / (local_import + MPY_EXT),
-                        self.circuitboard_lib,
-                    )
-                    self._copy_file_or_directory(local_import, "adafruit")
+        try:
+            self._deploy_all(boards, copy_plan, settings)
+        finally:
+            (self.top_dir / PROFILED_CODE).unlink(missing_ok=True)
 
-            self._copy_file_or_directory("imports", "adafruit", use_project_info=True)
+    def discover_boards(self) -> list[pathlib.Path]:
+        """Find every mounted CircuitPython board.
 
-        if self.copy_options.media or self.copy_options.all:
-            self._copy_media()
+        Returns
+        -------
+        list[pathlib.Path]
+            The top-level directories of the mounted boards.
+        """
+        media_dir = pathlib.Path("/media") / self.top_dir.parents[2].name
+        return sorted(media_dir.glob(f"{CIRCUITPY_DIR}*"))
 
     def get_board_info(self) -> None:
         """Get the circuitboard's UID and CircuitPython version."""
@@ -361,6 +798,7 @@ class ProjectHandler:
         base_url = circuitpython_info["storage_url"]
         locale = circuitpython_info["locale"]
 
+        board_jobs = []
         if (
             self.download_options.boards
             or self.download_options.version
@@ -369,14 +807,9 @@ class ProjectHandler:
             for board in circuitpython_info["boards"]:
                 bootloader = f"adafruit-circuitpython-{board}-{locale}-{version}.uf2"
                 url = f"{base_url}/bin/{board}/{locale}/{bootloader}"
-                response = requests.get(url)
-                if self._check_download(response):
-                    _ = self._save_downloaded_file(
-                        response.content, bootload_dir, bootloader
-                    )
-                else:
-                    print(f"{bootloader} download failed.")
+                board_jobs.append(DownloadJob(url, bootload_dir, bootloader))
 
+        bundle_jobs = []
         if self.download_options.bundles or self.download_options.all:
             for bundle in ["adafruit", "community"]:
                 if bundle == "adafruit":
@@ -387,25 +820,9 @@ class ProjectHandler:
                     f"{bundle_stem}-bundle-{bundle_version}-mpy-{bundle_date}.zip"
                 )
                 url = f"{base_url}/bundles/{bundle}/{bundle_file}"
-                response = requests.get(url)
-                if self._check_download(response):
-                    bdl = self._save_downloaded_file(
-                        response.content, main_dir, bundle_file
-                    )
-                    bdl_dir = bdl.stem
-                    uz_bld_dir = main_dir / bdl_dir
-                    zf = zipfile.ZipFile(bdl)
-                    zf.extractall(main_dir)
-                    zf.close()
-                    bdl.unlink()
-                    link_dir = uz_bld_dir.name.strip(f"-{bundle_date}")
-                    uz_link_dir = main_dir / link_dir
-                    if uz_link_dir.exists():
-                        uz_link_dir.unlink()
-                    uz_link_dir.symlink_to(uz_bld_dir)
-                else:
-                    print(f"{bundle_file} download failed.")
+                bundle_jobs.append(DownloadJob(url, main_dir, bundle_file))
 
+        cc_jobs = []
         if (
             self.download_options.cross_compiler
             or self.download_options.version
@@ -414,18 +831,57 @@ class ProjectHandler:
             cross_compiler = f"mpy-cross-linux-amd64-{version}.static"
             url = f"{base_url}/bin/mpy-cross/linux-amd64/{cross_compiler}"
             bin_dir = pathlib.Path("~/bin").expanduser()
-            response = requests.get(url)
-            if self._check_download(response):
-                cc = self._save_downloaded_file(
-                    response.content, bin_dir, cross_compiler
-                )
+            cc_jobs.append(DownloadJob(url, bin_dir, cross_compiler))
+
+        cache = None
+        if self.download_options.use_cache:
+            cache = ArtifactCache(
+                self.download_options.cache_dir, self.download_options.cache_size
+            )
+        downloader = DownloadManager(self.download_options.jobs, cache)
+        downloads = downloader.download_all(board_jobs + bundle_jobs + cc_jobs)
+
+        for job in board_jobs:
+            if downloads[job] is None:
+                print(f"{job.save_file} download failed.")
+
+        for job in bundle_jobs:
+            bdl = downloads[job]
+            if bdl is not None:
+                uz_bld_dir = self._extract_bundle(bdl, main_dir)
+                bdl.unlink()
+                link_dir = uz_bld_dir.name.strip(f"-{bundle_date}")
+                uz_link_dir = main_dir / link_dir
+                if uz_link_dir.exists():
+                    uz_link_dir.unlink()
+                uz_link_dir.symlink_to(uz_bld_dir)
+            else:
+                print(f"{job.save_file} download failed.")
+
+        for job in cc_jobs:
+            cc = downloads[job]
+            if cc is not None:
                 cc.chmod(0o755)
-                cc_link = bin_dir / "mpy"
+                cc_link = job.save_dir / "mpy"
                 if cc_link.exists():
                     cc_link.unlink()
                 cc_link.symlink_to(cc)
             else:
-                print(f"{cross_compiler} download failed.")
+                print(f"{job.save_file} download failed.")
+
+    def get_profile_report(self, report_file: pathlib.Path | None = None) -> None:
+        """Summarize the profile report from a profiled project.
+
+        Parameters
+        ----------
+        report_file : pathlib.Path | None, optional
+            The report or a serial log containing it, by default None which
+            reads the report from the board.
+        """
+        if report_file is None:
+            report_file = self.circuitboard_location / REPORT_FILE
+        for line in summarize(report_file.read_text().splitlines()):
+            print(line)
 
     def web_development(self, undo: bool) -> None:
         """Setup a board for web development mode.
@@ -0,0 +1,261 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import argparse
+import csv
+import datetime
+import importlib.util
+import math
+import pathlib
+import sys
+import timeit
+
+__all__ = ["runner"]
+
+SUN_MODULE = pathlib.Path("modules") / "sun_helper.py"
+SECONDS_PER_DAY = 86400
+TOLERANCE = 120  # seconds
+
+
+def _load_module(module_file: pathlib.Path):
+    """Load the board module on the host.
+
+    Parameters
+    ----------
+    module_file : pathlib.Path
+        The sun helper module source.
+
+    Returns
+    -------
+    module
+        The loaded module.
+    """
+    spec = importlib.util.spec_from_file_location(module_file.stem, module_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _noaa_times(
+    day: datetime.date, latitude: float, longitude: float, height: float
+) -> tuple[int | None, int | None]:
+    """Calculate sunrise and sunset with the NOAA solar calculator equations.
+
+    Parameters
+    ----------
+    day : datetime.date
+        The UTC date.
+    latitude : float
+        The latitude (degrees) of the location, north positive.
+    longitude : float
+        The longitude (degrees) of the location, east positive.
+    height : float
+        The height (metres) of the location above its horizon.
+
+    Returns
+    -------
+    tuple[int | None, int | None]
+        The UTC times (seconds) of sunrise and sunset, None when the sun does
+        not rise or set.
+    """
+    noon = datetime.datetime(day.year, day.month, day.day, 12, tzinfo=datetime.UTC)
+    transit = noon.timestamp() - longitude * 240
+    # Two passes so the sun is evaluated at its own transit.
+    for _ in range(2):
+        julian_day = transit / SECONDS_PER_DAY + 2440587.5
+        t = (julian_day - 2451545.0) / 36525
+        mean_longitude = (280.46646 + t * (36000.76983 + t * 0.0003032)) % 360
+        anomaly = 357.52911 + t * (35999.05029 - 0.0001537 * t)
+        eccentricity = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+        m = math.radians(anomaly)
+        center = (
+            math.sin(m) * (1.914602 - t * (0.004817 + 0.000014 * t))
+            + math.sin(2 * m) * (0.019993 - 0.000101 * t)
+            + math.sin(3 * m) * 0.000289
+        )
+        omega = math.radians(125.04 - 1934.136 * t)
+        apparent = math.radians(
+            mean_longitude + center - 0.00569 - 0.00478 * math.sin(omega)
+        )
+        mean_obliquity = (
+            23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+        )
+        obliquity = math.radians(mean_obliquity + 0.00256 * math.cos(omega))
+        declination = math.asin(math.sin(obliquity) * math.sin(apparent))
+
+        y = math.tan(obliquity / 2) ** 2
+        l0 = math.radians(mean_longitude)
+        equation_of_time = 4 * math.degrees(
+            y * math.sin(2 * l0)
+            - 2 * eccentricity * math.sin(m)
+            + 4 * eccentricity * y * math.sin(m) * math.cos(2 * l0)
+            - 0.5 * y * y * math.sin(4 * l0)
+            - 1.25 * eccentricity * eccentricity * math.sin(2 * m)
+        )
+        transit = noon.timestamp() - longitude * 240 - equation_of_time * 60
+
+    horizon = math.radians(-0.833 - 2.076 * math.sqrt(max(height, 0)) / 60)
+    phi = math.radians(latitude)
+    cos_hour_angle = (math.sin(horizon) - math.sin(phi) * math.sin(declination)) / (
+        math.cos(phi) * math.cos(declination)
+    )
+    if abs(cos_hour_angle) > 1:
+        return None, None
+    half_day = math.degrees(math.acos(cos_hour_angle)) * 240
+    return round(transit - half_day), round(transit + half_day)
+
+
+def _read_reference(
+    reference_file: pathlib.Path,
+) -> dict[datetime.date, tuple[str, str]]:
+    """Read published sunrise and sunset times.
+
+    Parameters
+    ----------
+    reference_file : pathlib.Path
+        CSV file with date, sunrise and sunset columns, the times in UTC as
+        HH:MM or HH:MM:SS.
+
+    Returns
+    -------
+    dict[datetime.date, tuple[str, str]]
+        The sunrise and sunset times for each date.
+    """
+    reference = {}
+    with reference_file.open(newline="") as rfile:
+        for row in csv.reader(rfile):
+            if not row or row[0].startswith("#") or row[0] == "date":
+                continue
+            reference[datetime.date.fromisoformat(row[0])] = (row[1], row[2])
+    return reference
+
+
+def _nearest(day: datetime.date, clock: str, estimate: int) -> int:
+    """Place a time of day on the day nearest an estimate.
+
+    Parameters
+    ----------
+    day : datetime.date
+        The UTC date of the time.
+    clock : str
+        The UTC time of day.
+    estimate : int
+        A UTC time (seconds) close to the wanted one.
+
+    Returns
+    -------
+    int
+        The UTC time (seconds).
+    """
+    t = datetime.time.fromisoformat(clock)
+    value = datetime.datetime.combine(day, t, tzinfo=datetime.UTC).timestamp()
+    value += round((estimate - value) / SECONDS_PER_DAY) * SECONDS_PER_DAY
+    return int(value)
+
+
+def main(opts: argparse.Namespace) -> None:
+    sun_helper = _load_module(opts.module)
+    sun = sun_helper.SunHelper(opts.latitude, opts.longitude, opts.height)
+
+    if opts.reference is not None:
+        reference = _read_reference(opts.reference)
+        days = sorted(reference)
+    else:
+        start = datetime.date(opts.year, 1, 1)
+        days = [
+            start + datetime.timedelta(days=i)
+            for i in range((datetime.date(opts.year + 1, 1, 1) - start).days)
+        ]
+
+    errors = {"sunrise": [], "sunset": []}
+    for day in days:
+        noon = datetime.datetime(day.year, day.month, day.day, 12, tzinfo=datetime.UTC)
+        computed = sun.sun_times(int(noon.timestamp()))
+        if opts.reference is not None:
+            expected = tuple(
+                None
+                if not clock or computed[i] is None
+                else _nearest(day, clock, computed[i])
+                for i, clock in enumerate(reference[day])
+            )
+        else:
+            expected = _noaa_times(day, opts.latitude, opts.longitude, opts.height)
+        for name, value, truth in zip(errors, computed, expected):
+            if (value is None) != (truth is None):
+                print(f"{day} {name}: computed {value}, expected {truth}")
+                errors[name].append(math.inf)
+            elif value is not None:
+                errors[name].append(abs(value - truth))
+
+    print(f"Compared {len(days)} days")
+    worst = 0
+    for name, values in errors.items():
+        if not values:
+            continue
+        worst = max(worst, max(values))
+        print(
+            f"{name}: mean {sum(values) / len(values):.1f} s, max {max(values):.0f} s"
+        )
+
+    timestamp = int(datetime.datetime(opts.year, 6, 1, tzinfo=datetime.UTC).timestamp())
+    per_call = (
+        timeit.timeit(lambda: sun.sun_times(timestamp), number=opts.repeat)
+        / opts.repeat
+    )
+    print(f"sun_times: {per_call * 1e6:.1f} us per day on this host")
+    per_call = (
+        timeit.timeit(
+            lambda: _noaa_times(
+                datetime.date(opts.year, 6, 1),
+                opts.latitude,
+                opts.longitude,
+                opts.height,
+            ),
+            number=opts.repeat,
+        )
+        / opts.repeat
+    )
+    print(f"reference: {per_call * 1e6:.1f} us per day on this host")
+
+    if worst > opts.tolerance:
+        sys.exit(f"Largest error {worst} s is over {opts.tolerance} s")
+
+
+def runner() -> None:
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("latitude", type=float, help="Latitude (degrees, north +).")
+    parser.add_argument("longitude", type=float, help="Longitude (degrees, east +).")
+    parser.add_argument(
+        "--height", type=float, default=0, help="Height (metres) above the horizon."
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=datetime.date.today().year,
+        help="Year to compare against the NOAA equations.",
+    )
+    parser.add_argument(
+        "--reference",
+        type=pathlib.Path,
+        help="CSV of date, sunrise and sunset (UTC) to compare against instead.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="Largest error (seconds) allowed.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10000, help="Calls to time for the benchmark."
+    )
+    parser.add_argument(
+        "--module",
+        type=pathlib.Path,
+        default=SUN_MODULE,
+        help="The sun helper module to check.",
+    )
+
+    args = parser.parse_args()
+
+    main(args)
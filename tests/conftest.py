@@ -0,0 +1,16 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import pathlib
+import sys
+import types
+
+# The board modules import CircuitPython only modules, give them host stand-ins.
+MODULES_DIR = pathlib.Path(__file__).parents[1] / "modules"
+sys.path.insert(0, str(MODULES_DIR))
+
+for name in ("alarm", "socketpool", "wifi"):
+    sys.modules.setdefault(name, types.ModuleType(name))
+sys.modules["alarm"].sleep_memory = bytearray(256)
+sys.modules["socketpool"].SocketPool = object
+sys.modules["wifi"].radio = types.SimpleNamespace(enabled=True, connected=False)
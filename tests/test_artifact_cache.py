@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import pathlib
+
+from project_helper.artifact_cache import MEGABYTE, ArtifactCache
+from project_helper.download_manager import DownloadJob, DownloadManager
+
+URL_A = "https://example.com/a.zip"
+URL_B = "https://example.com/b.zip"
+
+
+def _artifact(tmp_path: pathlib.Path, name: str, data: bytes) -> pathlib.Path:
+    artifact = tmp_path / name
+    artifact.write_bytes(data)
+    return artifact
+
+
+def test_store_and_fetch(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    cache.store(URL_A, _artifact(tmp_path, "a.zip", b"aaa"), {"ETag": '"1"'})
+
+    fetched = cache.fetch(URL_A, tmp_path / "out.zip")
+    assert fetched is not None
+    assert fetched.read_bytes() == b"aaa"
+    assert cache.conditional_headers(URL_A) == {"If-None-Match": '"1"'}
+    assert cache.fetch(URL_B, tmp_path / "none.zip") is None
+
+
+def test_shared_directory_keeps_both_entries(tmp_path):
+    first = ArtifactCache(tmp_path / "cache")
+    second = ArtifactCache(tmp_path / "cache")
+    first.store(URL_A, _artifact(tmp_path, "a.zip", b"aaa"), {})
+    second.store(URL_B, _artifact(tmp_path, "b.zip", b"bbb"), {})
+    first.fetch(URL_A, tmp_path / "out.zip")
+
+    third = ArtifactCache(tmp_path / "cache")
+    assert set(third.index) == {URL_A, URL_B}
+    assert second.conditional_headers(URL_A) == {}
+    assert second.fetch(URL_A, tmp_path / "a_again.zip") is not None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache", max_size=1)
+    cache.store(URL_A, _artifact(tmp_path, "a.zip", b"a" * MEGABYTE), {})
+    cache.store(URL_B, _artifact(tmp_path, "b.zip", b"b" * MEGABYTE), {})
+
+    assert list(cache.index) == [URL_B]
+    assert cache.fetch(URL_A, tmp_path / "out.zip") is None
+
+
+class _Response:
+    def __init__(self, status_code: int, data: bytes = b""):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = {"ETag": '"2"'}
+        self.data = data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def iter_content(self, chunk_size):
+        yield self.data
+
+
+def test_not_modified_without_cached_copy_downloads_again(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    cache.store(URL_A, _artifact(tmp_path, "a.zip", b"aaa"), {"ETag": '"1"'})
+    # Lose the stored artifact after the validators were sent.
+    for artifact in (tmp_path / "cache" / "objects").iterdir():
+        artifact.unlink()
+    cache.conditional_headers = lambda url: {"If-None-Match": '"1"'}
+
+    requests_made = []
+
+    def get(url, headers, **kwargs):
+        requests_made.append(headers)
+        if "If-None-Match" in headers:
+            return _Response(304)
+        return _Response(200, b"new")
+
+    manager = DownloadManager(cache=cache)
+    manager.session.get = get
+    save_dir = tmp_path / "downloads"
+    save_dir.mkdir()
+
+    saved = manager.download(DownloadJob(URL_A, save_dir, "a.zip"))
+    assert saved is not None
+    assert saved.read_bytes() == b"new"
+    assert requests_made == [{"If-None-Match": '"1"'}, {}]
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import argparse
+import zipfile
+
+import pytest
+
+from project_helper.bundle_index import BundleIndex
+from project_helper.common_parser import positive_int
+
+BUNDLE = "adafruit-circuitpython-bundle-9.x-mpy-20260101"
+FILES = {
+    f"{BUNDLE}/lib/adafruit_ntp.mpy": b"ntp",
+    f"{BUNDLE}/lib/adafruit_minimqtt/__init__.mpy": b"",
+    f"{BUNDLE}/lib/adafruit_minimqtt/adafruit_minimqtt.mpy": b"mqtt",
+    f"{BUNDLE}/requirements/adafruit_ntp/requirements.txt": b"",
+    f"{BUNDLE}/VERSIONS.txt": b"versions",
+}
+
+
+@pytest.fixture
+def bundle_zip(tmp_path):
+    bundle = tmp_path / f"{BUNDLE}.zip"
+    with zipfile.ZipFile(bundle, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in FILES.items():
+            zf.writestr(name, content)
+    return bundle
+
+
+def test_from_zip_reads_no_members(bundle_zip, monkeypatch):
+    def no_read(*args, **kwargs):
+        raise AssertionError("member decompressed")
+
+    with zipfile.ZipFile(bundle_zip) as zf:
+        monkeypatch.setattr(zf, "read", no_read)
+        monkeypatch.setattr(zf, "open", no_read)
+        index = BundleIndex.from_zip(zf)
+
+    ntp = index.lookup("adafruit_ntp")
+    assert not ntp["package"]
+    assert ntp["size"] == 3
+    assert index.lookup("adafruit_minimqtt")["package"]
+    assert index.lookup("adafruit_io") is None
+    assert index.members({"adafruit_ntp", "adafruit_io"}) == [
+        f"{BUNDLE}/VERSIONS.txt",
+        f"{BUNDLE}/lib/adafruit_ntp.mpy",
+        f"{BUNDLE}/requirements/adafruit_ntp/requirements.txt",
+    ]
+
+
+def test_zip_and_directory_agree(bundle_zip, tmp_path):
+    with zipfile.ZipFile(bundle_zip) as zf:
+        zip_index = BundleIndex.from_zip(zf)
+        zf.extractall(tmp_path)
+    dir_index = BundleIndex.from_directory(tmp_path / BUNDLE)
+
+    for name in ("adafruit_ntp", "adafruit_minimqtt"):
+        assert zip_index.lookup(name)["sha256"] == dir_index.lookup(name)["sha256"]
+        assert zip_index.lookup(name)["size"] == dir_index.lookup(name)["size"]
+
+
+def test_save_and_load(bundle_zip, tmp_path):
+    with zipfile.ZipFile(bundle_zip) as zf:
+        index = BundleIndex.from_zip(zf)
+    index.save(tmp_path / "index.json")
+    loaded = BundleIndex.load(tmp_path / "index.json")
+    assert loaded.libraries == index.libraries
+    assert loaded.extras == index.extras
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "two"])
+def test_jobs_below_one_rejected(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)
+
+
+def test_jobs_accepted():
+    assert positive_int("3") == 3
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import argparse
+import concurrent.futures
+import pathlib
+
+import pytest
+
+from project_helper import copy_project
+from project_helper.project_handler import BoardTarget, CopyOptions, ProjectHandler
+
+
+def _options(**kwargs) -> argparse.Namespace:
+    values = dict(
+        project_file=pathlib.Path("project.toml"),
+        code=False,
+        settings=False,
+        dependencies=False,
+        media=False,
+        sync=False,
+        bundle_requirements=False,
+        compile=False,
+        profile=False,
+        jobs=4,
+        mqtt_sensor_name=None,
+        mqtt_no_test=False,
+        adafruitio_group=None,
+        debug_dir=None,
+        board=None,
+        all_boards=False,
+    )
+    values.update(kwargs)
+    return argparse.Namespace(**values)
+
+
+def test_all_boards_without_boards_fails(monkeypatch, tmp_path):
+    monkeypatch.setattr(ProjectHandler, "discover_boards", lambda self: [])
+    copied = []
+    monkeypatch.setattr(ProjectHandler, "copy_project", copied.append)
+
+    with pytest.raises(RuntimeError, match="No mounted"):
+        copy_project.main(_options(debug_dir=[tmp_path], all_boards=True))
+    assert copied == []
+
+
+def test_deploy_all_bounds_workers(monkeypatch, tmp_path):
+    workers = []
+    executor = concurrent.futures.ThreadPoolExecutor
+
+    def bounded(max_workers):
+        workers.append(max_workers)
+        return executor(max_workers)
+
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", bounded)
+    monkeypatch.setattr(ProjectHandler, "_deploy", lambda self, *args: "copied")
+    options = CopyOptions(False, False, False, False, jobs=2)
+    ph = ProjectHandler(copy_options=options, debug_dir=tmp_path)
+    boards = [BoardTarget(pathlib.Path(f"/media/CIRCUITPY{i}"), None) for i in range(5)]
+
+    ph._deploy_all(boards, {}, None)
+    assert workers == [2]
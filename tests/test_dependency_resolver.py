@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import pathlib
+
+import pytest
+
+from project_helper.dependency_resolver import LOCAL, DependencyResolver
+
+MODULES = """
+[adafruit]
+module_location = "{location}"
+bundle = "bundle"
+
+[defaults]
+adafruit = ["adafruit_ticks"]
+
+[mqtt_helper]
+local = ["line_protocol", "retry_helper"]
+adafruit = ["adafruit_minimqtt"]
+
+[wake_timer]
+local = ["line_protocol"]
+"""
+
+PROJECT = """
+code = "code.py"
+
+[imports]
+local = ["mqtt_helper", "wake_timer"]
+"""
+
+
+def _resolver(
+    tmp_path: pathlib.Path, modules: str = MODULES, **kwargs
+) -> DependencyResolver:
+    modules_file = tmp_path / "modules.toml"
+    modules_file.write_text(modules.format(location=tmp_path))
+    project_file = tmp_path / "config.toml"
+    project_file.write_text(PROJECT)
+    return DependencyResolver(
+        modules_file, project_file, cache_dir=tmp_path / "cache", **kwargs
+    )
+
+
+def test_dependencies_come_first_once(tmp_path):
+    closure = _resolver(tmp_path).resolve()
+
+    assert sorted(closure) == sorted(
+        [
+            ("adafruit", "adafruit_ticks"),
+            ("adafruit", "adafruit_minimqtt"),
+            (LOCAL, "line_protocol"),
+            (LOCAL, "retry_helper"),
+            (LOCAL, "mqtt_helper"),
+            (LOCAL, "wake_timer"),
+        ]
+    )
+    assert closure.index((LOCAL, "line_protocol")) < closure.index(
+        (LOCAL, "mqtt_helper")
+    )
+    assert closure.index((LOCAL, "line_protocol")) < closure.index(
+        (LOCAL, "wake_timer")
+    )
+
+
+def test_cache_follows_configuration(tmp_path):
+    resolver = _resolver(tmp_path)
+    first = resolver.resolve()
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+    assert _resolver(tmp_path).resolve() == first
+
+    changed = MODULES.replace('local = ["line_protocol"]', 'local = ["power_helper"]')
+    closure = _resolver(tmp_path, changed).resolve()
+    assert (LOCAL, "power_helper") in closure
+
+
+def test_cycle_is_reported(tmp_path):
+    modules = MODULES + '\n[line_protocol]\nlocal = ["wake_timer"]\n'
+
+    with pytest.raises(RuntimeError, match="cycle"):
+        _resolver(tmp_path, modules).resolve()
+
+
+def test_bundle_requirements(tmp_path):
+    bundle_dir = tmp_path / "bundle"
+    (bundle_dir / "lib").mkdir(parents=True)
+    (bundle_dir / "lib" / "adafruit_connection_manager.mpy").touch()
+    requirements = bundle_dir / "requirements" / "adafruit_minimqtt"
+    requirements.mkdir(parents=True)
+    (requirements / "requirements.txt").write_text(
+        "Adafruit-Blinka\nadafruit-circuitpython-connectionmanager>=1.0\n"
+        "adafruit-circuitpython-connection-manager  # the library\n"
+    )
+
+    closure = _resolver(tmp_path, use_bundle_requirements=True).resolve()
+    assert ("adafruit", "adafruit_connection_manager") in closure
+    assert closure.index(("adafruit", "adafruit_connection_manager")) < (
+        closure.index(("adafruit", "adafruit_minimqtt"))
+    )
+
+    closure = _resolver(tmp_path).resolve()
+    assert ("adafruit", "adafruit_connection_manager") not in closure
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+from line_protocol import Fields, LineEncoder
+
+
+def _line(encoder: LineEncoder, measurements_and_tags: list[str], **values) -> bytes:
+    encoder.write_line(measurements_and_tags, Fields(**values), b"1")
+    return bytes(encoder.payload())
+
+
+def test_escaping():
+    encoder = LineEncoder()
+    line = _line(
+        encoder,
+        ["my room,east", "site=back yard", "k,1=v=2"],
+        **{"a b": 'say "hi" \\ now'},
+    )
+    assert line == (
+        b"my\\ room\\,east,site=back\\ yard,k\\,1=v\\=2 "
+        b'a\\ b="say \\"hi\\" \\\\ now" 1'
+    )
+
+
+@pytest.mark.parametrize(
+    "integers, value, expected",
+    [
+        (False, 3, b"v=3"),
+        (True, 3, b"v=3i"),
+        (False, 2.5, b"v=2.5"),
+        (False, True, b"v=true"),
+        (True, False, b"v=false"),
+    ],
+)
+def test_number_formatting(integers, value, expected):
+    encoder = LineEncoder(integers=integers)
+    assert _line(encoder, ["m"], v=value) == b"m " + expected + b" 1"
+
+
+def test_missing_values_left_out():
+    encoder = LineEncoder(["sensor_id=s1"])
+    encoder.write_line(["m"], Fields(a=None, b=float("nan")), b"1")
+    assert len(encoder) == 0
+    assert _line(encoder, ["m"], a=None, b=float("inf"), c=1.0) == (
+        b"m,sensor_id=s1 c=1.0 1"
+    )
+
+
+def test_lines_joined_and_buffer_grows():
+    encoder = LineEncoder(size=8)
+    encoder.write_line(["m"], Fields(a=1), b"1")
+    encoder.write_line(["m"], Fields(a=2), b"2")
+    assert bytes(encoder.payload()) == b"m a=1 1\nm a=2 2"
+    assert len(encoder.buffer) >= len(encoder)
+
+
+def test_payload_is_a_view_until_reset():
+    encoder = LineEncoder()
+    encoder.write_line(["m"], Fields(a=1), b"1")
+    payload = encoder.payload()
+    assert isinstance(payload, memoryview)
+    kept = bytes(payload)
+    encoder.reset()
+    encoder.write_line(["n"], Fields(b=2), b"2")
+    assert kept == b"m a=1 1"
+    assert bytes(encoder.payload()) == b"n b=2 2"
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+from reading_queue import HEADER_SIZE, TIME_IN_NS, ReadingQueue
+
+START = 1800000000
+MEASUREMENTS = [(["battery"], ("percent", "voltage")), (["light"], ("lux",))]
+
+
+def _queue(memory: bytearray, offset: int = 0) -> ReadingQueue:
+    return ReadingQueue(MEASUREMENTS, memory=memory, offset=offset)
+
+
+def _timestamps(queue: ReadingQueue, limit: int | None = None) -> list[int]:
+    return [timestamp // TIME_IN_NS for _, _, timestamp in queue.readings(limit)]
+
+
+def test_ring_wraps_and_keeps_newest():
+    memory = bytearray(HEADER_SIZE + 3 * 13)
+    queue = _queue(memory)
+    assert queue.capacity == 3
+    for i in range(5):
+        queue.push(1, (i,), START + i)
+
+    assert len(queue) == 3
+    assert _timestamps(queue) == [START + 2, START + 3, START + 4]
+    assert _timestamps(_queue(memory)) == [START + 2, START + 3, START + 4]
+
+
+def test_values_and_missing_fields():
+    queue = _queue(bytearray(128))
+    queue.push(0, (50.0, None), START)
+    queue.push(1, (12.5,), START + 1)
+
+    readings = list(queue.readings())
+    assert readings[0][:2] == (["battery"], {"percent": 50.0, "voltage": None})
+    assert readings[1][:2] == (["light"], {"lux": 12.5})
+
+
+def test_limit_and_drop_across_the_wrap():
+    queue = _queue(bytearray(HEADER_SIZE + 4 * 13))
+    for i in range(6):
+        queue.push(1, (i,), START + i)
+
+    assert _timestamps(queue, 3) == [START + 2, START + 3, START + 4]
+    queue.drop(3)
+    assert _timestamps(queue) == [START + 5]
+    queue.drop(5)
+    assert len(queue) == 0
+    queue.push(1, (6,), START + 6)
+    assert _timestamps(queue) == [START + 6]
+
+
+def test_unset_clock_not_stored():
+    queue = _queue(bytearray(128))
+    queue.push(1, (1,), 1000)
+    assert len(queue) == 0
+
+
+def test_offset_leaves_earlier_memory_alone():
+    memory = bytearray(128)
+    memory[:32] = b"\xaa" * 32
+    queue = _queue(memory, offset=32)
+    queue.push(1, (1,), START)
+    assert memory[:32] == b"\xaa" * 32
+    assert _timestamps(_queue(memory, offset=32)) == [START]
+
+
+def test_transmit_due():
+    queue = _queue(bytearray(128))
+    assert [queue.transmit_due(3) for _ in range(4)] == [True, False, False, True]
+    assert all(queue.transmit_due(0) for _ in range(3))
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+import retry_helper
+from retry_helper import GIVE_UP, RESET, RETRY, RetryPolicy, backoff
+
+
+class Clock:
+    """A stand-in for the time module that sleeps instantly."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class Action:
+    """Fails with the given errors in turn, then works."""
+
+    def __init__(self, *errors: Exception) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self) -> None:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(retry_helper, "time", clock)
+    return clock
+
+
+def test_backoff_doubles_up_to_maximum():
+    assert [backoff(attempt, 1, 10, 0) for attempt in range(5)] == [1, 2, 4, 8, 10]
+    assert backoff(1000, 1, 10, 0) == 10
+    assert 1 <= backoff(1, 2, 10, 0.5) <= 4
+
+
+def test_retries_until_success(clock):
+    action = Action(OSError(), OSError())
+    policy = RetryPolicy(jitter=0)
+
+    assert policy.run("test", action, ((OSError, RETRY),))
+    assert action.calls == 3
+    assert clock.sleeps == [1, 2]
+
+
+def test_unhandled_error_gives_up(clock):
+    action = Action(ValueError(), OSError())
+    policy = RetryPolicy(jitter=0)
+
+    assert not policy.run("test", action, ((OSError, RETRY),))
+    assert action.calls == 1
+    assert not policy.run("test", Action(OSError()), ((OSError, GIVE_UP),))
+    assert clock.sleeps == []
+
+
+def test_max_tries(clock):
+    action = Action(*[OSError()] * 10)
+
+    assert not RetryPolicy(max_tries=3, jitter=0).run(
+        "test", action, ((OSError, RETRY),)
+    )
+    assert action.calls == 3
+
+    action = Action()
+    assert not RetryPolicy(max_tries=0).run("test", action)
+    assert action.calls == 0
+
+
+def test_deadline_stops_retries(clock):
+    action = Action(*[OSError()] * 10)
+    policy = RetryPolicy(max_tries=10, jitter=0)
+
+    assert not policy.run("test", action, ((OSError, RETRY),), deadline=5)
+    # Waits of 1 and 2 fit in 5 seconds, the next wait of 4 does not.
+    assert action.calls == 3
+    assert clock.sleeps == [1, 2]
+
+
+def test_budget_is_shared_by_phases(clock):
+    policy = RetryPolicy(budget=10, max_tries=10, jitter=0)
+
+    assert policy.run("first", Action(OSError(), OSError()), ((OSError, RETRY),))
+    assert policy.remaining() == 7
+    action = Action(*[OSError()] * 10)
+    assert not policy.run("second", action, ((OSError, RETRY),))
+    # Waits of 1, 2 and 4 use the last 7 seconds.
+    assert action.calls == 4
+    assert policy.remaining() == 0
+
+
+def test_reset_before_retry(clock):
+    resets = []
+    action = Action(RuntimeError(), OSError())
+    handlers = ((RuntimeError, RESET), (OSError, RETRY))
+
+    assert RetryPolicy(jitter=0).run(
+        "test", action, handlers, reset=lambda: resets.append(action.calls)
+    )
+    assert resets == [1]
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+from schedule_cache import SECONDS_PER_DAY, ScheduleCache
+from sun_helper import SunHelper
+
+LATITUDE = 42.9
+LONGITUDE = -71.4
+OFF_TIME = 23 * 3600  # 23:00 local
+UTC_OFFSET = -4 * 3600
+MIDNIGHT = 1780286400  # 2026-06-01 00:00 local as UTC
+NOON = MIDNIGHT + 12 * 3600
+CHECK_DELAY = SECONDS_PER_DAY + 12 * 3600  # noon the next day
+
+
+def _service_info() -> dict:
+    _, sunset = SunHelper(LATITUDE, LONGITUDE).sun_times(NOON + UTC_OFFSET)
+    return {
+        "on_time_utc": sunset,
+        "off_time_utc": MIDNIGHT + OFF_TIME,
+        "check_time_utc": MIDNIGHT + CHECK_DELAY,
+        "date": "2026-06-01",
+        "sunrise_usno": "05:07",
+        "sunset_usno": "20:17",
+        "on_time": "20:17",
+        "off_time": "23:00",
+        "extra": "dropped",
+    }
+
+
+@pytest.fixture
+def memory():
+    return bytearray(1024)
+
+
+def _cache(memory: bytearray) -> ScheduleCache:
+    return ScheduleCache(LATITUDE, LONGITUDE, OFF_TIME, memory=memory)
+
+
+def test_store_follows_the_local_off_time(memory):
+    cache = _cache(memory)
+    info = _service_info()
+    first = cache.store(info, 3)
+
+    assert "extra" not in first
+    assert cache.utc_offset == UTC_OFFSET
+    assert len(cache.days) == 3
+    for day, schedule in enumerate(cache.days):
+        assert (schedule["off_time_utc"] + UTC_OFFSET) % SECONDS_PER_DAY == OFF_TIME
+        assert schedule["off_time_utc"] == info["off_time_utc"] + day * SECONDS_PER_DAY
+        assert schedule["check_time_utc"] == (
+            info["check_time_utc"] + day * SECONDS_PER_DAY
+        )
+        shift = day * SECONDS_PER_DAY
+        _, sunset = SunHelper(LATITUDE, LONGITUDE).sun_times(NOON + UTC_OFFSET + shift)
+        assert schedule["on_time_utc"] == sunset
+    assert [schedule["date"] for schedule in cache.days] == [
+        "2026-06-01",
+        "2026-06-02",
+        "2026-06-03",
+    ]
+
+
+def test_cache_survives_reload(memory):
+    _cache(memory).store(_service_info(), 3)
+    cache = _cache(memory)
+    assert len(cache.days) == 3
+    assert cache.utc_offset == UTC_OFFSET
+
+    first_check = cache.days[0]["check_time_utc"]
+    assert cache.current(first_check - 1) is cache.days[0]
+    assert cache.current(first_check) is cache.days[1]
+    assert cache.current(cache.days[-1]["check_time_utc"]) is None
+
+
+def test_incomplete_response_not_stored(memory):
+    cache = _cache(memory)
+    cache.store(_service_info(), 2)
+    info = _service_info()
+    del info["on_time_utc"]
+
+    assert cache.store(info, 2) is None
+    assert cache.store({"error": "bad request"}, 2) is None
+    assert cache.store(["not", "a", "schedule"], 2) is None
+    assert len(_cache(memory).days) == 2
+
+
+def test_no_sunset_keeps_one_day(memory):
+    cache = _cache(memory)
+    info = _service_info()
+    info["on_time_utc"] = None
+    info["off_time_utc"] = None
+
+    assert cache.store(info, 3) == {key: info[key] for key in info if key != "extra"}
+    assert len(cache.days) == 1
+
+
+def test_small_cache_drops_last_days(memory):
+    cache = ScheduleCache(LATITUDE, LONGITUDE, OFF_TIME, memory=memory, size=400)
+    cache.store(_service_info(), 5)
+    assert 1 <= len(cache.days) < 5
+    assert len(_cache(memory).days) == len(cache.days)
+
+
+def test_fallback_uses_sunset(memory):
+    cache = _cache(memory)
+    cache.utc_offset = UTC_OFFSET
+    info = cache.fallback(NOON, 3600)
+
+    assert info["check_time_utc"] == NOON + 3600
+    assert info["date"] == "2026-06-01"
+    assert (info["off_time_utc"] + UTC_OFFSET) % SECONDS_PER_DAY == OFF_TIME
+    assert info["on_time_utc"] < info["off_time_utc"]
@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 Michael Reuter
+#
+# SPDX-License-Identifier: MIT
+from wake_timer import PHASES, SLEEP_MEMORY_SIZE, WakeTimer
+
+OFFSET = 32
+
+
+def test_power_up_has_no_previous_wake():
+    timer = WakeTimer(bytearray(OFFSET + SLEEP_MEMORY_SIZE), OFFSET)
+
+    assert timer.last_wake() is None
+    assert all(value is None for value in timer.fields().values.values())
+
+
+def test_times_carry_to_next_wake():
+    memory = bytearray(OFFSET + SLEEP_MEMORY_SIZE)
+    timer = WakeTimer(memory, OFFSET)
+    timer.mark("wifi")
+    timer.mark("sensor")
+    timer.sleep()
+    assert memory[:OFFSET] == bytes(OFFSET)
+
+    next_wake = WakeTimer(memory, OFFSET)
+    values = next_wake.fields().values
+    assert set(values) == {f"{phase}_ms" for phase in PHASES}
+    assert values["wifi_ms"] is not None
+    assert values["publish_ms"] is None
+    assert next_wake.last_wake() == values["sleep_ms"]
+    assert values["wifi_ms"] <= values["sensor_ms"] <= values["sleep_ms"]